@@ -5,21 +5,27 @@
 """
 
 import sys
+import re
 import json
 import os
 import time
 from datetime import datetime
 from collections import deque
+from functools import partial
+import heapq
 import struct
 
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QGroupBox, QLabel, QComboBox, QPushButton,
-                             QTextEdit, QLineEdit, QCheckBox, QFileDialog, QSpinBox,
+                             QTextEdit, QPlainTextEdit, QLineEdit, QCheckBox, QFileDialog, QSpinBox,
                              QMessageBox, QGridLayout, QTabWidget, QScrollArea, QDialog,
                              QDialogButtonBox, QDoubleSpinBox, QSplitter, QDockWidget, QMenuBar, QMenu, QAction,
-                             QSizePolicy, QListWidget, QSplashScreen, QProgressBar)
-from PyQt5.QtCore import QTimer, QThread, pyqtSignal, Qt
-from PyQt5.QtGui import QFont, QTextCursor, QPixmap, QPainter, QColor, QLinearGradient
+                             QSizePolicy, QListWidget, QListView, QAbstractItemView, QSplashScreen, QProgressBar,
+                             QFormLayout)
+from PyQt5.QtCore import (QTimer, QThread, pyqtSignal, Qt, QRegularExpression, QRectF, QSize, QByteArray,
+                          QObject, QRunnable, QThreadPool, QSignalBlocker)
+from PyQt5.QtGui import (QFont, QTextCursor, QPixmap, QImage, QPainter, QColor, QLinearGradient,
+                         QRegularExpressionValidator, QStandardItemModel, QStandardItem, QKeySequence)
 
 import serial
 import serial.tools.list_ports
@@ -30,9 +36,162 @@ matplotlib.rcParams['font.sans-serif'] = ['Microsoft YaHei', 'SimHei', 'Arial Un
 matplotlib.rcParams['axes.unicode_minus'] = False
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 import pandas as pd
+import numpy as np
+
+# 可选: xlsxwriter流式写入Excel（constant_memory模式），未安装时使用pandas导出
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# 可选: orjson（C扩展）加速配置和布局文件的读写，未安装时使用标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj):
+    """序列化为带缩进的JSON（UTF-8字节），用于写入配置/布局文件"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    # 与orjson的OPT_INDENT_2输出逐字节一致，切换后端时内容比较不会误判为变化
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data):
+    """解析配置/布局文件内容（字节或字符串）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_file_atomic(path, content):
+    """先写临时文件再替换目标文件，避免写入中途退出导致文件损坏"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def _build_crc16_table(poly, reflected):
+    """生成CRC16查表法所需的256项表"""
+    table = []
+    for i in range(256):
+        if reflected:
+            crc = i
+            for _ in range(8):
+                crc = (crc >> 1) ^ poly if crc & 0x0001 else crc >> 1
+        else:
+            crc = i << 8
+            for _ in range(8):
+                crc = ((crc << 1) ^ poly) if crc & 0x8000 else (crc << 1)
+                crc &= 0xFFFF
+        table.append(crc)
+    return tuple(table)
+
+
+# CRC16查表(导入时生成一次)
+_CCITT_TABLE = _build_crc16_table(0x1021, reflected=False)
+_XMODEM_TABLE = _CCITT_TABLE  # 与CCITT同多项式，仅初始值不同
+_MODBUS_TABLE = _build_crc16_table(0xA001, reflected=True)
+
+# 可选: crcmod的C扩展可用时直接调用原生CRC16，未安装时使用上面的查表法
+try:
+    import crcmod
+    if not getattr(crcmod.crcmod, '_usingExtension', False):
+        raise ImportError('crcmod C扩展不可用')
+    _native_ccitt_crc16 = crcmod.mkCrcFun(0x11021, initCrc=0xFFFF, rev=False, xorOut=0x0000)
+    _native_modbus_crc16 = crcmod.mkCrcFun(0x18005, initCrc=0xFFFF, rev=True, xorOut=0x0000)
+    _native_xmodem_crc16 = crcmod.mkCrcFun(0x11021, initCrc=0x0000, rev=False, xorOut=0x0000)
+except ImportError:
+    _native_ccitt_crc16 = _native_modbus_crc16 = _native_xmodem_crc16 = None
+
+# 可选: 未安装crcmod时尝试用Numba即时编译CRC16位运算循环，编译结果缓存到磁盘
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _ccitt_nb(data):
+        crc = 0xFFFF
+        for i in range(data.shape[0]):
+            crc ^= data[i] << 8
+            for _ in range(8):
+                if crc & 0x8000:
+                    crc = ((crc << 1) ^ 0x1021) & 0xFFFF
+                else:
+                    crc = (crc << 1) & 0xFFFF
+        return crc
+
+    @njit(cache=True)
+    def _modbus_nb(data):
+        crc = 0xFFFF
+        for i in range(data.shape[0]):
+            crc ^= data[i]
+            for _ in range(8):
+                if crc & 0x0001:
+                    crc = (crc >> 1) ^ 0xA001
+                else:
+                    crc = crc >> 1
+        return crc
+
+    @njit(cache=True)
+    def _xmodem_nb(data):
+        crc = 0x0000
+        for i in range(data.shape[0]):
+            crc ^= data[i] << 8
+            for _ in range(8):
+                if crc & 0x8000:
+                    crc = ((crc << 1) ^ 0x1021) & 0xFFFF
+                else:
+                    crc = (crc << 1) & 0xFFFF
+        return crc
+
+    @njit(cache=True)
+    def _decode_fields_nb(buf, starts, ends, kinds, sizes, big_endian, bit_indices):
+        """逐字段解析一帧中的曲线原始值（kind: 0无符号 1有符号 2浮点 3位 -1无效），越界或无效字段为NaN"""
+        out = np.empty(starts.shape[0], dtype=np.float64)
+        u32 = np.empty(1, dtype=np.uint32)
+        u64 = np.empty(1, dtype=np.uint64)
+        for i in range(starts.shape[0]):
+            start = starts[i]
+            kind = kinds[i]
+            if kind < 0 or ends[i] > buf.shape[0]:
+                out[i] = np.nan
+                continue
+            if kind == 3:
+                out[i] = (buf[start] >> bit_indices[i]) & 1
+                continue
+            size = sizes[i]
+            value = np.uint64(0)
+            for k in range(size):
+                byte = buf[start + k] if big_endian[i] else buf[start + size - 1 - k]
+                value = (value << np.uint64(8)) | np.uint64(byte)
+            if kind == 0:
+                out[i] = value
+            elif kind == 1:
+                bits = 8 * size
+                if value >> np.uint64(bits - 1):
+                    out[i] = np.int64(value) - (np.int64(1) << bits)
+                else:
+                    out[i] = np.int64(value)
+            elif size == 4:
+                u32[0] = np.uint32(value)
+                out[i] = u32.view(np.float32)[0]
+            else:
+                u64[0] = value
+                out[i] = u64.view(np.float64)[0]
+        return out
+else:
+    _ccitt_nb = _modbus_nb = _xmodem_nb = _decode_fields_nb = None
+
+# 数据长度达到该值时累加和/异或校验改用NumPy归约，短帧直接用内置函数更快
+_NUMPY_CHECK_MIN_LEN = 64
 
 
 class CRCCalculator:
@@ -44,15 +203,14 @@ class CRCCalculator:
         多项式: 0x1021
         初始值: 0xFFFF
         """
+        if _native_ccitt_crc16 is not None:
+            return _native_ccitt_crc16(bytes(data))
+        if _ccitt_nb is not None:
+            return int(_ccitt_nb(np.frombuffer(data, dtype=np.uint8)))
         crc = 0xFFFF
+        table = _CCITT_TABLE
         for byte in data:
-            crc ^= (byte << 8)
-            for _ in range(8):
-                if crc & 0x8000:
-                    crc = (crc << 1) ^ 0x1021
-                else:
-                    crc = crc << 1
-                crc &= 0xFFFF
+            crc = ((crc << 8) & 0xFFFF) ^ table[((crc >> 8) ^ byte) & 0xFF]
         return crc
     
     @staticmethod
@@ -62,14 +220,14 @@ class CRCCalculator:
         初始值: 0xFFFF
         低字节在前
         """
+        if _native_modbus_crc16 is not None:
+            return _native_modbus_crc16(bytes(data))
+        if _modbus_nb is not None:
+            return int(_modbus_nb(np.frombuffer(data, dtype=np.uint8)))
         crc = 0xFFFF
+        table = _MODBUS_TABLE
         for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x0001:
-                    crc = (crc >> 1) ^ 0xA001
-                else:
-                    crc = crc >> 1
+            crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
         return crc
     
     @staticmethod
@@ -78,67 +236,180 @@ class CRCCalculator:
         多项式: 0x1021
         初始值: 0x0000
         """
+        if _native_xmodem_crc16 is not None:
+            return _native_xmodem_crc16(bytes(data))
+        if _xmodem_nb is not None:
+            return int(_xmodem_nb(np.frombuffer(data, dtype=np.uint8)))
         crc = 0x0000
+        table = _XMODEM_TABLE
         for byte in data:
-            crc ^= (byte << 8)
-            for _ in range(8):
-                if crc & 0x8000:
-                    crc = (crc << 1) ^ 0x1021
-                else:
-                    crc = crc << 1
-                crc &= 0xFFFF
+            crc = ((crc << 8) & 0xFFFF) ^ table[((crc >> 8) ^ byte) & 0xFF]
         return crc
     
     @staticmethod
     def calculate_sum_check(data):
         """计算累加和校验(取低8位)"""
+        if len(data) >= _NUMPY_CHECK_MIN_LEN:
+            return int(np.frombuffer(data, dtype=np.uint8).sum()) & 0xFF
         return sum(data) & 0xFF
     
     @staticmethod
     def calculate_xor_check(data):
         """计算异或校验"""
+        if not data:
+            return 0
+        if len(data) >= _NUMPY_CHECK_MIN_LEN:
+            return int(np.bitwise_xor.reduce(np.frombuffer(data, dtype=np.uint8)))
         result = 0
         for byte in data:
             result ^= byte
         return result
 
 
+class RxFrameState:
+    """接收分帧状态：接收线程每次收到数据都会读写，用__slots__存放，避免实例字典查找"""
+    
+    __slots__ = ('interval_ms', 'last_time', 'start_time', 'buffer')
+    
+    def __init__(self, interval_ms=100):
+        self.interval_ms = interval_ms  # 帧间隔(ms)，默认100ms
+        self.last_time = None  # 上次接收数据时间(time.monotonic)
+        self.start_time = None  # 当前帧首字节的接收时间(time.time)
+        self.buffer = bytearray()  # 接收数据缓冲
+
+
 class SerialThread(QThread):
-    """串口接收线程"""
+    """串口接收线程：原始数据块通过data_received交给协议解析，
+    同时按帧间隔分帧，整帧通过frame_ready(帧数据, 首字节接收时间)送到GUI线程显示"""
     data_received = pyqtSignal(bytes)
+    frame_ready = pyqtSignal(bytes, float)
     connection_lost = pyqtSignal()
     
-    def __init__(self):
+    # 阻塞读取超时(秒)，无数据时线程在系统调用中等待而不是轮询；也是帧超时判断的最大延迟
+    READ_TIMEOUT = 0.05
+    
+    def __init__(self, frame_interval_ms=100):
         super().__init__()
         self.serial_port = None
         self.running = False
-        
+        self.rx_state = RxFrameState(frame_interval_ms)
+    
     def set_serial(self, serial_port):
         self.serial_port = serial_port
+        if serial_port is not None:
+            serial_port.timeout = self.READ_TIMEOUT
+    
+    def set_frame_interval(self, interval_ms):
+        self.rx_state.interval_ms = interval_ms
+    
+    def _flush_frame(self):
+        """发出缓冲区中累积的一帧，并就地清空缓冲区"""
+        state = self.rx_state
+        if state.buffer:
+            self.frame_ready.emit(bytes(state.buffer), state.start_time)
+            state.buffer.clear()
+        state.last_time = None
+    
+    def _split_frame(self, data):
+        """帧间隔处理：距上次收到数据超过帧间隔时先发出已缓冲的帧；data为空表示读取超时"""
+        state = self.rx_state
+        now = time.monotonic()
+        if state.last_time is not None and (now - state.last_time) * 1000 >= state.interval_ms:
+            self._flush_frame()
+        if data:
+            if not state.buffer:
+                state.start_time = time.time()
+            state.buffer.extend(data)
+            state.last_time = now
         
     def run(self):
         self.running = True
         while self.running:
             if self.serial_port and self.serial_port.is_open:
                 try:
-                    if self.serial_port.in_waiting > 0:
-                        data = self.serial_port.read(self.serial_port.in_waiting)
+                    # 有数据时一次读完，否则阻塞等待至少1字节或超时
+                    data = self.serial_port.read(self.serial_port.in_waiting or 1)
+                    self._split_frame(data)
+                    if data:
                         self.data_received.emit(data)
                 except Exception as e:
                     print(f"读取串口数据错误: {e}")
+                    self._flush_frame()
                     self.connection_lost.emit()
                     self.running = False
-            self.msleep(10)
+            else:
+                self.msleep(10)
+        # 线程退出时显示缓冲区剩余数据
+        self._flush_frame()
     
     def stop(self):
         self.running = False
         self.wait()
 
 
+
+class _TaskSignals(QObject):
+    """后台任务的结果信号（QRunnable不是QObject，需借助它把结果送回GUI线程）"""
+    finished = pyqtSignal(object)  # 任务函数的返回值
+    failed = pyqtSignal(str)  # 异常信息
+
+
+class BackgroundTask(QRunnable):
+    """在QThreadPool中执行耗时函数（文件导出、图片解码），结果通过signals在GUI线程处理
+    
+    任务函数只能处理调用前已复制好的数据，不能访问界面控件
+    """
+    
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _TaskSignals()
+    
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+# 运行中的后台任务，持有引用直到结果送达GUI线程，避免信号对象被提前回收
+_active_tasks = set()
+
+
+def _start_background_task(fn, *args, on_finished=None, on_failed=None):
+    """把fn(*args)提交到全局线程池，完成/失败时在GUI线程调用on_finished(结果)/on_failed(异常信息)"""
+    task = BackgroundTask(fn, *args)
+    _active_tasks.add(task)
+    
+    def finish(result):
+        _active_tasks.discard(task)
+        if on_finished is not None:
+            on_finished(result)
+    
+    def fail(message):
+        _active_tasks.discard(task)
+        if on_failed is not None:
+            on_failed(message)
+    
+    task.signals.finished.connect(finish)
+    task.signals.failed.connect(fail)
+    QThreadPool.globalInstance().start(task)
+    return task
+
 class SplashScreenWidget(QSplashScreen):
     """自定义启动画面"""
     
-    def __init__(self):
+    _pixmap_cache = None  # 背景图只绘制一次（需在QApplication创建后生成）
+    
+    @classmethod
+    def _background_pixmap(cls):
+        """获取启动画面背景，首次调用时绘制并缓存"""
+        if cls._pixmap_cache is not None:
+            return cls._pixmap_cache
+        
         # 创建一个渐变背景的QPixmap
         pixmap = QPixmap(600, 400)
         pixmap.fill(Qt.transparent)
@@ -167,6 +438,12 @@ class SplashScreenWidget(QSplashScreen):
         
         painter.end()
         
+        cls._pixmap_cache = pixmap
+        return pixmap
+    
+    def __init__(self):
+        pixmap = self._background_pixmap()
+        
         super().__init__(pixmap)
         self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint)
         
@@ -211,6 +488,13 @@ class SplashScreenWidget(QSplashScreen):
         QApplication.processEvents()
 
 
+# 预编译的帧字段结构: CO浓度(uint16) + 平均CO浓度(uint32) + 温度(int16)，均为小端，从Byte 2开始
+_FIXED_FRAME = struct.Struct('<HIh')
+_U16_LE = struct.Struct('<H')
+_U16_BE = struct.Struct('>H')
+_U8 = struct.Struct('B')
+
+
 class DataParser:
     """数据解析器 - 解析固定38字节协议"""
     
@@ -225,51 +509,57 @@ class DataParser:
         """添加接收到的数据"""
         self.buffer.extend(data)
         
-    def parse(self):
-        """解析数据帧,返回解析结果列表"""
-        results = []
+    def parse(self, timestamp=None):
+        """解析数据帧,返回解析结果列表
         
-        while len(self.buffer) >= self.FRAME_LENGTH:
+        Args:
+            timestamp: 本批数据的接收时间，默认取当前时间（同一批帧共用）
+        """
+        results = []
+        if timestamp is None:
+            timestamp = datetime.now()
+        
+        # 用读偏移pos扫描，循环结束后一次性删除已消费的数据，避免每帧搬移缓冲区
+        buffer = self.buffer
+        frame_length = self.FRAME_LENGTH
+        end = len(buffer)
+        pos = 0
+        while end - pos >= frame_length:
             # 查找帧头
-            header_index = self.buffer.find(self.FRAME_HEADER)
+            header_index = buffer.find(self.FRAME_HEADER, pos)
             
             if header_index == -1:
                 # 没有找到帧头,清空缓冲区
-                self.buffer.clear()
+                pos = end
                 break
             
-            # 删除帧头之前的无效数据
-            if header_index > 0:
-                self.buffer = self.buffer[header_index:]
+            # 跳过帧头之前的无效数据
+            pos = header_index
             
             # 检查是否有完整帧
-            if len(self.buffer) < self.FRAME_LENGTH:
+            if end - pos < frame_length:
                 break
             
-            # 提取一帧数据
-            frame = self.buffer[:self.FRAME_LENGTH]
-            
             # 验证帧尾
-            if frame[36:38] != self.FRAME_TAIL:
-                # 帧尾不匹配,删除当前帧头,继续查找
-                self.buffer = self.buffer[2:]
+            if not buffer.startswith(self.FRAME_TAIL, pos + 36):
+                # 帧尾不匹配,跳过当前帧头,继续查找
+                pos += 2
                 continue
             
+            # 提取一帧数据(经memoryview只复制一次)
+            frame = bytes(memoryview(buffer)[pos:pos + frame_length])
+            
             # 解析数据
             try:
                 # CO浓度 (Byte 2-3, uint16 LE)
-                co_concentration = struct.unpack('<H', frame[2:4])[0]
-                
                 # 平均CO浓度 (Byte 4-7, uint32 LE, 需要除以600)
-                co_avg_raw = struct.unpack('<I', frame[4:8])[0]
-                co_avg = co_avg_raw / 600.0
-                
                 # 温度 (Byte 8-9, int16 LE, 单位0.1°C)
-                temp_raw = struct.unpack('<h', frame[8:10])[0]
+                co_concentration, co_avg_raw, temp_raw = _FIXED_FRAME.unpack_from(frame, 2)
+                co_avg = co_avg_raw / 600.0
                 temperature = temp_raw / 10.0
                 
                 result = {
-                    'timestamp': datetime.now(),
+                    'timestamp': timestamp,
                     'co_concentration': co_concentration,
                     'co_avg': co_avg,
                     'temperature': temperature,
@@ -280,12 +570,79 @@ class DataParser:
             except Exception as e:
                 print(f"解析数据错误: {e}")
             
-            # 删除已处理的帧
-            self.buffer = self.buffer[self.FRAME_LENGTH:]
+            # 跳过已处理的帧
+            pos += frame_length
+        
+        if pos:
+            del buffer[:pos]
         
         return results
 
 
+# 接收协议CRC类型(协议配置对话框combo_crc的文本) -> 校验函数
+# 各函数内部已按 crcmod C扩展 > Numba > 查表法 的顺序选择实现
+CRC_FUNCS = {
+    'CRC16-XMODEM': CRCCalculator.calculate_crc16_xmodem,
+    'CRC16-CCITT': CRCCalculator.calculate_ccitt_crc16,
+    'CRC16-MODBUS': CRCCalculator.calculate_modbus_crc16,
+    '累加和': CRCCalculator.calculate_sum_check,
+    '异或': CRCCalculator.calculate_xor_check,
+}
+
+# 接收协议CRC类型 -> (校验函数, 帧尾校验值的Struct)
+_PROTOCOL_CRC_SPECS = {
+    'CRC16-MODBUS': (CRC_FUNCS['CRC16-MODBUS'], _U16_LE),   # 小端序（低字节在前）
+    'CRC16-XMODEM': (CRC_FUNCS['CRC16-XMODEM'], _U16_LE),   # 小端序（低字节在前）
+    'CRC16-CCITT': (CRC_FUNCS['CRC16-CCITT'], _U16_BE),     # 大端序（高字节在前）
+    '累加和': (CRC_FUNCS['累加和'], _U8),
+    '异或': (CRC_FUNCS['异或'], _U8),
+}
+
+# 发送/预设CRC类型(combo_send_crc/预设crc_type的文本) -> (校验函数, 追加到帧尾的Struct)
+# '无' 不在表中，add_crc_to_data 查不到即原样返回
+_SEND_CRC_SPECS = {
+    'CCITT-CRC16': (CRC_FUNCS['CRC16-CCITT'], _U16_BE),     # 高字节在前
+    'Modbus-CRC16': (CRC_FUNCS['CRC16-MODBUS'], _U16_LE),   # Modbus标准:低字节在前
+    'CRC16-XMODEM': (CRC_FUNCS['CRC16-XMODEM'], _U16_LE),   # 低字节在前
+    '累加和': (CRC_FUNCS['累加和'], _U8),
+    '异或': (CRC_FUNCS['异或'], _U8),
+}
+
+
+
+def _intern_key(value):
+    """驻留用作字典键的字符串（协议名、CRC类型、数据类型），使查表可走同一对象的快速比较；None原样返回"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class ParsedFrame:
+    """通用协议解析结果（frame_hex在首次访问时才生成）"""
+    __slots__ = ('timestamp', 'protocol_name', 'raw_frame', '_hex')
+    
+    def __init__(self, timestamp, protocol_name, raw_frame):
+        self.timestamp = timestamp
+        self.protocol_name = protocol_name
+        self.raw_frame = raw_frame
+        self._hex = None
+    
+    @property
+    def frame_hex(self):
+        """帧数据的HEX字符串（空格分隔，大写）"""
+        if self._hex is None:
+            self._hex = self.raw_frame.hex(' ').upper()
+        return self._hex
+    
+    # 兼容字典方式访问: result['raw_frame'] / result.get('protocol_name')
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+    
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
 class GenericProtocolParser:
     """通用协议解析器"""
     
@@ -296,135 +653,335 @@ class GenericProtocolParser:
         """
         self.config = protocol_config
         self.buffer = bytearray()
-        self.name = protocol_config.get('name', '未命名协议')
+        self.name = _intern_key(protocol_config.get('name', '未命名协议'))
         self.header = bytes(protocol_config.get('header', []))
         self.tail = bytes(protocol_config.get('tail', []))
         self.length = protocol_config.get('length', 0)
-        self.crc_type = protocol_config.get('crc_type', '无')
+        self.crc_type = _intern_key(protocol_config.get('crc_type', '无'))
         self.enabled = protocol_config.get('enabled', True)
+        self._n_appends = 0
+        
+        # 预先确定CRC校验函数、校验值位置和字节序，避免每帧重复判断
+        crc_spec = _PROTOCOL_CRC_SPECS.get(self.crc_type)
+        self._crc_enabled = crc_spec is not None
+        if self._crc_enabled:
+            self._crc_fn, self._crc_struct = crc_spec
+            self._crc_data_end = self.length - self._crc_struct.size
     
     def add_data(self, data):
         """添加接收到的数据"""
         self.buffer.extend(data)
-        # 限制缓冲区大小，防止内存溢出
-        if len(self.buffer) > 10240:
-            self.buffer = self.buffer[-5120:]
+        # 限制缓冲区大小，防止内存溢出（每16次追加检查一次）
+        self._n_appends += 1
+        if self._n_appends & 0xF == 0 and len(self.buffer) > 10240:
+            del self.buffer[:-5120]
     
-    def parse(self):
-        """解析数据帧，返回解析结果列表"""
+    def parse(self, timestamp=None):
+        """解析数据帧，返回解析结果列表
+        
+        Args:
+            timestamp: 本批数据的接收时间，默认取当前时间（同一批帧共用）
+        """
         results = []
         
         if not self.enabled:
             return results
+        if timestamp is None:
+            timestamp = datetime.now()
         
-        while len(self.buffer) >= self.length:
+        buffer = self.buffer
+        length = self.length
+        header = self.header
+        # 当前读取位置: 查找从该位置开始，已处理的数据在解析结束后一次性删除
+        pos = 0
+        
+        while len(buffer) - pos >= length:
             # 查找帧头
-            if len(self.header) > 0:
-                header_index = self.buffer.find(self.header)
+            if len(header) > 0:
+                header_index = buffer.find(header, pos)
                 
                 if header_index == -1:
                     # 没有找到帧头，保留最后len(header)-1字节，防止帧头被截断
-                    if len(self.buffer) > len(self.header):
-                        self.buffer = self.buffer[-(len(self.header)-1):]
+                    if len(buffer) - pos > len(header):
+                        pos = len(buffer) - (len(header) - 1)
                     break
                 
-                # 删除帧头之前的无效数据
-                if header_index > 0:
-                    self.buffer = self.buffer[header_index:]
+                # 跳过帧头之前的无效数据
+                pos = header_index
             
             # 检查是否有完整帧
-            if len(self.buffer) < self.length:
+            if len(buffer) - pos < length:
                 break
             
-            # 提取一帧数据
-            frame = bytes(self.buffer[:self.length])
-            
-            # 验证帧尾
-            if len(self.tail) > 0:
-                tail_start = self.length - len(self.tail)
-                if frame[tail_start:] != self.tail:
-                    # 帧尾不匹配，删除当前帧头，继续查找
-                    skip_len = max(1, len(self.header))
-                    self.buffer = self.buffer[skip_len:]
-                    continue
-            
-            # 验证CRC（若配置了CRC，必须校验通过才解析）
-            if not self._verify_crc(frame):
-                # CRC校验失败，记录日志并跳过该帧
-                frame_hex = ' '.join(f'{b:02X}' for b in frame)
-                print(f"[{self.name}] CRC校验失败，丢弃帧: {frame_hex}")
-                skip_len = max(1, len(self.header))
-                self.buffer = self.buffer[skip_len:]
+            # 以memoryview引用缓冲区中的一帧，校验通过后才复制为bytes
+            # 注意: 视图释放前缓冲区不能改变大小
+            frame_mv = memoryview(buffer)[pos:pos + length]
+            try:
+                # 验证帧尾
+                tail_ok = (len(self.tail) == 0 or
+                           frame_mv[length - len(self.tail):] == self.tail)
+                
+                # 验证CRC（若配置了CRC，必须校验通过才解析）
+                frame_ok = tail_ok and self._verify_crc(frame_mv)
+                if frame_ok:
+                    frame = bytes(frame_mv)
+                elif tail_ok:
+                    # CRC校验失败，记录日志并跳过该帧
+                    frame_hex = frame_mv.hex(' ').upper()
+                    print(f"[{self.name}] CRC校验失败，丢弃帧: {frame_hex}")
+            finally:
+                frame_mv.release()
+            
+            if not frame_ok:
+                # 帧尾不匹配或CRC失败，跳过当前帧头，从其后继续查找
+                pos += max(1, len(header))
                 continue
             
             # 解析成功
-            result = {
-                'timestamp': datetime.now(),
-                'protocol_name': self.name,
-                'raw_frame': frame,
-                'frame_hex': ' '.join(f'{b:02X}' for b in frame)
-            }
-            results.append(result)
-            
-            # 删除已处理的帧
-            self.buffer = self.buffer[self.length:]
+            results.append(ParsedFrame(timestamp, self.name, frame))
+            pos += length
+        
+        # 删除已处理的数据
+        if pos:
+            del buffer[:pos]
         
         return results
     
     def _verify_crc(self, frame):
-        """验证CRC校验（若配置了CRC，必须校验通过）"""
-        if self.crc_type == '无':
+        """验证CRC校验（若配置了CRC，必须校验通过）
+        CRC位于帧的最后2个字节（累加和/异或为最后1个字节）
+        """
+        if not self._crc_enabled:
             return True
+        if self._crc_data_end < 1:
+            return False
         
-        # CRC位于帧的最后2个字节（或1个字节）
-        if self.crc_type in ['CRC16-XMODEM', 'CRC16-CCITT', 'CRC16-MODBUS']:
-            if len(frame) < 3:
-                return False
-            data = frame[:-2]
-            
-            # 根据不同CRC类型使用不同的字节序
-            if self.crc_type == 'CRC16-MODBUS':
-                # Modbus CRC使用小端序（低字节在前）
-                crc_received = struct.unpack('<H', frame[-2:])[0]
-                crc_calculated = CRCCalculator.calculate_modbus_crc16(data)
-            elif self.crc_type == 'CRC16-XMODEM':
-                # XMODEM使用小端序（低字节在前）
-                crc_received = struct.unpack('<H', frame[-2:])[0]
-                crc_calculated = CRCCalculator.calculate_crc16_xmodem(data)
-            else:  # CRC16-CCITT
-                # CCITT使用大端序（高字节在前）
-                crc_received = struct.unpack('>H', frame[-2:])[0]
-                crc_calculated = CRCCalculator.calculate_ccitt_crc16(data)
-            
-            # 调试输出（可选）
-            if crc_received != crc_calculated:
-                print(f"[{self.name}] CRC校验: 接收={crc_received:04X}, 计算={crc_calculated:04X}")
-            
-            return crc_received == crc_calculated
+        crc_received = self._crc_struct.unpack_from(frame, self._crc_data_end)[0]
+        crc_calculated = self._crc_fn(frame[:self._crc_data_end])
         
-        elif self.crc_type in ['累加和', '异或']:
-            if len(frame) < 2:
-                return False
-            data = frame[:-1]
-            check_received = frame[-1]
-            
-            if self.crc_type == '累加和':
-                check_calculated = CRCCalculator.calculate_sum_check(data)
-            else:  # 异或
-                check_calculated = CRCCalculator.calculate_xor_check(data)
-            
-            # 调试输出（可选）
-            if check_received != check_calculated:
-                print(f"[{self.name}] 校验失败: 接收={check_received:02X}, 计算={check_calculated:02X}")
-            
-            return check_received == check_calculated
+        # 调试输出（可选）
+        if crc_received != crc_calculated:
+            width = self._crc_struct.size * 2
+            print(f"[{self.name}] CRC校验: 接收={crc_received:0{width}X}, 计算={crc_calculated:0{width}X}")
+        
+        return crc_received == crc_calculated
+
+
+# 数据类型 -> 预编译Struct（曲线、自定义显示、接收时钟共用）
+_STRUCT_MAP = {
+    'uint8': struct.Struct('B'),
+    'int8': struct.Struct('b'),
+    'uint16 (LE)': struct.Struct('<H'),
+    'uint16 (BE)': struct.Struct('>H'),
+    'int16 (LE)': struct.Struct('<h'),
+    'int16 (BE)': struct.Struct('>h'),
+    'uint32 (LE)': struct.Struct('<I'),
+    'uint32 (BE)': struct.Struct('>I'),
+    'int32 (LE)': struct.Struct('<i'),
+    'int32 (BE)': struct.Struct('>i'),
+    'float (LE)': struct.Struct('<f'),
+    'float (BE)': struct.Struct('>f'),
+    'double (LE)': struct.Struct('<d'),
+    'double (BE)': struct.Struct('>d'),
+}
+
+
+def unpack_field(data_type, buf, offset=0):
+    """按数据类型从buf的offset处解析一个数值（不切片复制）"""
+    return _STRUCT_MAP[data_type].unpack_from(buf, offset)[0]
+
+
+def _curve_field_spec(config):
+    """把曲线配置解析为 (起始字节, 结束字节, Struct, 位索引)，位模式下Struct为None；配置无效时返回None
+    
+    在配置变化时调用一次，数据帧到达时不再查表和读取配置字典
+    """
+    try:
+        start = config['start_byte']
+        end = start + config['byte_count']
+        if config.get('bit_mode', False):
+            return (start, end, None, config.get('bit_index', 0))
+        unpacker = _STRUCT_MAP.get(config['data_type'])
+        if unpacker is None or unpacker.size > config['byte_count']:
+            return None
+        return (start, end, unpacker, 0)
+    except Exception as e:
+        print(f"解析曲线配置错误: {e}")
+        return None
+
+
+def _read_curve_field(frame, spec):
+    """按_curve_field_spec的结果从数据帧读取原始数值，越界或配置无效时返回None"""
+    if spec is None:
+        return None
+    start, end, unpacker, bit_index = spec
+    if end > len(frame):
+        return None
+    if unpacker is None:
+        # 位模式：提取指定字节的指定位 (0-7, 0为最低位LSB)
+        return float((frame[start] >> bit_index) & 0x01)
+    return unpacker.unpack_from(frame, start)[0]
+
+
+class CurveFieldLayout:
+    """同一协议下一组曲线字段的预编译布局
+    
+    字段互不重叠且字节序一致时，按偏移排序拼成一个Struct（字段间隙用'x'填充），
+    每帧一次unpack_from读出全部数值；否则逐字段读取（已安装Numba时由_decode_fields_nb一次完成）。
+    位模式字段单独按字节取位。
+    解析失败（配置无效或帧长度不足）只由各字段的结束字节判断，与数值本身是否为NaN无关。
+    """
+
+    # Struct格式字符 -> _decode_fields_nb的字段类型
+    _NB_KINDS = {'B': 0, 'H': 0, 'I': 0, 'b': 1, 'h': 1, 'i': 1, 'f': 2, 'd': 2}
+
+    def __init__(self, specs):
+        self.specs = specs
+        self._struct = None
+        self._base = 0
+        self._order = None
+        self._bits = []
+        self._min_len = 0
+        self._nb_fields = self._build_nb_fields(specs) if _decode_fields_nb is not None else None
+        # 各字段的结束字节，配置无效的字段记为最大值，使其在任何帧上都判为失败
+        self._ends = np.array([np.iinfo(np.int64).max if spec is None else spec[1] for spec in specs],
+                              dtype=np.int64)
+
+        fields = []
+        order = ''
+        for pos, spec in enumerate(specs):
+            if spec is None:
+                continue
+            start, end, unpacker, bit_index = spec
+            self._min_len = max(self._min_len, end)
+            if unpacker is None:
+                self._bits.append((pos, start, bit_index))
+                continue
+            fmt = unpacker.format
+            if fmt[0] in '<>':
+                if order and order != fmt[0]:
+                    return  # 大小端混用，无法合并为一个Struct
+                order = fmt[0]
+                fmt = fmt[1:]
+            fields.append((start, unpacker.size, fmt, pos))
+        if not fields:
+            return
+
+        fields.sort()
+        self._base = fields[0][0]
+        parts = []
+        cursor = self._base
+        for start, size, code, _ in fields:
+            if start < cursor:
+                return  # 字段重叠，无法合并为一个Struct
+            if start > cursor:
+                parts.append(f'{start - cursor}x')
+            parts.append(code)
+            cursor = start + size
+        self._struct = struct.Struct((order or '<') + ''.join(parts))
+        self._order = np.array([pos for _, _, _, pos in fields], dtype=np.intp)
+
+    @classmethod
+    def _build_nb_fields(cls, specs):
+        """把字段描述转换为_decode_fields_nb使用的参数数组"""
+        n = len(specs)
+        starts = np.zeros(n, dtype=np.int64)
+        ends = np.zeros(n, dtype=np.int64)
+        kinds = np.full(n, -1, dtype=np.int64)
+        sizes = np.zeros(n, dtype=np.int64)
+        big_endian = np.zeros(n, dtype=np.bool_)
+        bit_indices = np.zeros(n, dtype=np.int64)
+        for pos, spec in enumerate(specs):
+            if spec is None:
+                continue
+            start, end, unpacker, bit_index = spec
+            starts[pos] = start
+            ends[pos] = end
+            if unpacker is None:
+                kinds[pos] = 3
+                bit_indices[pos] = bit_index
+                continue
+            kinds[pos] = cls._NB_KINDS[unpacker.format[-1]]
+            sizes[pos] = unpacker.size
+            big_endian[pos] = unpacker.format[0] == '>'
+        return (starts, ends, kinds, sizes, big_endian, bit_indices)
+
+    def read(self, frame):
+        """读取全部字段的原始值，返回 (原始值数组, 解析失败掩码)，失败字段的原始值为NaN
         
-        return True
+        浮点字段本身读到的NaN不计为失败
+        """
+        failed = self._ends > len(frame)
+        if self._struct is None or len(frame) < self._min_len:
+            if self._nb_fields is not None:
+                return _decode_fields_nb(np.frombuffer(frame, dtype=np.uint8), *self._nb_fields), failed
+            return np.array([_read_curve_field(frame, spec) for spec in self.specs],
+                            dtype=np.float64), failed
+        raw = np.full(len(self.specs), np.nan)
+        raw[self._order] = self._struct.unpack_from(frame, self._base)
+        for pos, start, bit_index in self._bits:
+            raw[pos] = (frame[start] >> bit_index) & 0x01
+        return raw, failed
+
+
+class CurveConfigRegistry:
+    """曲线换算参数的列式存储（系数/除数/偏移各为一个数组），每帧一次向量化换算所有曲线"""
+
+    def __init__(self, configs=()):
+        n = len(configs)
+        self.coeffs = np.ones(n, dtype=np.float64)
+        self.divisors = np.ones(n, dtype=np.float64)
+        self.offsets = np.zeros(n, dtype=np.float64)
+        for i, config in enumerate(configs):
+            # 位模式直接输出0/1，保持恒等换算
+            if config.get('bit_mode', False):
+                continue
+            divisor = config.get('divisor', 1.0)
+            if divisor == 0:
+                # 除数为0时按解析失败处理，结果记为0
+                self.coeffs[i] = 0.0
+                continue
+            self.coeffs[i] = config.get('coefficient', 1.0)
+            self.divisors[i] = divisor
+            self.offsets[i] = config.get('offset', 0.0)
+
+    def scale(self, indices, raw):
+        """对indices指定的曲线换算原始值：raw * 系数 / 除数 + 偏移"""
+        return raw * self.coeffs[indices] / self.divisors[indices] + self.offsets[indices]
+
+
+def _write_excel(filepath, columns):
+    """把 {列名: 数据} 写入Excel文件（已安装xlsxwriter时逐行流式写入，内存占用恒定）
+    
+    不访问界面对象，可在后台线程中调用
+    """
+    if xlsxwriter is None:
+        pd.DataFrame(columns).to_excel(filepath, index=False)
+        return
+    
+    values = []
+    for column in columns.values():
+        if isinstance(column, np.ndarray):
+            # NaN写为空单元格，与pandas导出一致
+            column = [None if v != v else v for v in column.tolist()]
+        values.append(column)
+    
+    workbook = xlsxwriter.Workbook(filepath, {'constant_memory': True})
+    try:
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, list(columns))
+        for row, row_values in enumerate(zip(*values), start=1):
+            worksheet.write_row(row, 0, row_values)
+    finally:
+        workbook.close()
 
 
 class PlotCanvas(FigureCanvas):
     """绘图画布"""
     
+    REDRAW_INTERVAL_MS = 66  # 曲线重绘最小间隔（毫秒）
+    DISPLAY_MAX_POINTS = 2400  # 每条曲线最多绘制的点数（约2倍屏幕宽度），导出不受影响
+    
     def __init__(self, parent=None, width=8, height=6, dpi=100):
         # 设置透明背景和Apple风格
         self.fig = Figure(figsize=(width, height), dpi=dpi)
@@ -462,9 +1019,12 @@ class PlotCanvas(FigureCanvas):
         # 用于记录是否使用自动缩放
         self.auto_scale = True
         
-        # 数据存储 - 取消点数限制，使用list
-        self.time_data = []  # 相对时间(秒)，用于图表显示
-        self.timestamp_data = []  # 绝对时间戳，用于Excel导出
+        # 数据存储 - 预分配NumPy环形缓冲区（保留最近50000点，约14小时@1Hz）
+        self._cap = 50000
+        self._head = 0  # 下一个写入位置
+        self._size = 0  # 有效数据点数
+        self.time_data = np.empty(self._cap, dtype=np.float64)  # 相对时间(秒)，用于图表显示
+        self.timestamp_data = np.empty(self._cap, dtype='datetime64[ms]')  # 绝对时间戳，用于Excel导出
         self.recording_start_time = None  # 记录开始时间
         self.last_auto_save_time = None  # 上次自动保存时间
         self.auto_save_interval = 2 * 3600  # 2小时自动保存间隔（秒）
@@ -472,7 +1032,12 @@ class PlotCanvas(FigureCanvas):
         
         # 曲线配置（最多50条）
         self.curve_configs = []
-        self.curve_data = []  # 每条曲线的数据list
+        self.curve_data = np.empty((0, self._cap))  # 曲线环形缓冲区矩阵，每行一条曲线
+        self._curve_min = np.empty(0)  # 每条曲线当前窗口的最小值，用于自动缩放
+        self._curve_max = np.empty(0)  # 每条曲线当前窗口的最大值
+        self._minmax_stale = np.zeros(0, dtype=bool)  # 最值样本被覆盖、需要重新计算的曲线
+        self._registry = CurveConfigRegistry()  # 曲线换算参数（配置变化时重建）
+        self._enabled_indices = {}  # 协议名 -> (曲线索引数组, CurveFieldLayout)，只含需解析的曲线（配置变化时重建）
         self.lines = []  # 每条曲线的Line2D对象
         
         # 颜色映射
@@ -488,6 +1053,12 @@ class PlotCanvas(FigureCanvas):
         
         self.start_time = None
         
+        # 限频重绘：add_data只置脏标记，由定时器统一重绘（约15Hz）
+        self._dirty = False
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.timeout.connect(self._maybe_redraw)
+        self._redraw_timer.start(self.REDRAW_INTERVAL_MS)
+        
         # 初始化默认曲线配置（兼容旧版本）
         self.init_default_curves()
     
@@ -548,11 +1119,18 @@ class PlotCanvas(FigureCanvas):
         for line in self.lines:
             line.remove()
         self.lines.clear()
-        self.curve_data.clear()
-        
+
         # 最多50条曲线
         self.curve_configs = configs[:50]
-        
+        n = len(self.curve_configs)
+
+        # 为每条曲线分配环形缓冲区（矩阵的一行），未记录的位置为NaN（不绘制）
+        self.curve_data = np.full((n, self._cap), np.nan)
+        self._curve_min = np.full(n, np.inf)
+        self._curve_max = np.full(n, -np.inf)
+        self._minmax_stale = np.zeros(n, dtype=bool)
+        self._registry = CurveConfigRegistry(self.curve_configs)
+
         # 创建新曲线
         for config in self.curve_configs:
             color = self.color_map.get(config.get('color', '蓝色'), '#1f77b4')
@@ -563,13 +1141,24 @@ class PlotCanvas(FigureCanvas):
             line, = self.ax.plot([], [], color, linewidth=2, label=label)
             line.set_visible(config.get('enabled', True))
             self.lines.append(line)
-            
-            # 为每条曲线创建数据存储（无限制）
-            self.curve_data.append([])
-        
+
+        self._rebuild_enabled_indices()
         self.update_legend()
         self.draw()
     
+    def _rebuild_enabled_indices(self):
+        """按协议分组需要解析的曲线（显示或记录中的曲线），数据帧到达时只解析这些曲线"""
+        groups = {}
+        for i, config in enumerate(self.curve_configs):
+            if config.get('enabled', True) or config.get('record', True):
+                protocol = _intern_key(config.get('protocol', None))
+                groups.setdefault(protocol, []).append(i)
+        self._enabled_indices = {
+            protocol: (np.array(indices, dtype=np.intp),
+                       CurveFieldLayout([_curve_field_spec(self.curve_configs[i]) for i in indices]))
+            for protocol, indices in groups.items()
+        }
+    
     def update_legend(self):
         """更新图例"""
         visible_lines = []
@@ -593,73 +1182,25 @@ class PlotCanvas(FigureCanvas):
             self.lines[index].set_visible(visible)
             if index < len(self.curve_configs):
                 self.curve_configs[index]['enabled'] = visible
+                self._rebuild_enabled_indices()
             self.update_legend()
             self.draw()
     
     def parse_value_from_frame(self, frame, config):
-        """从数据帧中解析数值"""
-        try:
-            start = config['start_byte']
-            count = config['byte_count']
-            dtype = config['data_type']
-            bit_mode = config.get('bit_mode', False)
-            bit_index = config.get('bit_index', 0)
-            
-            if start + count > len(frame):
-                return None
-            
-            # 位模式：提取指定字节的指定位
-            if bit_mode:
-                if start >= len(frame):
-                    return None
-                target_byte = frame[start]
-                # 提取指定位 (0-7, 0为最低位LSB)
-                bit_value = (target_byte >> bit_index) & 0x01
-                return float(bit_value)
-            
-            # 普通模式：按数据类型解析
-            data_bytes = frame[start:start+count]
-            
-            # 根据数据类型解析
-            if dtype == 'uint8':
-                value = data_bytes[0]
-            elif dtype == 'int8':
-                value = struct.unpack('b', data_bytes[:1])[0]
-            elif dtype == 'uint16 (LE)':
-                value = struct.unpack('<H', data_bytes[:2])[0]
-            elif dtype == 'uint16 (BE)':
-                value = struct.unpack('>H', data_bytes[:2])[0]
-            elif dtype == 'int16 (LE)':
-                value = struct.unpack('<h', data_bytes[:2])[0]
-            elif dtype == 'int16 (BE)':
-                value = struct.unpack('>h', data_bytes[:2])[0]
-            elif dtype == 'uint32 (LE)':
-                value = struct.unpack('<I', data_bytes[:4])[0]
-            elif dtype == 'uint32 (BE)':
-                value = struct.unpack('>I', data_bytes[:4])[0]
-            elif dtype == 'int32 (LE)':
-                value = struct.unpack('<i', data_bytes[:4])[0]
-            elif dtype == 'int32 (BE)':
-                value = struct.unpack('>i', data_bytes[:4])[0]
-            elif dtype == 'float (LE)':
-                value = struct.unpack('<f', data_bytes[:4])[0]
-            elif dtype == 'float (BE)':
-                value = struct.unpack('>f', data_bytes[:4])[0]
-            elif dtype == 'double (LE)':
-                value = struct.unpack('<d', data_bytes[:8])[0]
-            elif dtype == 'double (BE)':
-                value = struct.unpack('>d', data_bytes[:8])[0]
-            else:
-                return None
-            
-            # 应用系数和偏移
-            value = (value * config['coefficient'] / config['divisor']) + config['offset']
+        """从数据帧中解析数值（已应用系数和偏移）"""
+        value = self._parse_raw_value(frame, config)
+        if value is None or config.get('bit_mode', False):
             return value
-            
+        try:
+            return (value * config['coefficient'] / config['divisor']) + config['offset']
         except Exception as e:
             print(f"解析曲线数据错误: {e}")
             return None
     
+    def _parse_raw_value(self, frame, config):
+        """从数据帧中解析原始数值（位模式为0/1），换算由CurveConfigRegistry统一完成"""
+        return _read_curve_field(frame, _curve_field_spec(config))
+    
     def add_data(self, data_dict):
         """添加数据点（仅在接收到数据包时调用，不由定时器触发）"""
         if self.start_time is None:
@@ -668,39 +1209,47 @@ class PlotCanvas(FigureCanvas):
             self.last_auto_save_time = data_dict['timestamp']
         
         elapsed = (data_dict['timestamp'] - self.start_time).total_seconds()
-        self.time_data.append(elapsed)
-        self.timestamp_data.append(data_dict['timestamp'])  # 存储绝对时间戳
-        
+        slot = self._head
+        self.time_data[slot] = elapsed
+        self.timestamp_data[slot] = np.datetime64(data_dict['timestamp'], 'ms')  # 存储绝对时间戳
+
         # 从raw_frame解析各曲线的数据
-        if 'raw_frame' in data_dict:
-            frame = data_dict['raw_frame']
-            protocol_name = data_dict.get('protocol_name', None)
-            
-            for i, config in enumerate(self.curve_configs):
-                if i < len(self.curve_data):
-                    # 检查协议是否匹配
-                    curve_protocol = config.get('protocol', None)
-                    if curve_protocol == protocol_name:
-                        value = self.parse_value_from_frame(frame, config)
-                        if value is not None:
-                            self.curve_data[i].append(value)
-                        else:
-                            self.curve_data[i].append(0.0)
-                    else:
-                        # 协议不匹配，不更新此曲线（但需要占位以保持索引一致）
-                        # 使用上一个值或0
-                        if self.curve_data[i]:
-                            self.curve_data[i].append(self.curve_data[i][-1])
-                        else:
-                            self.curve_data[i].append(0.0)
-        
-        # 限制最大数据点数，防止内存溢出（保留最近50000点，约14小时@1Hz）
-        if len(self.time_data) > 50000:
-            self.time_data.pop(0)
-            self.timestamp_data.pop(0)
-            for data_list in self.curve_data:
-                if data_list:
-                    data_list.pop(0)
+        frame = data_dict.get('raw_frame')
+        protocol_name = data_dict.get('protocol_name', None)
+
+        data = self.curve_data
+        if len(data):
+            if self._size == self._cap:
+                # 被覆盖的最旧样本恰为最值时，该曲线的最值需要重新计算
+                old = data[:, slot]
+                self._minmax_stale |= (old == self._curve_min) | (old == self._curve_max)
+
+            # 协议不匹配的曲线不更新（但需要占位以保持索引一致），沿用上一个值
+            if self._size > 0:
+                data[:, slot] = data[:, (slot - 1) % self._cap]
+            else:
+                data[:, slot] = 0.0
+
+            # 检查协议是否匹配（隐藏且不记录的曲线不解析）
+            group = self._enabled_indices.get(protocol_name) if frame is not None else None
+            if group is not None:
+                indices, layout = group
+                # 解析失败的字段向量化换算后记为0，浮点字段读到的NaN原样保留
+                raw, failed = layout.read(frame)
+                values = self._registry.scale(indices, raw)
+                values[failed] = 0.0
+                data[indices, slot] = values
+
+            # fmin/fmax忽略NaN
+            column = data[:, slot]
+            np.fmin(self._curve_min, column, out=self._curve_min)
+            np.fmax(self._curve_max, column, out=self._curve_max)
+
+        # 环形写入，超过容量后自动覆盖最旧的数据点
+        self._head = (slot + 1) % self._cap
+        if self._size < self._cap:
+            self._size += 1
+        self._dirty = True
         
         # 检查是否需要自动保存（2小时）
         current_time = data_dict['timestamp']
@@ -709,6 +1258,56 @@ class PlotCanvas(FigureCanvas):
             self.auto_save_and_reset()
             self.last_auto_save_time = current_time
         
+    @property
+    def point_count(self):
+        """当前记录的数据点数"""
+        return self._size
+    
+    def _ordered(self, buf):
+        """按时间顺序返回环形缓冲区中的有效数据（未回绕时为视图，不复制）"""
+        if self._size < self._cap:
+            return buf[:self._size]
+        return np.concatenate((buf[self._head:], buf[:self._head]))
+    
+    def _display_index(self):
+        """返回按时间顺序、按步长抽取的显示用索引（未回绕时为切片，不复制）"""
+        n = self._size
+        stride = max(1, n // self.DISPLAY_MAX_POINTS)
+        if n < self._cap and (n - 1) % stride == 0:
+            return slice(0, n, stride)
+        # 已回绕或步长未覆盖最新点：构造索引数组，确保包含最新的数据点
+        positions = np.arange(0, n, stride)
+        if positions[-1] != n - 1:
+            positions = np.append(positions, n - 1)
+        start = self._head if n == self._cap else 0
+        return (start + positions) % self._cap
+    
+    def _value_range(self):
+        """计算所有可见曲线的数值范围，无有效数据时返回None"""
+        enabled = np.array([config.get('enabled', True) for config in self.curve_configs], dtype=bool)
+        if not enabled.any():
+            return None
+        for i in np.flatnonzero(enabled & self._minmax_stale):
+            self._recompute_minmax(i)
+        lo = self._curve_min[enabled].min()
+        hi = self._curve_max[enabled].max()
+        if lo > hi:
+            return None
+        return float(lo), float(hi)
+    
+    def _recompute_minmax(self, index):
+        """从当前窗口重新计算指定曲线的最值"""
+        valid = self.curve_data[index, :self._size]
+        # fmin/fmax忽略NaN
+        lo = np.fmin.reduce(valid) if len(valid) else np.nan
+        if np.isnan(lo):
+            self._curve_min[index] = np.inf
+            self._curve_max[index] = -np.inf
+        else:
+            self._curve_min[index] = lo
+            self._curve_max[index] = np.fmax.reduce(valid)
+        self._minmax_stale[index] = False
+    
     def zoom_x(self, factor):
         """缩放X轴
         factor > 1: 放大(显示更少数据)
@@ -736,45 +1335,46 @@ class PlotCanvas(FigureCanvas):
     def reset_view(self):
         """重置视图为自动缩放"""
         self.auto_scale = True
-        if len(self.time_data) > 0:
-            # 收集所有可见曲线的数据
-            all_values = []
-            for i, (config, data) in enumerate(zip(self.curve_configs, self.curve_data)):
-                if config.get('enabled', True) and len(data) > 0:
-                    all_values.extend(data)
-            
-            if self.time_data and all_values:
-                self.ax.set_xlim(min(self.time_data), max(self.time_data))
-                self.ax.set_ylim(min(all_values), max(all_values))
+        if self._size > 0:
+            self._autoscale()
         
         self.draw()
     
+    def _autoscale(self):
+        """根据所有可见曲线的数据范围设置坐标轴"""
+        value_range = self._value_range()
+        if value_range is not None:
+            times = self.time_data[:self._size]
+            self.ax.set_xlim(times.min(), times.max())
+            self.ax.set_ylim(*value_range)
+    
+    def _maybe_redraw(self):
+        """定时器回调：有新数据时才重绘"""
+        if self._dirty:
+            self._dirty = False
+            self.update_plot()
+    
     def update_plot(self):
         """更新曲线"""
-        if len(self.time_data) == 0:
+        if self._size == 0:
             return
         
-        # 更新每条曲线的数据
-        for i, (line, config, data) in enumerate(zip(self.lines, self.curve_configs, self.curve_data)):
-            if config.get('enabled', True) and len(data) > 0:
-                line.set_data(self.time_data, data)
+        # 更新每条曲线的数据（按步长抽点显示）
+        index = self._display_index()
+        times = self.time_data[index]
+        for line, config, data in zip(self.lines, self.curve_configs, self.curve_data):
+            if config.get('enabled', True):
+                line.set_data(times, data[index])
         
         # 在自动缩放模式下更新视图
         if self.auto_scale:
-            all_values = []
-            for i, (config, data) in enumerate(zip(self.curve_configs, self.curve_data)):
-                if config.get('enabled', True) and len(data) > 0:
-                    all_values.extend(data)
-            
-            if self.time_data and all_values:
-                self.ax.set_xlim(min(self.time_data), max(self.time_data))
-                self.ax.set_ylim(min(all_values), max(all_values))
+            self._autoscale()
         
         self.draw()
     
     def auto_save_and_reset(self):
         """自动保存当前数据并重置"""
-        if len(self.time_data) == 0:
+        if self._size == 0:
             return
         
         try:
@@ -792,11 +1392,11 @@ class PlotCanvas(FigureCanvas):
             filename = f'curve_data_{timestamp_str}.xlsx'
             filepath = os.path.join(base_path, filename)
             
-            # 导出数据
-            df = self.get_data_frame()
-            if df is not None:
-                df.to_excel(filepath, index=False)
-                print(f"自动保存曲线数据到: {filepath}")
+            # 复制数据后在后台线程写文件，不阻塞数据接收和界面
+            _start_background_task(
+                _write_excel, filepath, self.export_snapshot(),
+                on_finished=lambda _: print(f"自动保存曲线数据到: {filepath}"),
+                on_failed=lambda message: print(f"自动保存曲线数据失败: {message}"))
             
             # 重置数据（开始新的记录周期）
             self.clear_data()
@@ -810,10 +1410,11 @@ class PlotCanvas(FigureCanvas):
     
     def clear_data(self):
         """清空数据"""
-        self.time_data.clear()
-        self.timestamp_data.clear()
-        for data in self.curve_data:
-            data.clear()
+        self._head = 0
+        self._size = 0
+        self._curve_min.fill(np.inf)
+        self._curve_max.fill(-np.inf)
+        self._minmax_stale.fill(False)
         self.start_time = None
         self.recording_start_time = None
         
@@ -822,69 +1423,272 @@ class PlotCanvas(FigureCanvas):
         
         self.draw()
     
-    def get_data_frame(self):
-        """获取数据DataFrame用于导出（只导出标记为记录的曲线）"""
-        if len(self.time_data) == 0:
-            return None
-        
+    def _export_columns(self):
+        """返回导出用的列 {列名: 按时间排序的数据}（只导出标记为记录的曲线）"""
         # 使用实际时间戳而不是相对秒数
-        time_strings = [ts.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3] for ts in self.timestamp_data]
-        data_dict = {'时间': time_strings}
+        timestamps = np.datetime_as_string(self._ordered(self.timestamp_data), unit='ms')
+        columns = {'时间': [t.replace('T', ' ') for t in timestamps.tolist()]}
         
         for i, (config, data) in enumerate(zip(self.curve_configs, self.curve_data)):
             # 只导出标记为记录的曲线
             record = config.get('record', True)  # 默认为True以兼容旧配置
-            if record and len(data) > 0:
+            if record:
                 name = config.get('name', f'曲线{i+1}')
                 unit = config.get('unit', '')
                 column_name = f"{name}({unit})" if unit else name
-                data_dict[column_name] = data.copy()
+                columns[column_name] = self._ordered(data)
+        return columns
+    
+    def get_data_frame(self):
+        """获取数据DataFrame用于导出（只导出标记为记录的曲线）"""
+        if self._size == 0:
+            return None
         
-        df = pd.DataFrame(data_dict)
+        df = pd.DataFrame(self._export_columns())
         return df
+    
+    def export_snapshot(self):
+        """复制一份导出用的列数据，供后台线程写文件（之后缓冲区可继续写入或清空）"""
+        return {name: np.array(column) if isinstance(column, np.ndarray) else column
+                for name, column in self._export_columns().items()}
+    
+    def save_excel(self, filepath):
+        """导出曲线数据到Excel文件"""
+        if self._size == 0:
+            return
+        _write_excel(filepath, self._export_columns())
 
 
-class ProtocolConfigDialog(QDialog):
-    """数据协议配置对话框"""
-    
-    def __init__(self, parent=None, protocol_data=None):
-        super().__init__(parent)
-        self.setWindowTitle('配置数据协议')
-        self.setMinimumWidth(550)
-        
-        layout = QGridLayout(self)
-        
-        # 协议名称
-        layout.addWidget(QLabel('协议名称:'), 0, 0)
-        self.edit_name = QLineEdit()
-        self.edit_name.setPlaceholderText('例如: 数据类型1')
-        layout.addWidget(self.edit_name, 0, 1, 1, 3)
-        
-        # 帧头
-        layout.addWidget(QLabel('帧头(Hex):'), 1, 0)
-        self.edit_header = QLineEdit()
-        self.edit_header.setPlaceholderText('例如: A8 A8 (用空格分隔)')
-        layout.addWidget(self.edit_header, 1, 1, 1, 3)
-        
-        # 数据长度
-        layout.addWidget(QLabel('数据长度:'), 2, 0)
-        self.spin_length = QSpinBox()
-        self.spin_length.setRange(1, 1024)
-        self.spin_length.setValue(38)
-        self.spin_length.setSuffix(' 字节')
-        self.spin_length.setToolTip('完整帧的字节数(包含帧头帧尾)')
-        layout.addWidget(self.spin_length, 2, 1)
-        
-        # 帧尾
-        layout.addWidget(QLabel('帧尾(Hex):'), 2, 2)
-        self.edit_tail = QLineEdit()
-        self.edit_tail.setPlaceholderText('例如: AA AA (用空格分隔,无则留空)')
-        layout.addWidget(self.edit_tail, 2, 3)
-        
-        # CRC校验
+# 自定义显示窗口支持的数据类型
+_DATA_TYPES_DISPLAY = ('uint16 (LE)', 'uint16 (BE)', 'int16 (LE)', 'int16 (BE)',
+                       'uint32 (LE)', 'uint32 (BE)', 'int32 (LE)', 'int32 (BE)',
+                       'float (LE)', 'float (BE)', 'uint8', 'int8', 'string (ASCII)')
+# 曲线支持的数据类型
+_DATA_TYPES_CURVE = ('uint8', 'int8',
+                     'uint16 (LE)', 'uint16 (BE)', 'int16 (LE)', 'int16 (BE)',
+                     'uint32 (LE)', 'uint32 (BE)', 'int32 (LE)', 'int32 (BE)',
+                     'float (LE)', 'float (BE)', 'double (LE)', 'double (BE)')
+# 曲线颜色名称（与PlotCanvas.color_map对应）
+_COLOR_NAMES = ('蓝色', '绿色', '红色', '橙色', '紫色', '青色', '品红')
+# 接收协议的校验类型（与_PROTOCOL_CRC_SPECS对应）
+_CRC_TYPES_PROTOCOL = ('无', 'CRC16-XMODEM', 'CRC16-CCITT', 'CRC16-MODBUS', '累加和', '异或')
+# 发送/预设命令追加的校验类型（与add_crc_to_data对应）
+_CRC_TYPES_PRESET = ('无', 'CCITT-CRC16', 'Modbus-CRC16', 'CRC16-XMODEM', '累加和', '异或')
+# 接收时钟年份的数据类型
+_CLOCK_YEAR_TYPES = ('uint16 (LE)', 'uint16 (BE)', 'uint8')
+# 串口参数选项
+_BAUD_RATES = ('2400', '4800', '9600', '14400', '19200', '38400',
+               '57600', '115200', '128000', '256000', '460800', '921600')
+_DATA_BITS = ('5', '6', '7', '8')
+_STOP_BITS = ('1', '1.5', '2')
+_PARITIES = ('None', 'Even', 'Odd', 'Mark', 'Space')
+
+# 名称 -> 下拉框索引，加载配置时代替findText
+_DISPLAY_DATA_TYPE_INDEX = {name: i for i, name in enumerate(_DATA_TYPES_DISPLAY)}
+_DATA_TYPE_INDEX = {name: i for i, name in enumerate(_DATA_TYPES_CURVE)}
+_COLOR_INDEX = {name: i for i, name in enumerate(_COLOR_NAMES)}
+_CRC_PROTOCOL_INDEX = {name: i for i, name in enumerate(_CRC_TYPES_PROTOCOL)}
+_CRC_PRESET_INDEX = {name: i for i, name in enumerate(_CRC_TYPES_PRESET)}
+
+# 十六进制输入校验：每字节两位十六进制数，字节之间可用空格分隔（与bytes.fromhex规则一致）
+_HEX_TOKEN_RE = re.compile(r'\A(?:[0-9A-Fa-f]{2}\s*)*\Z')
+# 帧头/帧尾输入框只允许输入十六进制字符和空格（按键时即拦截非法字符）
+_HEX_INPUT_PATTERN = r'^[0-9A-Fa-f ]*$'
+
+
+def _normalize_hex_tokens(text):
+    """把空格分隔的单个十六进制数字补足两位（如 "A 8" -> "0A 08"），兼容按空格逐个解析的旧输入"""
+    return ' '.join(token.zfill(2) if len(token) == 1 else token for token in text.split())
+
+
+def _bytes_to_hex_spaced(seq):
+    """字节序列 -> 空格分隔的大写十六进制字符串（如 "A8 A8"）"""
+    return bytes(seq).hex(' ').upper()
+
+
+def _list_port_devices():
+    """枚举当前可用串口的设备名（Windows下可能耗时数百毫秒，可在后台线程调用）"""
+    return [port.device for port in serial.tools.list_ports.comports()]
+
+
+def _write_raw_data(file_path, chunks):
+    """把原始数据块逐行写为十六进制文本（后台线程调用）"""
+    with open(file_path, 'w') as f:
+        for data in chunks:
+            f.write(_bytes_to_hex_spaced(data) + '\n')
+
+
+def _populate_protocol_combo(combo, protocol_list):
+    """用一个预先构建好的模型填充协议下拉框（首项为默认协议），返回 {协议名: 下拉框索引}"""
+    model = QStandardItemModel(combo)
+    model.appendRow(QStandardItem('默认协议'))  # 无关联数据，currentData()为None
+    proto_index = {None: 0}
+    for proto in protocol_list:
+        if proto and proto.get('enabled', True):
+            name = proto.get('name')
+            item = QStandardItem(proto.get('name', '未命名'))
+            item.setData(name, Qt.UserRole)
+            proto_index.setdefault(name, model.rowCount())
+            model.appendRow(item)
+    # 行高一致，列表视图无需逐项计算尺寸
+    view = QListView(combo)
+    view.setUniformItemSizes(True)
+    view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+    combo.setView(view)
+    combo.setMaxVisibleItems(15)
+    combo.setModel(model)
+    return proto_index
+
+
+def _make_ok_cancel(dlg):
+    """创建连接到对话框accept/reject的确定/取消按钮组"""
+    buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+    buttons.accepted.connect(dlg.accept)
+    buttons.rejected.connect(dlg.reject)
+    return buttons
+
+
+# dock面板和分组框内容的标准边距 (左, 上, 右, 下)
+_DOCK_MARGINS = (5, 5, 5, 5)
+_GROUP_MARGINS = (5, 10, 5, 5)
+
+
+def _make_vbox(parent=None, spacing=None, margins=None):
+    """创建QVBoxLayout并一次设置间距和边距"""
+    layout = QVBoxLayout() if parent is None else QVBoxLayout(parent)
+    if spacing is not None:
+        layout.setSpacing(spacing)
+    if margins is not None:
+        layout.setContentsMargins(*margins)
+    return layout
+
+
+def _make_separator():
+    """创建控制栏中的竖线分隔符，样式由_STYLESHEET中的QLabel[cls="sep"]统一提供"""
+    separator = QLabel('|')
+    separator.setProperty('cls', 'sep')
+    return separator
+
+
+def _set_style_state(widget, state):
+    """设置控件的state属性并让_STYLESHEET中的[state="..."]规则重新生效，状态不变时跳过
+    
+    属性选择器不会随属性变化自动刷新，需要unpolish/polish；相比每次setStyleSheet不用重新解析样式表
+    """
+    if widget.property('state') == state:
+        return
+    widget.setProperty('state', state)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def _make_zoom_button(text, cls, tooltip, slot):
+    """创建曲线控制栏的坐标轴缩放按钮，样式由_STYLESHEET中的QPushButton[cls="zoomX"/"zoomY"]提供"""
+    button = QPushButton(text)
+    button.setMinimumWidth(50)
+    button.setMaximumWidth(65)
+    button.setMinimumHeight(28)
+    button.setProperty('cls', cls)
+    button.setToolTip(tooltip)
+    button.clicked.connect(slot)
+    return button
+
+
+# 已解析的快捷键：文本 -> QKeySequence，相同快捷键只解析一次
+_KEY_SEQUENCE_CACHE = {}
+
+
+def _key_sequence(text):
+    """返回快捷键文本对应的QKeySequence，首次使用时解析并缓存"""
+    sequence = _KEY_SEQUENCE_CACHE.get(text)
+    if sequence is None:
+        sequence = _KEY_SEQUENCE_CACHE[text] = QKeySequence(text)
+    return sequence
+
+
+# 固定选项的下拉框模型：选项元组 -> QStandardItemModel，同一组选项的下拉框共用一个模型
+_OPTION_MODEL_CACHE = {}
+
+
+def _option_model(items):
+    """返回选项元组对应的共享模型，首次使用时创建（下拉框均不可编辑，共用模型不会相互影响）"""
+    model = _OPTION_MODEL_CACHE.get(items)
+    if model is None:
+        model = _OPTION_MODEL_CACHE[items] = QStandardItemModel()
+        for text in items:
+            model.appendRow(QStandardItem(text))
+    return model
+
+
+# 状态圆点图：(颜色, 直径) -> QPixmap，位显示和位配置预览共用，绘制时直接贴图
+_DOT_PIXMAP_CACHE = {}
+
+
+def _dot_pixmap(color, size):
+    """返回指定颜色和直径的抗锯齿圆点图，首次使用时按屏幕像素比绘制并缓存（需在QApplication创建后调用）"""
+    key = (color, size)
+    pixmap = _DOT_PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        ratio = QApplication.instance().devicePixelRatio()
+        pixmap = QPixmap(round(size * ratio), round(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawEllipse(QRectF(0, 0, size, size))
+        painter.end()
+        _DOT_PIXMAP_CACHE[key] = pixmap
+    return pixmap
+
+
+class ProtocolConfigDialog(QDialog):
+    """数据协议配置对话框"""
+    
+    def __init__(self, parent=None, protocol_data=None):
+        super().__init__(parent)
+        self.setWindowTitle('配置数据协议')
+        self.setMinimumWidth(550)
+        self._data = None  # 点击确定时读取并校验通过的配置
+        
+        layout = QGridLayout(self)
+        
+        # 协议名称
+        layout.addWidget(QLabel('协议名称:'), 0, 0)
+        self.edit_name = QLineEdit()
+        self.edit_name.setPlaceholderText('例如: 数据类型1')
+        layout.addWidget(self.edit_name, 0, 1, 1, 3)
+        
+        # 帧头
+        layout.addWidget(QLabel('帧头(Hex):'), 1, 0)
+        hex_validator = QRegularExpressionValidator(QRegularExpression(_HEX_INPUT_PATTERN), self)
+        self.edit_header = QLineEdit()
+        self.edit_header.setPlaceholderText('例如: A8 A8 (用空格分隔)')
+        self.edit_header.setValidator(hex_validator)
+        layout.addWidget(self.edit_header, 1, 1, 1, 3)
+        
+        # 数据长度
+        layout.addWidget(QLabel('数据长度:'), 2, 0)
+        self.spin_length = QSpinBox()
+        self.spin_length.setRange(1, 1024)
+        self.spin_length.setValue(38)
+        self.spin_length.setSuffix(' 字节')
+        self.spin_length.setToolTip('完整帧的字节数(包含帧头帧尾)')
+        layout.addWidget(self.spin_length, 2, 1)
+        
+        # 帧尾
+        layout.addWidget(QLabel('帧尾(Hex):'), 2, 2)
+        self.edit_tail = QLineEdit()
+        self.edit_tail.setPlaceholderText('例如: AA AA (用空格分隔,无则留空)')
+        self.edit_tail.setValidator(hex_validator)
+        layout.addWidget(self.edit_tail, 2, 3)
+        
+        # CRC校验
         layout.addWidget(QLabel('CRC校验:'), 3, 0)
         self.combo_crc = QComboBox()
-        self.combo_crc.addItems(['无', 'CRC16-XMODEM', 'CRC16-CCITT', 'CRC16-MODBUS', '累加和', '异或'])
+        self.combo_crc.setModel(_option_model(_CRC_TYPES_PROTOCOL))
         layout.addWidget(self.combo_crc, 3, 1, 1, 3)
         
         # CRC位置说明
@@ -898,10 +1702,7 @@ class ProtocolConfigDialog(QDialog):
         layout.addWidget(self.check_enabled, 5, 0, 1, 4)
         
         # 按钮
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons, 6, 0, 1, 4)
+        layout.addWidget(_make_ok_cancel(self), 6, 0, 1, 4)
         
         # 加载现有数据
         if protocol_data:
@@ -911,34 +1712,49 @@ class ProtocolConfigDialog(QDialog):
         """加载协议数据到界面"""
         self.edit_name.setText(data.get('name', ''))
         header = data.get('header', [])
-        self.edit_header.setText(' '.join(f'{b:02X}' for b in header))
+        self.edit_header.setText(_bytes_to_hex_spaced(header))
         self.spin_length.setValue(data.get('length', 38))
         tail = data.get('tail', [])
-        self.edit_tail.setText(' '.join(f'{b:02X}' for b in tail))
-        self.combo_crc.setCurrentText(data.get('crc_type', '无'))
+        self.edit_tail.setText(_bytes_to_hex_spaced(tail))
+        index = _CRC_PROTOCOL_INDEX.get(data.get('crc_type', '无'))
+        if index is not None:
+            self.combo_crc.setCurrentIndex(index)
         self.check_enabled.setChecked(data.get('enabled', True))
     
+    def accept(self):
+        """点击确定时读取并校验配置，格式错误时保持对话框打开以便修改"""
+        data = self._read_data()
+        if data is not None:
+            self._data = data
+            super().accept()
+    
     def get_data(self):
-        """获取配置数据"""
+        """获取配置数据（确定时已读取，直接返回缓存结果）"""
+        if self._data is None:
+            return self._read_data()
+        return self._data
+    
+    def _read_data(self):
+        """从控件读取配置数据，格式错误时提示并返回None"""
         # 解析帧头
-        header_text = self.edit_header.text().strip()
+        header_text = _normalize_hex_tokens(self.edit_header.text())
         header = []
         if header_text:
-            try:
-                header = [int(b, 16) for b in header_text.split()]
-            except ValueError:
+            # 输入框已限制字符，单个数字已补足两位，这里只需检查每字节是否为两位（通过后bytes.fromhex不会抛出异常）
+            if not _HEX_TOKEN_RE.match(header_text):
                 QMessageBox.warning(self, '错误', '帧头格式错误,请使用十六进制格式(例如: A8 A8)')
                 return None
+            header = list(bytes.fromhex(header_text))
         
         # 解析帧尾
-        tail_text = self.edit_tail.text().strip()
+        tail_text = _normalize_hex_tokens(self.edit_tail.text())
         tail = []
         if tail_text:
-            try:
-                tail = [int(b, 16) for b in tail_text.split()]
-            except ValueError:
+            # 输入框已限制字符，单个数字已补足两位，这里只需检查每字节是否为两位（通过后bytes.fromhex不会抛出异常）
+            if not _HEX_TOKEN_RE.match(tail_text):
                 QMessageBox.warning(self, '错误', '帧尾格式错误,请使用十六进制格式(例如: AA AA)')
                 return None
+            tail = list(bytes.fromhex(tail_text))
         
         name = self.edit_name.text().strip()
         if not name:
@@ -946,11 +1762,11 @@ class ProtocolConfigDialog(QDialog):
             return None
         
         return {
-            'name': name,
+            'name': _intern_key(name),
             'header': header,
             'length': self.spin_length.value(),
             'tail': tail,
-            'crc_type': self.combo_crc.currentText(),
+            'crc_type': _intern_key(self.combo_crc.currentText()),
             'enabled': self.check_enabled.isChecked()
         }
 
@@ -975,10 +1791,8 @@ class CustomDisplayDialog(QDialog):
         # 协议类型选择
         layout.addWidget(QLabel('数据协议:'), 0, 3)
         self.combo_protocol = QComboBox()
-        self.combo_protocol.addItem('默认协议', None)
-        for proto in self.protocol_list:
-            if proto and proto.get('enabled', True):
-                self.combo_protocol.addItem(proto.get('name', '未命名'), proto.get('name'))
+        # 协议名 -> 下拉框索引，加载数据时直接查表
+        self._proto_index = _populate_protocol_combo(self.combo_protocol, self.protocol_list)
         self.combo_protocol.setToolTip('选择数据来源协议')
         layout.addWidget(self.combo_protocol, 0, 4, 1, 2)
         
@@ -1001,9 +1815,7 @@ class CustomDisplayDialog(QDialog):
         # 数据类型
         layout.addWidget(QLabel('数据类型:'), 2, 0)
         self.combo_data_type = QComboBox()
-        self.combo_data_type.addItems(['uint16 (LE)', 'uint16 (BE)', 'int16 (LE)', 'int16 (BE)',
-                                       'uint32 (LE)', 'uint32 (BE)', 'int32 (LE)', 'int32 (BE)',
-                                       'float (LE)', 'float (BE)', 'uint8', 'int8', 'string (ASCII)'])
+        self.combo_data_type.setModel(_option_model(_DATA_TYPES_DISPLAY))
         layout.addWidget(self.combo_data_type, 2, 1, 1, 3)
         
         # 乘系数
@@ -1055,10 +1867,7 @@ class CustomDisplayDialog(QDialog):
         layout.addWidget(self.check_enabled, 7, 0, 1, 4)
         
         # 按钮
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons, 8, 0, 1, 4)
+        layout.addWidget(_make_ok_cancel(self), 8, 0, 1, 4)
         
         # 加载数据
         if display_data:
@@ -1066,16 +1875,15 @@ class CustomDisplayDialog(QDialog):
             
             # 设置协议
             protocol = display_data.get('protocol', None)
-            for i in range(self.combo_protocol.count()):
-                if self.combo_protocol.itemData(i) == protocol:
-                    self.combo_protocol.setCurrentIndex(i)
-                    break
+            index = self._proto_index.get(protocol)
+            if index is not None:
+                self.combo_protocol.setCurrentIndex(index)
             
             self.spin_start_byte.setValue(display_data.get('start_byte', 2))
             self.spin_byte_count.setValue(display_data.get('byte_count', 2))
             data_type = display_data.get('data_type', 'uint16 (LE)')
-            index = self.combo_data_type.findText(data_type)
-            if index >= 0:
+            index = _DISPLAY_DATA_TYPE_INDEX.get(data_type)
+            if index is not None:
                 self.combo_data_type.setCurrentIndex(index)
             self.spin_coefficient.setValue(display_data.get('coefficient', 1.0))
             self.spin_divisor.setValue(display_data.get('divisor', 1.0))
@@ -1087,10 +1895,10 @@ class CustomDisplayDialog(QDialog):
     def get_data(self):
         return {
             'name': self.edit_name.text(),
-            'protocol': self.combo_protocol.currentData(),
+            'protocol': _intern_key(self.combo_protocol.currentData()),
             'start_byte': self.spin_start_byte.value(),
             'byte_count': self.spin_byte_count.value(),
-            'data_type': self.combo_data_type.currentText(),
+            'data_type': _intern_key(self.combo_data_type.currentText()),
             'coefficient': self.spin_coefficient.value(),
             'divisor': self.spin_divisor.value(),
             'offset': self.spin_offset.value(),
@@ -1120,10 +1928,8 @@ class CurveConfigDialog(QDialog):
         # 协议类型选择
         layout.addWidget(QLabel('数据协议:'), 0, 3)
         self.combo_protocol = QComboBox()
-        self.combo_protocol.addItem('默认协议', None)
-        for proto in self.protocol_list:
-            if proto and proto.get('enabled', True):
-                self.combo_protocol.addItem(proto.get('name', '未命名'), proto.get('name'))
+        # 协议名 -> 下拉框索引，加载数据时直接查表
+        self._proto_index = _populate_protocol_combo(self.combo_protocol, self.protocol_list)
         self.combo_protocol.setToolTip('选择数据来源协议')
         layout.addWidget(self.combo_protocol, 0, 4, 1, 2)
         
@@ -1157,13 +1963,8 @@ class CurveConfigDialog(QDialog):
         # 数据类型
         layout.addWidget(QLabel('数据类型:'), 2, 0)
         self.combo_data_type = QComboBox()
-        self.combo_data_type.addItems([
-            'uint8', 'int8',
-            'uint16 (LE)', 'uint16 (BE)', 'int16 (LE)', 'int16 (BE)',
-            'uint32 (LE)', 'uint32 (BE)', 'int32 (LE)', 'int32 (BE)',
-            'float (LE)', 'float (BE)', 'double (LE)', 'double (BE)'
-        ])
-        self.combo_data_type.setCurrentText('uint16 (LE)')
+        self.combo_data_type.setModel(_option_model(_DATA_TYPES_CURVE))
+        self.combo_data_type.setCurrentIndex(_DATA_TYPE_INDEX['uint16 (LE)'])
         layout.addWidget(self.combo_data_type, 2, 1, 1, 3)
         
         # 位选择器（仅在位模式下显示）
@@ -1175,6 +1976,11 @@ class CurveConfigDialog(QDialog):
         self.spin_bit_index.setEnabled(False)
         layout.addWidget(self.spin_bit_index, 2, 5)
         
+        # 位模式切换时需要启用/禁用的控件：(控件, 位模式下是否启用)
+        self._bit_mode_targets = ((self.spin_bit_index, True),
+                                  (self.combo_data_type, False),
+                                  (self.spin_byte_count, False))
+        
         # 乘系数
         label_coef = QLabel('乘系数:')
         label_coef.setMinimumWidth(80)
@@ -1218,7 +2024,7 @@ class CurveConfigDialog(QDialog):
         # 颜色选择
         layout.addWidget(QLabel('曲线颜色:'), 5, 0)
         self.combo_color = QComboBox()
-        self.combo_color.addItems(['蓝色', '绿色', '红色', '橙色', '紫色', '青色', '品红'])
+        self.combo_color.setModel(_option_model(_COLOR_NAMES))
         layout.addWidget(self.combo_color, 5, 1, 1, 3)
         
         # 启用/禁用
@@ -1234,10 +2040,7 @@ class CurveConfigDialog(QDialog):
         layout.addWidget(self.check_record, 6, 2, 1, 2)
         
         # 按钮
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons, 7, 0, 1, 4)
+        layout.addWidget(_make_ok_cancel(self), 7, 0, 1, 4)
         
         # 加载数据
         if curve_data:
@@ -1245,24 +2048,23 @@ class CurveConfigDialog(QDialog):
             
             # 设置协议
             protocol = curve_data.get('protocol', None)
-            for i in range(self.combo_protocol.count()):
-                if self.combo_protocol.itemData(i) == protocol:
-                    self.combo_protocol.setCurrentIndex(i)
-                    break
+            index = self._proto_index.get(protocol)
+            if index is not None:
+                self.combo_protocol.setCurrentIndex(index)
             
             self.spin_start_byte.setValue(curve_data.get('start_byte', 2))
             self.spin_byte_count.setValue(curve_data.get('byte_count', 2))
             data_type = curve_data.get('data_type', 'uint16 (LE)')
-            index = self.combo_data_type.findText(data_type)
-            if index >= 0:
+            index = _DATA_TYPE_INDEX.get(data_type)
+            if index is not None:
                 self.combo_data_type.setCurrentIndex(index)
             self.spin_coefficient.setValue(curve_data.get('coefficient', 1.0))
             self.spin_divisor.setValue(curve_data.get('divisor', 1.0))
             self.spin_offset.setValue(curve_data.get('offset', 0.0))
             self.edit_unit.setText(curve_data.get('unit', ''))
             color = curve_data.get('color', '蓝色')
-            index = self.combo_color.findText(color)
-            if index >= 0:
+            index = _COLOR_INDEX.get(color)
+            if index is not None:
                 self.combo_color.setCurrentIndex(index)
             self.check_enabled.setChecked(curve_data.get('enabled', True))
             
@@ -1277,9 +2079,8 @@ class CurveConfigDialog(QDialog):
     
     def on_bit_mode_toggled(self, checked):
         """位模式切换时的处理"""
-        self.spin_bit_index.setEnabled(checked)
-        self.combo_data_type.setEnabled(not checked)
-        self.spin_byte_count.setEnabled(not checked)
+        for widget, enabled_in_bit_mode in self._bit_mode_targets:
+            widget.setEnabled(checked == enabled_in_bit_mode)
         if checked:
             # 启用位模式时，强制设置为1字节
             self.spin_byte_count.setValue(1)
@@ -1287,10 +2088,10 @@ class CurveConfigDialog(QDialog):
     def get_data(self):
         return {
             'name': self.edit_name.text(),
-            'protocol': self.combo_protocol.currentData(),
+            'protocol': _intern_key(self.combo_protocol.currentData()),
             'start_byte': self.spin_start_byte.value(),
             'byte_count': self.spin_byte_count.value(),
-            'data_type': self.combo_data_type.currentText(),
+            'data_type': _intern_key(self.combo_data_type.currentText()),
             'coefficient': self.spin_coefficient.value(),
             'divisor': self.spin_divisor.value(),
             'offset': self.spin_offset.value(),
@@ -1303,6 +2104,17 @@ class CurveConfigDialog(QDialog):
         }
 
 
+# 接收时钟字段：(字段名, 标签, 默认起始字节)，字段名对应配置键 '<字段名>_start'
+_CLOCK_FIELDS = (
+    ('year', '年份起始字节:', 10),
+    ('month', '月份起始字节:', 12),
+    ('day', '日期起始字节:', 13),
+    ('hour', '小时起始字节:', 14),
+    ('minute', '分钟起始字节:', 15),
+    ('second', '秒数起始字节:', 16),
+)
+
+
 class ClockConfigDialog(QDialog):
     """接收时钟配置对话框"""
     
@@ -1317,90 +2129,36 @@ class ClockConfigDialog(QDialog):
         # 协议类型选择
         layout.addWidget(QLabel('数据协议:'), 0, 0)
         self.combo_protocol = QComboBox()
-        self.combo_protocol.addItem('默认协议', None)
-        for proto in self.protocol_list:
-            if proto and proto.get('enabled', True):
-                self.combo_protocol.addItem(proto.get('name', '未命名'), proto.get('name'))
+        # 协议名 -> 下拉框索引，加载数据时直接查表
+        self._proto_index = _populate_protocol_combo(self.combo_protocol, self.protocol_list)
         self.combo_protocol.setToolTip('选择数据来源协议')
         layout.addWidget(self.combo_protocol, 0, 1, 1, 5)
         
-        # 年配置
-        layout.addWidget(QLabel('年份起始字节:'), 1, 0)
-        self.spin_year_start = QSpinBox()
-        self.spin_year_start.setRange(0, 100)
-        self.spin_year_start.setValue(10)
-        layout.addWidget(self.spin_year_start, 1, 1)
-        
-        layout.addWidget(QLabel('字节数:'), 1, 2)
-        self.spin_year_count = QSpinBox()
-        self.spin_year_count.setRange(1, 4)
-        self.spin_year_count.setValue(2)
-        layout.addWidget(self.spin_year_count, 1, 3)
-        
-        layout.addWidget(QLabel('数据类型:'), 1, 4)
-        self.combo_year_type = QComboBox()
-        self.combo_year_type.addItems(['uint16 (LE)', 'uint16 (BE)', 'uint8'])
-        layout.addWidget(self.combo_year_type, 1, 5)
-        
-        # 月配置
-        layout.addWidget(QLabel('月份起始字节:'), 2, 0)
-        self.spin_month_start = QSpinBox()
-        self.spin_month_start.setRange(0, 100)
-        self.spin_month_start.setValue(12)
-        layout.addWidget(self.spin_month_start, 2, 1)
-        
-        layout.addWidget(QLabel('数据类型:'), 2, 2)
-        self.combo_month_type = QComboBox()
-        self.combo_month_type.addItems(['uint8'])
-        layout.addWidget(self.combo_month_type, 2, 3, 1, 3)
-        
-        # 日配置
-        layout.addWidget(QLabel('日期起始字节:'), 3, 0)
-        self.spin_day_start = QSpinBox()
-        self.spin_day_start.setRange(0, 100)
-        self.spin_day_start.setValue(13)
-        layout.addWidget(self.spin_day_start, 3, 1)
-        
-        layout.addWidget(QLabel('数据类型:'), 3, 2)
-        self.combo_day_type = QComboBox()
-        self.combo_day_type.addItems(['uint8'])
-        layout.addWidget(self.combo_day_type, 3, 3, 1, 3)
-        
-        # 时配置
-        layout.addWidget(QLabel('小时起始字节:'), 4, 0)
-        self.spin_hour_start = QSpinBox()
-        self.spin_hour_start.setRange(0, 100)
-        self.spin_hour_start.setValue(14)
-        layout.addWidget(self.spin_hour_start, 4, 1)
-        
-        layout.addWidget(QLabel('数据类型:'), 4, 2)
-        self.combo_hour_type = QComboBox()
-        self.combo_hour_type.addItems(['uint8'])
-        layout.addWidget(self.combo_hour_type, 4, 3, 1, 3)
-        
-        # 分配置
-        layout.addWidget(QLabel('分钟起始字节:'), 5, 0)
-        self.spin_minute_start = QSpinBox()
-        self.spin_minute_start.setRange(0, 100)
-        self.spin_minute_start.setValue(15)
-        layout.addWidget(self.spin_minute_start, 5, 1)
-        
-        layout.addWidget(QLabel('数据类型:'), 5, 2)
-        self.combo_minute_type = QComboBox()
-        self.combo_minute_type.addItems(['uint8'])
-        layout.addWidget(self.combo_minute_type, 5, 3, 1, 3)
-        
-        # 秒配置
-        layout.addWidget(QLabel('秒数起始字节:'), 6, 0)
-        self.spin_second_start = QSpinBox()
-        self.spin_second_start.setRange(0, 100)
-        self.spin_second_start.setValue(16)
-        layout.addWidget(self.spin_second_start, 6, 1)
-        
-        layout.addWidget(QLabel('数据类型:'), 6, 2)
-        self.combo_second_type = QComboBox()
-        self.combo_second_type.addItems(['uint8'])
-        layout.addWidget(self.combo_second_type, 6, 3, 1, 3)
+        # 年/月/日/时/分/秒配置（仅年份可设置字节数和数据类型，其余固定为uint8）
+        for row, (field, label, default_start) in enumerate(_CLOCK_FIELDS, start=1):
+            layout.addWidget(QLabel(label), row, 0)
+            spin_start = QSpinBox()
+            spin_start.setRange(0, 100)
+            spin_start.setValue(default_start)
+            setattr(self, f'spin_{field}_start', spin_start)
+            layout.addWidget(spin_start, row, 1)
+            
+            combo_type = QComboBox()
+            setattr(self, f'combo_{field}_type', combo_type)
+            if field == 'year':
+                layout.addWidget(QLabel('字节数:'), row, 2)
+                self.spin_year_count = QSpinBox()
+                self.spin_year_count.setRange(1, 4)
+                self.spin_year_count.setValue(2)
+                layout.addWidget(self.spin_year_count, row, 3)
+                
+                layout.addWidget(QLabel('数据类型:'), row, 4)
+                combo_type.setModel(_option_model(_CLOCK_YEAR_TYPES))
+                layout.addWidget(combo_type, row, 5)
+            else:
+                layout.addWidget(QLabel('数据类型:'), row, 2)
+                combo_type.addItem('uint8')
+                layout.addWidget(combo_type, row, 3, 1, 3)
         
         # 启用复选框
         self.check_enabled = QCheckBox('启用接收时钟')
@@ -1408,43 +2166,32 @@ class ClockConfigDialog(QDialog):
         layout.addWidget(self.check_enabled, 7, 0, 1, 6)
         
         # 按钮
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons, 8, 0, 1, 6)
+        layout.addWidget(_make_ok_cancel(self), 8, 0, 1, 6)
         
         # 加载数据
         if clock_data:
             # 设置协议
             protocol = clock_data.get('protocol', None)
-            for i in range(self.combo_protocol.count()):
-                if self.combo_protocol.itemData(i) == protocol:
-                    self.combo_protocol.setCurrentIndex(i)
-                    break
+            index = self._proto_index.get(protocol)
+            if index is not None:
+                self.combo_protocol.setCurrentIndex(index)
             
-            self.spin_year_start.setValue(clock_data.get('year_start', 10))
+            for field, _, default_start in _CLOCK_FIELDS:
+                getattr(self, f'spin_{field}_start').setValue(
+                    clock_data.get(f'{field}_start', default_start))
             self.spin_year_count.setValue(clock_data.get('year_count', 2))
             self.combo_year_type.setCurrentText(clock_data.get('year_type', 'uint16 (LE)'))
-            self.spin_month_start.setValue(clock_data.get('month_start', 12))
-            self.spin_day_start.setValue(clock_data.get('day_start', 13))
-            self.spin_hour_start.setValue(clock_data.get('hour_start', 14))
-            self.spin_minute_start.setValue(clock_data.get('minute_start', 15))
-            self.spin_second_start.setValue(clock_data.get('second_start', 16))
             self.check_enabled.setChecked(clock_data.get('enabled', True))
     
     def get_data(self):
-        return {
-            'protocol': self.combo_protocol.currentData(),
-            'year_start': self.spin_year_start.value(),
-            'year_count': self.spin_year_count.value(),
-            'year_type': self.combo_year_type.currentText(),
-            'month_start': self.spin_month_start.value(),
-            'day_start': self.spin_day_start.value(),
-            'hour_start': self.spin_hour_start.value(),
-            'minute_start': self.spin_minute_start.value(),
-            'second_start': self.spin_second_start.value(),
-            'enabled': self.check_enabled.isChecked()
-        }
+        data = {'protocol': _intern_key(self.combo_protocol.currentData())}
+        for field, _, _ in _CLOCK_FIELDS:
+            data[f'{field}_start'] = getattr(self, f'spin_{field}_start').value()
+            if field == 'year':
+                data['year_count'] = self.spin_year_count.value()
+                data['year_type'] = self.combo_year_type.currentText()
+        data['enabled'] = self.check_enabled.isChecked()
+        return data
 
 
 class PresetCommandDialog(QDialog):
@@ -1480,7 +2227,7 @@ class PresetCommandDialog(QDialog):
         # CRC校验
         layout.addWidget(QLabel('CRC校验:'), 3, 0)
         self.combo_crc = QComboBox()
-        self.combo_crc.addItems(['无', 'CCITT-CRC16', 'Modbus-CRC16', 'CRC16-XMODEM', '累加和', '异或'])
+        self.combo_crc.setModel(_option_model(_CRC_TYPES_PRESET))
         layout.addWidget(self.combo_crc, 3, 1, 1, 2)
         
         # 周期发送
@@ -1522,10 +2269,7 @@ class PresetCommandDialog(QDialog):
         layout.addLayout(range_layout, 5, 2)
         
         # 按钮
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons, 6, 0, 1, 3)
+        layout.addWidget(_make_ok_cancel(self), 6, 0, 1, 3)
         
         # 加载数据
         if preset_data:
@@ -1534,8 +2278,8 @@ class PresetCommandDialog(QDialog):
             self.check_hex.setChecked(preset_data.get('is_hex', False))
             self.check_timestamp.setChecked(preset_data.get('add_timestamp', False))
             crc_type = preset_data.get('crc_type', '无')
-            index = self.combo_crc.findText(crc_type)
-            if index >= 0:
+            index = _CRC_PRESET_INDEX.get(crc_type)
+            if index is not None:
                 self.combo_crc.setCurrentIndex(index)
             self.check_periodic.setChecked(preset_data.get('periodic', False))
             self.spin_period.setValue(preset_data.get('period', 1.0))
@@ -1556,7 +2300,7 @@ class PresetCommandDialog(QDialog):
             'command': self.edit_command.text(),
             'is_hex': self.check_hex.isChecked(),
             'add_timestamp': self.check_timestamp.isChecked(),
-            'crc_type': self.combo_crc.currentText(),
+            'crc_type': _intern_key(self.combo_crc.currentText()),
             'periodic': self.check_periodic.isChecked(),
             'period': self.spin_period.value(),
             'data_fill_enabled': self.check_data_fill.isChecked(),
@@ -1590,10 +2334,8 @@ class BitDisplayDialog(QDialog):
         # 协议类型选择
         basic_layout.addWidget(QLabel('数据协议:'), 1, 0)
         self.combo_protocol = QComboBox()
-        self.combo_protocol.addItem('默认协议', None)
-        for proto in self.protocol_list:
-            if proto and proto.get('enabled', True):
-                self.combo_protocol.addItem(proto.get('name', '未命名'), proto.get('name'))
+        # 协议名 -> 下拉框索引，加载数据时直接查表
+        self._proto_index = _populate_protocol_combo(self.combo_protocol, self.protocol_list)
         self.combo_protocol.setToolTip('选择数据来源协议')
         basic_layout.addWidget(self.combo_protocol, 1, 1, 1, 2)
         
@@ -1610,14 +2352,17 @@ class BitDisplayDialog(QDialog):
         
         # 位配置区域
         bits_group = QGroupBox('位(Bit)配置 - 设置每个位对应的图标名称')
+        # 8行共用组上的一份样式规则，按objectName匹配，不再逐个控件设置样式表
+        bits_group.setStyleSheet(
+            'QLabel#bitName { font-weight: bold; }')
         bits_layout = QGridLayout()
         bits_layout.setSpacing(6)
         
-        self.bit_name_edits = []
+        self.bit_name_edits = [None] * 8
         for i in range(8):
             # Bit标签
             bit_label = QLabel(f'Bit {i}:')
-            bit_label.setStyleSheet('font-weight: bold;')
+            bit_label.setObjectName('bitName')
             bits_layout.addWidget(bit_label, i, 0)
             
             # 名称输入框
@@ -1626,13 +2371,13 @@ class BitDisplayDialog(QDialog):
             bits_layout.addWidget(name_edit, i, 1)
             
             # 状态预览标签
-            status_label = QLabel('●')
-            status_label.setStyleSheet('color: #ccc; font-size: 18pt;')
+            status_label = QLabel()
+            status_label.setPixmap(_dot_pixmap('#ccc', 16))
             status_label.setAlignment(Qt.AlignCenter)
             status_label.setMinimumWidth(30)
             bits_layout.addWidget(status_label, i, 2)
             
-            self.bit_name_edits.append(name_edit)
+            self.bit_name_edits[i] = name_edit
         
         bits_group.setLayout(bits_layout)
         layout.addWidget(bits_group)
@@ -1648,10 +2393,7 @@ class BitDisplayDialog(QDialog):
         layout.addWidget(tip_label)
         
         # 按钮
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
+        layout.addWidget(_make_ok_cancel(self))
         
         # 加载数据
         if bit_display_data:
@@ -1659,10 +2401,9 @@ class BitDisplayDialog(QDialog):
             
             # 设置协议
             protocol = bit_display_data.get('protocol', None)
-            for i in range(self.combo_protocol.count()):
-                if self.combo_protocol.itemData(i) == protocol:
-                    self.combo_protocol.setCurrentIndex(i)
-                    break
+            index = self._proto_index.get(protocol)
+            if index is not None:
+                self.combo_protocol.setCurrentIndex(index)
             
             self.spin_target_byte.setValue(bit_display_data.get('target_byte', 17))
             bit_names = bit_display_data.get('bit_names', [''] * 8)
@@ -1674,13 +2415,22 @@ class BitDisplayDialog(QDialog):
         bit_names = [edit.text() for edit in self.bit_name_edits]
         return {
             'name': self.edit_name.text(),
-            'protocol': self.combo_protocol.currentData(),
+            'protocol': _intern_key(self.combo_protocol.currentData()),
             'target_byte': self.spin_target_byte.value(),
             'bit_names': bit_names,
             'enabled': self.check_enabled.isChecked()
         }
 
 
+# 串口参数字段：(参数名, 标签, 选项, 默认值)
+_SERIAL_PARAM_FIELDS = (
+    ('baudrate', '波特率:', _BAUD_RATES, '115200'),
+    ('databits', '数据位:', _DATA_BITS, '8'),
+    ('stopbits', '停止位:', _STOP_BITS, '1'),
+    ('parity', '校验位:', _PARITIES, 'None'),
+)
+
+
 class SerialParamsDialog(QDialog):
     """串口参数配置对话框"""
     
@@ -1692,77 +2442,906 @@ class SerialParamsDialog(QDialog):
         layout = QVBoxLayout()
         layout.setSpacing(10)
         
-        # 参数设置组
+        # 参数设置组：按字段表逐行创建下拉框
         params_group = QGroupBox('串口参数')
-        params_layout = QGridLayout()
+        params_layout = QFormLayout()
         params_layout.setSpacing(8)
-        
-        # 波特率
-        params_layout.addWidget(QLabel("波特率:"), 0, 0)
-        self.combo_baudrate = QComboBox()
-        self.combo_baudrate.setMinimumHeight(28)
-        self.combo_baudrate.addItems(['2400', '4800', '9600', '14400', '19200', '38400', 
-                                      '57600', '115200', '128000', '256000', '460800', '921600'])
-        self.combo_baudrate.setCurrentText('115200')
-        params_layout.addWidget(self.combo_baudrate, 0, 1)
-        
-        # 数据位
-        params_layout.addWidget(QLabel("数据位:"), 1, 0)
-        self.combo_databits = QComboBox()
-        self.combo_databits.setMinimumHeight(28)
-        self.combo_databits.addItems(['5', '6', '7', '8'])
-        self.combo_databits.setCurrentText('8')
-        params_layout.addWidget(self.combo_databits, 1, 1)
-        
-        # 停止位
-        params_layout.addWidget(QLabel("停止位:"), 2, 0)
-        self.combo_stopbits = QComboBox()
-        self.combo_stopbits.setMinimumHeight(28)
-        self.combo_stopbits.addItems(['1', '1.5', '2'])
-        self.combo_stopbits.setCurrentText('1')
-        params_layout.addWidget(self.combo_stopbits, 2, 1)
-        
-        # 校验位
-        params_layout.addWidget(QLabel("校验位:"), 3, 0)
-        self.combo_parity = QComboBox()
-        self.combo_parity.setMinimumHeight(28)
-        self.combo_parity.addItems(['None', 'Even', 'Odd', 'Mark', 'Space'])
-        self.combo_parity.setCurrentText('None')
-        params_layout.addWidget(self.combo_parity, 3, 1)
+        current_params = current_params or {}
+        self.combos = {}  # 参数名 -> 下拉框
+        for key, label, items, default in _SERIAL_PARAM_FIELDS:
+            combo = QComboBox()
+            combo.setMinimumHeight(28)
+            combo.setModel(_option_model(items))
+            combo.setCurrentText(default)
+            if key in current_params:
+                combo.setCurrentText(str(current_params[key]))  # 不在选项中的值保持默认
+            self.combos[key] = combo
+            setattr(self, f'combo_{key}', combo)
+            params_layout.addRow(label, combo)
         
         params_group.setLayout(params_layout)
         layout.addWidget(params_group)
         
-        # 加载当前参数
-        if current_params:
-            self.combo_baudrate.setCurrentText(str(current_params.get('baudrate', '115200')))
-            self.combo_databits.setCurrentText(str(current_params.get('databits', '8')))
-            self.combo_stopbits.setCurrentText(str(current_params.get('stopbits', '1')))
-            self.combo_parity.setCurrentText(str(current_params.get('parity', 'None')))
-        
         # 按钮
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
+        layout.addWidget(_make_ok_cancel(self))
         
         self.setLayout(layout)
     
     def get_params(self):
         """获取配置参数"""
-        return {
-            'baudrate': self.combo_baudrate.currentText(),
-            'databits': self.combo_databits.currentText(),
-            'stopbits': self.combo_stopbits.currentText(),
-            'parity': self.combo_parity.currentText()
-        }
+        return {key: combo.currentText() for key, combo in self.combos.items()}
+
+
+# 应用样式表 - Apple毛玻璃风格 (白色玻璃质感 - 终极优化版)
+# 注意：QMainWindow 不设置背景，让 QPalette 控制（用于背景图片功能）
+_STYLESHEET = """
+    /* 全局字体与颜色 - 优化抗锯齿 */
+    QWidget {
+        font-family: "Microsoft YaHei UI", "Segoe UI", sans-serif;
+        color: #1d1d1f;
+        outline: none;
+    }
+    
+    /* ToolTip - 现代深色风格 */
+    QToolTip {
+        background-color: rgba(30, 30, 30, 0.9);
+        color: #fff;
+        border: 1px solid rgba(255, 255, 255, 0.1);
+        border-radius: 6px;
+        padding: 6px;
+        font-size: 9pt;
+    }
+    
+    QMainWindow {
+        /* 背景由 QPalette 控制 */
+    }
+    
+    /* 滚动区域透明，透出背景图 */
+    QScrollArea, QScrollArea > QWidget > QWidget {
+        background-color: transparent;
+        border: none;
+    }
+
+    /* QGroupBox - 玻璃拟态 (Glassmorphism) 增强 */
+    QGroupBox {
+        background-color: rgba(255, 255, 255, 0.6);
+        border: 1px solid rgba(255, 255, 255, 0.8);
+        border-bottom: 1px solid rgba(0, 0, 0, 0.08);
+        border-right: 1px solid rgba(0, 0, 0, 0.04);
+        border-radius: 16px;
+        margin-top: 12px;
+        padding: 20px 12px 12px 12px;
+        font-weight: 600;
+        font-size: 10pt;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 8px;
+        background-color: transparent;
+        color: #1d1d1f;
+        left: 12px;
+        top: 2px;
+    }
+    
+    /* QPushButton - 增强立体质感与微交互 */
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                              stop:0 rgba(255, 255, 255, 0.85),
+                              stop:1 rgba(242, 242, 247, 0.75));
+        color: #1d1d1f;
+        border: 1px solid rgba(0, 0, 0, 0.08);
+        border-bottom: 1px solid rgba(0, 0, 0, 0.15); /* 底部更深，模拟立体感 */
+        border-radius: 8px;
+        padding: 6px 16px;
+        font-size: 9pt;
+        font-weight: 600;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                              stop:0 rgba(255, 255, 255, 0.95),
+                              stop:1 rgba(250, 250, 255, 0.9));
+        border-color: rgba(0, 0, 0, 0.12);
+        border-bottom-color: rgba(0, 0, 0, 0.18);
+    }
+    QPushButton:pressed {
+        background-color: rgba(230, 230, 235, 0.9);
+        border: 1px solid rgba(0, 0, 0, 0.1);
+        border-top: 1px solid rgba(0, 0, 0, 0.15); /* 按下时顶部阴影 */
+        padding-top: 7px;
+        padding-bottom: 5px;
+    }
+    QPushButton:disabled {
+        background-color: rgba(255, 255, 255, 0.3);
+        color: rgba(29, 29, 31, 0.3);
+        border: 1px solid rgba(0, 0, 0, 0.05);
+    }
+    
+    /* 输入控件 - 优化光标与边框 */
+    QTextEdit, QPlainTextEdit, QLineEdit {
+        background-color: rgba(255, 255, 255, 0.5);
+        border: 1px solid rgba(0, 0, 0, 0.06);
+        border-bottom: 1px solid rgba(0, 0, 0, 0.12);
+        border-radius: 8px;
+        padding: 6px;
+        selection-background-color: rgba(0, 122, 255, 0.3);
+        selection-color: #000;
+    }
+    QTextEdit:focus, QPlainTextEdit:focus, QLineEdit:focus {
+        background-color: rgba(255, 255, 255, 0.95);
+        border: 1px solid #007AFF;
+        border-bottom: 1px solid #007AFF;
+    }
+    
+    /* 下拉框 - 增加渐变与阴影 */
+    QComboBox {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                              stop:0 rgba(255, 255, 255, 0.7),
+                              stop:1 rgba(245, 245, 250, 0.6));
+        border: 1px solid rgba(0, 0, 0, 0.06);
+        border-bottom: 1px solid rgba(0, 0, 0, 0.12);
+        border-radius: 8px;
+        padding: 4px 10px;
+        min-height: 24px;
+    }
+    QComboBox:hover {
+        background-color: rgba(255, 255, 255, 0.9);
+        border-color: rgba(0, 0, 0, 0.1);
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 24px;
+    }
+    QComboBox::down-arrow {
+        image: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><path d="M2 3 L5 6 L8 3" fill="none" stroke="#333" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/></svg>');
+        width: 12px;
+        height: 12px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: rgba(255, 255, 255, 0.95);
+        border: 1px solid rgba(0, 0, 0, 0.08);
+        border-radius: 8px;
+        outline: none;
+        padding: 4px;
+        selection-background-color: #007AFF;
+        selection-color: white;
+    }
+    
+    /* 数字输入框 */
+    QSpinBox, QDoubleSpinBox {
+        background-color: rgba(255, 255, 255, 0.5);
+        border: 1px solid rgba(0, 0, 0, 0.06);
+        border-bottom: 1px solid rgba(0, 0, 0, 0.12);
+        border-radius: 8px;
+        padding: 4px;
+        padding-right: 15px;
+    }
+    QSpinBox:focus, QDoubleSpinBox:focus {
+        background-color: rgba(255, 255, 255, 0.95);
+        border: 1px solid #007AFF;
+    }
+    QSpinBox::up-button, QDoubleSpinBox::up-button,
+    QSpinBox::down-button, QDoubleSpinBox::down-button {
+        background-color: rgba(0, 0, 0, 0.03);
+        border: none;
+        width: 18px;
+        margin: 1px;
+        border-radius: 4px;
+    }
+    QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover,
+    QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {
+        background-color: rgba(0, 0, 0, 0.1);
+    }
+    
+    QSpinBox::up-arrow, QDoubleSpinBox::up-arrow {
+        image: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><path d="M2 7 L5 4 L8 7" fill="none" stroke="#000" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/></svg>');
+        width: 10px;
+        height: 10px;
+    }
+    QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {
+        image: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><path d="M2 3 L5 6 L8 3" fill="none" stroke="#000" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/></svg>');
+        width: 10px;
+        height: 10px;
+    }
+    
+    /* 复选框 - 优化选中态 */
+    QCheckBox {
+        spacing: 8px;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border-radius: 5px;
+        border: 1px solid rgba(0, 0, 0, 0.15);
+        background-color: rgba(255, 255, 255, 0.8);
+    }
+    QCheckBox::indicator:checked {
+        background-color: #007AFF;
+        border-color: #007AFF;
+        image: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="12" height="12"><path d="M2 6 L5 9 L10 3" fill="none" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/></svg>');
+    }
+    QCheckBox::indicator:hover {
+        border-color: #007AFF;
+        background-color: #fff;
+    }
+    
+    /* Dock Widget - 标题栏优化 */
+    QDockWidget {
+        titlebar-close-icon: url(close.png);
+        titlebar-normal-icon: url(float.png);
+    }
+    QDockWidget::title {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                              stop:0 rgba(255, 255, 255, 0.8),
+                              stop:1 rgba(245, 245, 250, 0.8));
+        border-bottom: 1px solid rgba(0, 0, 0, 0.08);
+        padding: 8px 12px;
+        border-top-left-radius: 12px;
+        border-top-right-radius: 12px;
+        font-weight: 600;
+    }
+    QDockWidget::close-button, QDockWidget::float-button {
+        background: transparent;
+        border-radius: 4px;
+        padding: 2px;
+    }
+    QDockWidget::close-button:hover, QDockWidget::float-button:hover {
+        background: rgba(0, 0, 0, 0.1);
+    }
+    
+    /* 分割器手柄 */
+    QSplitter::handle {
+        background-color: rgba(0, 0, 0, 0.03);
+        margin: 1px;
+    }
+    QSplitter::handle:hover {
+        background-color: rgba(0, 122, 255, 0.2);
+    }
+    
+    /* 滚动条 - iOS 风格悬浮滚动条 */
+    QScrollBar:vertical {
+        background: transparent;
+        width: 10px;
+        margin: 0;
+    }
+    QScrollBar::handle:vertical {
+        background: rgba(0, 0, 0, 0.15);
+        border-radius: 5px;
+        min-height: 40px;
+        margin: 2px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: rgba(0, 0, 0, 0.35);
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0;
+    }
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: none;
+    }
+    QScrollBar:horizontal {
+        background: transparent;
+        height: 10px;
+        margin: 0;
+    }
+    QScrollBar::handle:horizontal {
+        background: rgba(0, 0, 0, 0.15);
+        border-radius: 5px;
+        min-width: 40px;
+        margin: 2px;
+    }
+    QScrollBar::handle:horizontal:hover {
+        background: rgba(0, 0, 0, 0.35);
+    }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        width: 0;
+    }
+    QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+        background: none;
+    }
+
+    /* 菜单栏 */
+    QMenuBar {
+        background-color: rgba(255, 255, 255, 0.8);
+        border-bottom: 1px solid rgba(0, 0, 0, 0.05);
+    }
+    QMenuBar::item {
+        background: transparent;
+        padding: 6px 12px;
+    }
+    QMenuBar::item:selected {
+        background-color: rgba(0, 0, 0, 0.05);
+        border-radius: 4px;
+    }
+    QMenu {
+        background-color: rgba(255, 255, 255, 0.98);
+        border: 1px solid rgba(0, 0, 0, 0.08);
+        border-radius: 10px;
+        padding: 6px;
+        border-bottom: 2px solid rgba(0, 0, 0, 0.1); /* 模拟阴影 */
+    }
+    QMenu::item {
+        padding: 6px 24px;
+        border-radius: 6px;
+    }
+    QMenu::item:selected {
+        background-color: #007AFF;
+        color: white;
+    }
+    
+    /* Tab Widget - 类似 Segmented Control */
+    QTabWidget::pane {
+        border: 1px solid rgba(255, 255, 255, 0.6);
+        border-radius: 12px;
+        background-color: rgba(255, 255, 255, 0.4);
+    }
+    QTabBar::tab {
+        background-color: rgba(255, 255, 255, 0.3);
+        color: #555;
+        padding: 8px 20px;
+        border-radius: 6px;
+        margin: 4px 2px;
+        border: 1px solid transparent;
+    }
+    QTabBar::tab:selected {
+        background-color: #fff;
+        color: #007AFF;
+        font-weight: bold;
+        border: 1px solid rgba(0, 0, 0, 0.05);
+        border-bottom: 2px solid rgba(0, 0, 0, 0.05);
+    }
+    QTabBar::tab:hover:!selected {
+        background-color: rgba(255, 255, 255, 0.5);
+    }
+    
+    /* 系统时钟/接收时钟（按objectName匹配） */
+    QLabel#systemTime, QLabel#recvTime {
+        font-size: 15pt;
+        font-weight: 600;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 rgba(255, 255, 255, 0.9),
+                    stop:1 rgba(248, 248, 250, 0.9));
+        border-radius: 10px;
+        padding: 10px;
+        min-height: 35px;
+    }
+    QLabel#systemTime {
+        color: #007AFF;
+        border: 1px solid rgba(0, 122, 255, 0.15);
+    }
+    QLabel#recvTime {
+        color: #34C759;
+        border: 1px solid rgba(52, 199, 89, 0.15);
+    }
+    QLabel#systemDate, QLabel#recvDate {
+        font-size: 10pt;
+        color: #86868B;
+        background-color: transparent;
+        padding: 5px;
+        font-weight: 500;
+    }
+    QPushButton#clockConfigBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ffffff, stop:1 #f5f7fa);
+        border: 1px solid #dcdfe6;
+        border-bottom: 2px solid #c0c4cc;
+        border-radius: 10px;
+        color: #606266;
+        font-size: 7pt;
+        padding: 2px;
+    }
+    QPushButton#clockConfigBtn:hover {
+        background-color: #ecf5ff;
+        color: #409EFF;
+        border-color: #c6e2ff;
+    }
+    QPushButton#clockConfigBtn:pressed {
+        background-color: #f5f7fa;
+        border-top: 2px solid #c0c4cc;
+        border-bottom: none;
+    }
+    QPushButton#clockCalibrateBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #FF9800, stop:1 #F57C00);
+        border: 1px solid #F57C00;
+        border-bottom: 2px solid #E65100;
+        border-radius: 10px;
+        color: white;
+        font-size: 7pt;
+        font-weight: bold;
+        padding: 2px;
+    }
+    QPushButton#clockCalibrateBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #FFB74D, stop:1 #FF9800);
+    }
+    QPushButton#clockCalibrateBtn:pressed {
+        background-color: #F57C00;
+        border-top: 2px solid #E65100;
+        border-bottom: none;
+    }
+    
+    /* 曲线控制栏：曲线配置按钮只有一个，按objectName匹配 */
+    QPushButton#curveConfigBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2196F3, stop:1 #1976D2);
+        border: 1px solid #1976D2;
+        border-bottom: 2px solid #0D47A1;
+        border-radius: 6px;
+        color: white;
+        font-size: 8pt;
+        font-weight: bold;
+    }
+    QPushButton#curveConfigBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #42A5F5, stop:1 #2196F3);
+    }
+    QPushButton#curveConfigBtn:pressed {
+        background-color: #1976D2;
+        border-top: 2px solid #0D47A1;
+        border-bottom: none;
+    }
+    /* 曲线控制栏的缩放等同类按钮按cls属性共用一份规则 */
+    QPushButton[cls="zoomX"], QPushButton[cls="zoomY"] {
+        font-size: 8pt;
+        font-weight: 600;
+        background-color: rgba(255, 255, 255, 0.8);
+        border-radius: 6px;
+    }
+    QPushButton[cls="zoomX"] {
+        color: #007AFF;
+        border: 1px solid rgba(0, 122, 255, 0.3);
+    }
+    QPushButton[cls="zoomX"]:hover {
+        background-color: #007AFF;
+        color: white;
+    }
+    QPushButton[cls="zoomX"]:pressed {
+        background-color: rgba(0, 100, 220, 0.9);
+    }
+    QPushButton[cls="zoomY"] {
+        color: #34C759;
+        border: 1px solid rgba(52, 199, 89, 0.3);
+    }
+    QPushButton[cls="zoomY"]:hover {
+        background-color: #34C759;
+        color: white;
+    }
+    QPushButton[cls="zoomY"]:pressed {
+        background-color: rgba(40, 180, 70, 0.9);
+    }
+    QPushButton#resetViewBtn, QPushButton#navToolbarBtn {
+        font-size: 8pt;
+    }
+    QLabel[cls="sep"] {
+        color: #ccc;
+        font-weight: bold;
+    }
+    
+    /* 曲线配置对话框的50个曲线按钮，state: off-未配置/禁用 on-已启用 */
+    QPushButton[cls="curveSlot"] {
+        text-align: left;
+        padding-left: 15px;
+        font-size: 9pt;
+        background-color: #f5f5f5;
+    }
+    QPushButton[cls="curveSlot"]:hover {
+        background-color: #e0e0e0;
+    }
+    QPushButton[cls="curveSlot"][state="on"] {
+        background-color: #e8f5e9;
+        color: #2e7d32;
+        font-weight: bold;
+    }
+    QPushButton[cls="curveSlot"][state="on"]:hover {
+        background-color: #c8e6c9;
+    }
+    
+    /* 自定义显示窗口，state: blank-初始 empty-未配置 disabled-已禁用 idle-等待数据 value-实时数值 */
+    QLabel[cls="customDisplay"][state="blank"] {
+        background-color: #f8f9fa;
+        border: 2px solid #dee2e6;
+        border-radius: 4px;
+        padding: 3px;
+        font-size: 7pt;
+        font-weight: bold;
+    }
+    QLabel[cls="customDisplay"][state="blank"]:hover {
+        background-color: #e9ecef;
+        border-color: #adb5bd;
+    }
+    QLabel[cls="customDisplay"][state="empty"] {
+        background-color: #f0f0f0;
+        border: 2px solid #c0c0c0;
+        border-radius: 4px;
+        padding: 8px;
+        font-size: 11pt;
+        font-weight: bold;
+    }
+    QLabel[cls="customDisplay"][state="disabled"] {
+        background-color: #e0e0e0;
+        border: 2px solid #a0a0a0;
+        border-radius: 4px;
+        padding: 8px;
+        font-size: 11pt;
+        color: #888;
+    }
+    QLabel[cls="customDisplay"][state="idle"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #f0f9eb, stop:1 #e1f3d8);
+        border: 1px solid #c2e7b0;
+        border-radius: 6px;
+        padding: 3px;
+        font-size: 7.5pt;
+        font-weight: bold;
+        color: #67c23a;
+    }
+    QLabel[cls="customDisplay"][state="value"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #67c23a, stop:1 #529b2e);
+        border: 1px solid #529b2e;
+        border-bottom: 2px solid #3e7523;
+        border-radius: 6px;
+        padding: 3px;
+        font-size: 8pt;
+        font-weight: bold;
+        color: white;
+    }
+    QPushButton[cls="displayConfigBtn"] {
+        background-color: #6c757d;
+        color: white;
+        border-radius: 5px;
+        font-size: 8pt;
+    }
+    QPushButton[cls="displayConfigBtn"]:hover {
+        background-color: #5a6268;
+    }
+    
+    /* 位显示窗口的配置按钮 */
+    QPushButton[cls="bitConfigBtn"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ffffff, stop:1 #f5f7fa);
+        border: 1px solid #dcdfe6;
+        border-bottom: 2px solid #c0c4cc;
+        border-radius: 4px;
+        color: #606266;
+        font-size: 7pt;
+        padding: 1px;
+    }
+    QPushButton[cls="bitConfigBtn"]:hover {
+        background-color: #ecf5ff;
+        color: #409EFF;
+        border-color: #c6e2ff;
+    }
+    QPushButton[cls="bitConfigBtn"]:pressed {
+        background-color: #f5f7fa;
+        border-top: 2px solid #c0c4cc;
+        border-bottom: none;
+    }
+    
+    /* 预设命令按钮，state: blank-初始 named-已配置名称 unnamed-配置后名称为空 */
+    QPushButton[cls="preset"][state="blank"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ffffff, stop:1 #f5f7fa);
+        border: 1px solid #dcdfe6;
+        border-bottom: 2px solid #c0c4cc;
+        border-radius: 6px;
+        color: #909399;
+        font-size: 7pt;
+        text-align: left;
+        padding-left: 5px;
+    }
+    QPushButton[cls="preset"][state="blank"]:hover {
+        background-color: #ecf5ff;
+        color: #409EFF;
+        border-color: #c6e2ff;
+    }
+    QPushButton[cls="preset"][state="blank"]:pressed {
+        background-color: #f5f7fa;
+        border-top: 2px solid #c0c4cc;
+        border-bottom: none;
+    }
+    QPushButton[cls="preset"][state="named"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #67c23a, stop:1 #529b2e);
+        border: 1px solid #529b2e;
+        border-bottom: 2px solid #3e7523;
+        border-radius: 6px;
+        color: white;
+        font-weight: bold;
+        font-size: 7pt;
+        padding-left: 2px;
+        text-align: center;
+    }
+    QPushButton[cls="preset"][state="named"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #85ce61, stop:1 #67c23a);
+    }
+    QPushButton[cls="preset"][state="named"]:pressed {
+        background-color: #529b2e;
+        border-top: 2px solid #3e7523;
+        border-bottom: none;
+    }
+    QPushButton[cls="preset"][state="unnamed"] {
+        background-color: #f8f9fa;
+        border: 1px solid #dee2e6;
+        border-radius: 4px;
+        font-size: 7pt;
+        text-align: left;
+        padding-left: 10px;
+    }
+    QPushButton[cls="preset"][state="unnamed"]:hover {
+        background-color: #e0e0e0;
+    }
+    QSpinBox[cls="presetData"] {
+        border: 1px solid #dee2e6;
+        border-radius: 4px;
+        padding: 2px;
+    }
+    QLabel[cls="tip"] {
+        color: #666;
+        font-size: 8pt;
+        font-style: italic;
+    }
+    
+    /* 串口开关按钮，state: initial-启动时 open-已打开 closed-已关闭 detecting-断线检测中 */
+    QPushButton#connectBtn {
+        color: white;
+        padding: 8px;
+    }
+    QPushButton#connectBtn[state="initial"] {
+        background-color: #4CAF50;
+        font-weight: bold;
+        font-size: 8pt;
+        border-radius: 4px;
+    }
+    QPushButton#connectBtn[state="initial"]:hover {
+        background-color: #45a049;
+    }
+    QPushButton#connectBtn[state="open"], QPushButton#connectBtn[state="closed"],
+    QPushButton#connectBtn[state="detecting"] {
+        font-weight: 600;
+        border-radius: 8px;
+    }
+    QPushButton#connectBtn[state="open"] {
+        background-color: rgba(255, 59, 48, 0.9);
+    }
+    QPushButton#connectBtn[state="closed"] {
+        background-color: rgba(52, 199, 89, 0.9);
+    }
+    QPushButton#connectBtn[state="detecting"] {
+        background-color: rgba(255, 149, 0, 0.9);
+    }
+    
+    /* 曲线记录，state: idle-等待记录 recording-记录中 */
+    QLabel#recordStatus[state="idle"] {
+        color: #666;
+        font-size: 8pt;
+    }
+    QLabel#recordStatus[state="recording"] {
+        color: #67c23a;
+        font-weight: bold;
+        font-size: 9pt;
+    }
+    QPushButton#startRecordBtn, QPushButton#stopRecordBtn {
+        border-radius: 6px;
+        color: white;
+        font-weight: bold;
+        font-size: 8pt;
+    }
+    QPushButton#startRecordBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #67c23a, stop:1 #529b2e);
+        border: 1px solid #529b2e;
+        border-bottom: 2px solid #3e7523;
+    }
+    QPushButton#startRecordBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #85ce61, stop:1 #67c23a);
+    }
+    QPushButton#startRecordBtn:pressed {
+        background-color: #529b2e;
+        border-top: 2px solid #3e7523;
+        border-bottom: none;
+    }
+    QPushButton#stopRecordBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #E6A23C, stop:1 #d48806);
+        border: 1px solid #d48806;
+        border-bottom: 2px solid #b87100;
+    }
+    QPushButton#stopRecordBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ebb563, stop:1 #E6A23C);
+    }
+    QPushButton#stopRecordBtn:pressed {
+        background-color: #d48806;
+        border-top: 2px solid #b87100;
+        border-bottom: none;
+    }
+"""
+
+class BitGridWidget(QWidget):
+    """位显示区：由一个控件绘制8个位（4行x2列）的名称和状态圆点，Bit 0为最低位
+    
+    状态保存为一个字节，值不变时不重绘；取代每个位一组QLabel和样式表
+    """
+    
+    CELL_HEIGHT = 22
+    DOT_SIZE = 10
+    # 圆点颜色：灰色-关，绿色-开（绘制时使用_dot_pixmap缓存的圆点图）
+    DOT_COLORS = ('#ccc', '#4CAF50')
+    CELL_BACKGROUND = QColor('#f8f9fa')
+    CELL_BORDER = QColor('#dee2e6')
+    
+    _font = None  # 所有位显示区共用的字体（需在QApplication创建后生成）
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._state = 0
+        self._names = [f'Bit{i}' for i in range(8)]
+        if BitGridWidget._font is None:
+            BitGridWidget._font = QFont()
+            BitGridWidget._font.setPointSize(7)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.setMinimumHeight(4 * self.CELL_HEIGHT)
+    
+    def sizeHint(self):
+        return QSize(180, 4 * self.CELL_HEIGHT)
+    
+    def set_state(self, byte_value):
+        """设置8个位的状态（字节值0-255）"""
+        if byte_value == self._state:
+            return
+        self._state = byte_value
+        self.update()
+    
+    def set_names(self, names):
+        """设置8个位的显示名称"""
+        if names == self._names:
+            return
+        self._names = list(names)
+        self.update()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self._font)
+        text_color = self.palette().windowText().color()
+        cell_width = self.width() / 2
+        dot = self.DOT_SIZE
+        dot_pixmaps = [_dot_pixmap(color, dot) for color in self.DOT_COLORS]
+        for bit_idx in range(8):
+            row, col = divmod(bit_idx, 2)
+            cell = QRectF(col * cell_width + 1, row * self.CELL_HEIGHT + 1,
+                          cell_width - 2, self.CELL_HEIGHT - 2)
+            painter.setPen(self.CELL_BORDER)
+            painter.setBrush(self.CELL_BACKGROUND)
+            painter.drawRoundedRect(cell, 4, 4)
+            
+            painter.setPen(text_color)
+            painter.drawText(cell.adjusted(4, 0, -(dot + 10), 0),
+                             Qt.AlignLeft | Qt.AlignVCenter, self._names[bit_idx])
+            
+            painter.drawPixmap(round(cell.right() - dot - 6), round(cell.center().y() - dot / 2),
+                               dot_pixmaps[(self._state >> bit_idx) & 1])
+        painter.end()
+
+
+class DataLog:
+    """收发数据记录(按列存放)：时间戳在预分配的numpy环形数组中，方向和原始数据各用一个定长deque，
+    重新格式化时时间戳一次批量转换为字符串"""
+    
+    __slots__ = ('capacity', 'times', 'directions', 'payloads', 'count')
+    
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.times = np.empty(capacity, dtype=np.int64)  # 当日毫秒数，按count % capacity循环写入
+        self.directions = deque(maxlen=capacity)  # 'TX' 或 'RX'
+        self.payloads = deque(maxlen=capacity)  # bytes数据
+        self.count = 0  # 累计写入条数
+    
+    def __len__(self):
+        return len(self.payloads)
+    
+    def append(self, direction, day_ms, data):
+        """追加一条记录，超过容量时自动丢弃最旧的记录"""
+        self.times[self.count % self.capacity] = day_ms
+        self.directions.append(direction)
+        self.payloads.append(data)
+        self.count += 1
+    
+    def clear(self):
+        self.directions.clear()
+        self.payloads.clear()
+        self.count = 0
+    
+    def timestamps(self):
+        """按记录顺序返回 'HH:MM:SS.mmm' 时间戳列表"""
+        n = len(self.payloads)
+        if n == 0:
+            return []
+        order = np.arange(self.count - n, self.count) % self.capacity
+        stamps = np.datetime_as_string(self.times[order].astype('datetime64[ms]'), unit='ms')
+        return [s[11:] for s in stamps.tolist()]  # 去掉 '1970-01-01T' 日期部分
+
+
+class PresetScheduler(QObject):
+    """预设命令周期发送调度器：所有周期发送共用一个单次QTimer
+    
+    堆中保存 (到期时间ms, 序号, 预设索引)，定时器只在最近一次到期时唤醒，到期的预设通过due信号发出。
+    停止或重新启动时不从堆中删除旧条目，出堆时按序号识别并丢弃。
+    """
+    
+    due = pyqtSignal(int)  # 到期的预设命令索引
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._heap = []
+        self._active = {}  # 预设索引 -> (周期ms, 序号)
+        self._seq = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._dispatch)
+    
+    @staticmethod
+    def _now_ms():
+        return time.monotonic() * 1000
+    
+    def start(self, index, interval_ms):
+        """启动（或以新周期重新启动）第index个预设命令的周期发送"""
+        interval_ms = max(1, interval_ms)  # 周期为0时重新入堆仍已到期，_dispatch会陷入死循环
+        self._seq += 1
+        self._active[index] = (interval_ms, self._seq)
+        heapq.heappush(self._heap, (self._now_ms() + interval_ms, self._seq, index))
+        self._rearm()
+    
+    def stop(self, index):
+        """停止第index个预设命令的周期发送"""
+        if self._active.pop(index, None) is not None and not self._active:
+            self._heap.clear()
+            self._timer.stop()
+    
+    def stop_all(self):
+        self._active.clear()
+        self._heap.clear()
+        self._timer.stop()
+    
+    def is_active(self, index):
+        return index in self._active
+    
+    def active_indices(self):
+        """按索引顺序返回正在周期发送的预设命令"""
+        return sorted(self._active)
+    
+    def _rearm(self):
+        """丢弃堆顶的失效条目，并把定时器设为最近一次到期"""
+        heap = self._heap
+        while heap and self._active.get(heap[0][2], (0, None))[1] != heap[0][1]:
+            heapq.heappop(heap)
+        if heap:
+            self._timer.start(max(0, int(heap[0][0] - self._now_ms())))
+        else:
+            self._timer.stop()
+    
+    def _dispatch(self):
+        """发出所有已到期的预设命令，并按周期排入下一次"""
+        heap = self._heap
+        now = self._now_ms()
+        due_indices = []
+        while heap and heap[0][0] <= now:
+            due_time, seq, index = heapq.heappop(heap)
+            entry = self._active.get(index)
+            if entry is None or entry[1] != seq:
+                continue  # 已停止或已重新启动
+            interval_ms = entry[0]
+            # 按原节拍排下一次，长时间阻塞后不补发积压的次数
+            next_time = due_time + interval_ms
+            if next_time <= now:
+                next_time = now + interval_ms
+            heapq.heappush(heap, (next_time, seq, index))
+            due_indices.append(index)
+        # 先排好下一次再发出信号，槽函数中停止调度也不受影响
+        for index in due_indices:
+            self.due.emit(index)
+        self._rearm()
 
 
 class SerialMonitorApp(QMainWindow):
     """串口上位机主窗口"""
     
+    clock_tick = pyqtSignal(str, str)  # 系统时钟每秒发出一次(时间, 日期)，所有时钟显示共用
+    
     CONFIG_FILE = "serial_config.json"
     LAYOUT_FILE = "window_layout.json"  # 窗口布局配置文件
+    RAW_BUFFER_MAX_CHUNKS = 100000  # 原始数据缓冲最多保留的接收块数，超出后自动丢弃最旧的
+    PORT_REFRESH_MIN_INTERVAL = 1.0  # 两次枚举串口的最小间隔(秒)，期间的刷新请求直接沿用当前列表
     
     def __init__(self, splash=None):
         super().__init__()
@@ -1770,22 +3349,24 @@ class SerialMonitorApp(QMainWindow):
         self.serial_port = None
         self.serial_thread = None
         self.parser = DataParser()
-        self.raw_data_buffer = []
+        self.raw_data_buffer = deque(maxlen=self.RAW_BUFFER_MAX_CHUNKS)
         
         # 预设命令相关
         self.preset_commands = []
         self.preset_buttons = []
-        self.preset_timers = []
+        self.preset_scheduler = PresetScheduler(self)  # 所有预设命令的周期发送共用一个定时器
+        self.preset_scheduler.due.connect(self.send_preset_command)
         self.preset_data_spinboxes = []  # 数据填充输入框
         
         # 自定义显示窗口相关
-        self.custom_displays = [None] * 50  # 支持50个显示窗口
+        self.custom_displays = {}  # 窗口索引 -> 显示配置，只保存已配置的窗口（最多50个）
         self.custom_display_labels = []
         self.display_widgets = []  # 保存显示窗口的容器
         
         # 位显示窗口相关
-        self.bit_displays = [None] * 50  # 支持50个位显示窗口
-        self.bit_display_labels = []  # 保存每个位的显示标签
+        self.bit_displays = {}  # 窗口索引 -> 位显示配置，只保存已配置的窗口（最多50个）
+        self._bit_targets = {}  # 协议名 -> ((目标字节, (窗口索引, ...)), ...)，只含启用的窗口（配置变化时重建）
+        self.bit_display_grids = []  # 每个位显示窗口的BitGridWidget
         self.bit_display_widgets = []  # 保存每个位显示窗口的容器
         self.bit_display_name_labels = []  # 保存每个位显示窗口的名称标签
         
@@ -1796,10 +3377,13 @@ class SerialMonitorApp(QMainWindow):
         # 窗口布局恢复标志
         self.is_restoring_layout = False
         
-        # 帧间隔时间设置（毫秒）
-        self.frame_interval_ms = 100  # 默认100ms
-        self.last_rx_time = None  # 上次接收数据时间
-        self.rx_buffer = bytearray()  # 接收数据缓冲
+        # 帧间隔时间设置（毫秒），分帧在接收线程中进行
+        self.frame_interval_ms = 100
+        
+        # 等宽字体只创建一次，数据显示区和日志区共用
+        self._font_courier = QFont("Courier New", 9)
+        self._font_consolas = QFont("Consolas", 9)
+        self.text_log = None  # 日志窗口在create_log_dock中创建，之前的log调用直接忽略
         
         # 曲线记录状态
         self.is_curve_recording = False
@@ -1815,28 +3399,41 @@ class SerialMonitorApp(QMainWindow):
         # 背景相关
         self.background_image_path = ''  # 背景图片路径
         self.background_opacity = 0.3  # 背景透明度(0.0-1.0)
+        self._bg_source = None  # ((图片路径, 修改时间), 解码后的原图)，图片文件不变时不重复解码
+        self._bg_cache_key = None  # 当前背景对应的(路径, 修改时间, 宽, 高, 透明度)，相同时跳过重建
+        self._bg_loading = None  # 正在后台解码的(图片路径, 修改时间)
+        # 窗口连续调整大小时合并为一次背景重建
+        self.bg_resize_timer = QTimer()
+        self.bg_resize_timer.setSingleShot(True)
+        self.bg_resize_timer.timeout.connect(self.update_background)
         
         # 协议管理相关
         self.protocol_configs = []  # 协议配置列表
         self.protocol_parsers = []  # 协议解析器列表
         
         # 【重要】先创建所有定时器，确保在setup_dock_signals()之前就存在
-        # 定时器 - 用于更新曲线(1Hz)
+        # 定时器 - 用于更新曲线记录状态(1Hz)，只在串口打开且正在记录时运行，见_sync_plot_timer
         self.plot_timer = QTimer()
+        self.plot_timer.setTimerType(Qt.CoarseTimer)  # 状态显示不需要精确定时，允许系统合并唤醒
         self.plot_timer.timeout.connect(self.update_plot)
         
         # 定时器 - 用于刷新COM口列表
         self.port_refresh_timer = QTimer()
         self.port_refresh_timer.timeout.connect(self.refresh_com_ports)
+        self._ports_refreshed_at = 0.0  # 上次开始枚举串口的时间(time.monotonic)
+        self._ports_loading = False  # 是否正在后台枚举串口
         
         # 定时器 - 用于延迟保存窗口布局（单次触发）- 必须在setup_dock_signals之前创建
         self.layout_save_timer = QTimer()
         self.layout_save_timer.setSingleShot(True)  # 单次触发
         self.layout_save_timer.timeout.connect(self.save_window_layout)
+        self._last_layout_json = None  # 上次写入/读取的布局文件内容，内容未变时跳过写盘
+        self._last_layout_raw = None  # 上次保存时的(状态, 几何, 分割器尺寸)原始值，未变时跳过编码
         
-        # 定时器 - 用于刷新接收缓冲区(检查帧超时)
-        self.rx_flush_timer = QTimer()
-        self.rx_flush_timer.timeout.connect(self.flush_rx_buffer)
+        # 定时器 - 合并显示选项的连续切换，50ms内只重新格式化一次收发数据（单次触发）
+        self.display_refresh_timer = QTimer()
+        self.display_refresh_timer.setSingleShot(True)
+        self.display_refresh_timer.timeout.connect(self._do_refresh_data_display)
         
         self.init_ui()
         
@@ -1860,7 +3457,6 @@ class SerialMonitorApp(QMainWindow):
         
         # 启动定时器
         self.port_refresh_timer.start(2000)
-        self.rx_flush_timer.start(50)  # 每50ms检查一次
     
     def init_ui(self):
         """初始化界面"""
@@ -1893,328 +3489,10 @@ class SerialMonitorApp(QMainWindow):
         if self.splash:
             self.splash.update_progress(20, '正在加载样式...')
         
-        # 设置样式表 - Apple毛玻璃风格 (白色玻璃质感 - 终极优化版)
-        # 注意：QMainWindow 不设置背景，让 QPalette 控制（用于背景图片功能）
-        self.setStyleSheet("""
-            /* 全局字体与颜色 - 优化抗锯齿 */
-            QWidget {
-                font-family: "Microsoft YaHei UI", "Segoe UI", sans-serif;
-                color: #1d1d1f;
-                outline: none;
-            }
-            
-            /* ToolTip - 现代深色风格 */
-            QToolTip {
-                background-color: rgba(30, 30, 30, 0.9);
-                color: #fff;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 6px;
-                padding: 6px;
-                font-size: 9pt;
-            }
-            
-            QMainWindow {
-                /* 背景由 QPalette 控制 */
-            }
-            
-            /* 滚动区域透明，透出背景图 */
-            QScrollArea, QScrollArea > QWidget > QWidget {
-                background-color: transparent;
-                border: none;
-            }
-
-            /* QGroupBox - 玻璃拟态 (Glassmorphism) 增强 */
-            QGroupBox {
-                background-color: rgba(255, 255, 255, 0.6);
-                border: 1px solid rgba(255, 255, 255, 0.8);
-                border-bottom: 1px solid rgba(0, 0, 0, 0.08);
-                border-right: 1px solid rgba(0, 0, 0, 0.04);
-                border-radius: 16px;
-                margin-top: 12px;
-                padding: 20px 12px 12px 12px;
-                font-weight: 600;
-                font-size: 10pt;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 8px;
-                background-color: transparent;
-                color: #1d1d1f;
-                left: 12px;
-                top: 2px;
-            }
-            
-            /* QPushButton - 增强立体质感与微交互 */
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                      stop:0 rgba(255, 255, 255, 0.85),
-                                      stop:1 rgba(242, 242, 247, 0.75));
-                color: #1d1d1f;
-                border: 1px solid rgba(0, 0, 0, 0.08);
-                border-bottom: 1px solid rgba(0, 0, 0, 0.15); /* 底部更深，模拟立体感 */
-                border-radius: 8px;
-                padding: 6px 16px;
-                font-size: 9pt;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                      stop:0 rgba(255, 255, 255, 0.95),
-                                      stop:1 rgba(250, 250, 255, 0.9));
-                border-color: rgba(0, 0, 0, 0.12);
-                border-bottom-color: rgba(0, 0, 0, 0.18);
-            }
-            QPushButton:pressed {
-                background-color: rgba(230, 230, 235, 0.9);
-                border: 1px solid rgba(0, 0, 0, 0.1);
-                border-top: 1px solid rgba(0, 0, 0, 0.15); /* 按下时顶部阴影 */
-                padding-top: 7px;
-                padding-bottom: 5px;
-            }
-            QPushButton:disabled {
-                background-color: rgba(255, 255, 255, 0.3);
-                color: rgba(29, 29, 31, 0.3);
-                border: 1px solid rgba(0, 0, 0, 0.05);
-            }
-            
-            /* 输入控件 - 优化光标与边框 */
-            QTextEdit, QLineEdit {
-                background-color: rgba(255, 255, 255, 0.5);
-                border: 1px solid rgba(0, 0, 0, 0.06);
-                border-bottom: 1px solid rgba(0, 0, 0, 0.12);
-                border-radius: 8px;
-                padding: 6px;
-                selection-background-color: rgba(0, 122, 255, 0.3);
-                selection-color: #000;
-            }
-            QTextEdit:focus, QLineEdit:focus {
-                background-color: rgba(255, 255, 255, 0.95);
-                border: 1px solid #007AFF;
-                border-bottom: 1px solid #007AFF;
-            }
-            
-            /* 下拉框 - 增加渐变与阴影 */
-            QComboBox {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                      stop:0 rgba(255, 255, 255, 0.7),
-                                      stop:1 rgba(245, 245, 250, 0.6));
-                border: 1px solid rgba(0, 0, 0, 0.06);
-                border-bottom: 1px solid rgba(0, 0, 0, 0.12);
-                border-radius: 8px;
-                padding: 4px 10px;
-                min-height: 24px;
-            }
-            QComboBox:hover {
-                background-color: rgba(255, 255, 255, 0.9);
-                border-color: rgba(0, 0, 0, 0.1);
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 24px;
-            }
-            QComboBox::down-arrow {
-                image: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><path d="M2 3 L5 6 L8 3" fill="none" stroke="#333" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/></svg>');
-                width: 12px;
-                height: 12px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: rgba(255, 255, 255, 0.95);
-                border: 1px solid rgba(0, 0, 0, 0.08);
-                border-radius: 8px;
-                outline: none;
-                padding: 4px;
-                selection-background-color: #007AFF;
-                selection-color: white;
-            }
-            
-            /* 数字输入框 */
-            QSpinBox, QDoubleSpinBox {
-                background-color: rgba(255, 255, 255, 0.5);
-                border: 1px solid rgba(0, 0, 0, 0.06);
-                border-bottom: 1px solid rgba(0, 0, 0, 0.12);
-                border-radius: 8px;
-                padding: 4px;
-                padding-right: 15px;
-            }
-            QSpinBox:focus, QDoubleSpinBox:focus {
-                background-color: rgba(255, 255, 255, 0.95);
-                border: 1px solid #007AFF;
-            }
-            QSpinBox::up-button, QDoubleSpinBox::up-button,
-            QSpinBox::down-button, QDoubleSpinBox::down-button {
-                background-color: rgba(0, 0, 0, 0.03);
-                border: none;
-                width: 18px;
-                margin: 1px;
-                border-radius: 4px;
-            }
-            QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover,
-            QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {
-                background-color: rgba(0, 0, 0, 0.1);
-            }
-            
-            QSpinBox::up-arrow, QDoubleSpinBox::up-arrow {
-                image: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><path d="M2 7 L5 4 L8 7" fill="none" stroke="#000" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/></svg>');
-                width: 10px;
-                height: 10px;
-            }
-            QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {
-                image: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><path d="M2 3 L5 6 L8 3" fill="none" stroke="#000" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/></svg>');
-                width: 10px;
-                height: 10px;
-            }
-            
-            /* 复选框 - 优化选中态 */
-            QCheckBox {
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 5px;
-                border: 1px solid rgba(0, 0, 0, 0.15);
-                background-color: rgba(255, 255, 255, 0.8);
-            }
-            QCheckBox::indicator:checked {
-                background-color: #007AFF;
-                border-color: #007AFF;
-                image: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="12" height="12"><path d="M2 6 L5 9 L10 3" fill="none" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/></svg>');
-            }
-            QCheckBox::indicator:hover {
-                border-color: #007AFF;
-                background-color: #fff;
-            }
-            
-            /* Dock Widget - 标题栏优化 */
-            QDockWidget {
-                titlebar-close-icon: url(close.png);
-                titlebar-normal-icon: url(float.png);
-            }
-            QDockWidget::title {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                      stop:0 rgba(255, 255, 255, 0.8),
-                                      stop:1 rgba(245, 245, 250, 0.8));
-                border-bottom: 1px solid rgba(0, 0, 0, 0.08);
-                padding: 8px 12px;
-                border-top-left-radius: 12px;
-                border-top-right-radius: 12px;
-                font-weight: 600;
-            }
-            QDockWidget::close-button, QDockWidget::float-button {
-                background: transparent;
-                border-radius: 4px;
-                padding: 2px;
-            }
-            QDockWidget::close-button:hover, QDockWidget::float-button:hover {
-                background: rgba(0, 0, 0, 0.1);
-            }
-            
-            /* 分割器手柄 */
-            QSplitter::handle {
-                background-color: rgba(0, 0, 0, 0.03);
-                margin: 1px;
-            }
-            QSplitter::handle:hover {
-                background-color: rgba(0, 122, 255, 0.2);
-            }
-            
-            /* 滚动条 - iOS 风格悬浮滚动条 */
-            QScrollBar:vertical {
-                background: transparent;
-                width: 10px;
-                margin: 0;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(0, 0, 0, 0.15);
-                border-radius: 5px;
-                min-height: 40px;
-                margin: 2px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(0, 0, 0, 0.35);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-            QScrollBar:horizontal {
-                background: transparent;
-                height: 10px;
-                margin: 0;
-            }
-            QScrollBar::handle:horizontal {
-                background: rgba(0, 0, 0, 0.15);
-                border-radius: 5px;
-                min-width: 40px;
-                margin: 2px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: rgba(0, 0, 0, 0.35);
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0;
-            }
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
-                background: none;
-            }
-
-            /* 菜单栏 */
-            QMenuBar {
-                background-color: rgba(255, 255, 255, 0.8);
-                border-bottom: 1px solid rgba(0, 0, 0, 0.05);
-            }
-            QMenuBar::item {
-                background: transparent;
-                padding: 6px 12px;
-            }
-            QMenuBar::item:selected {
-                background-color: rgba(0, 0, 0, 0.05);
-                border-radius: 4px;
-            }
-            QMenu {
-                background-color: rgba(255, 255, 255, 0.98);
-                border: 1px solid rgba(0, 0, 0, 0.08);
-                border-radius: 10px;
-                padding: 6px;
-                border-bottom: 2px solid rgba(0, 0, 0, 0.1); /* 模拟阴影 */
-            }
-            QMenu::item {
-                padding: 6px 24px;
-                border-radius: 6px;
-            }
-            QMenu::item:selected {
-                background-color: #007AFF;
-                color: white;
-            }
-            
-            /* Tab Widget - 类似 Segmented Control */
-            QTabWidget::pane {
-                border: 1px solid rgba(255, 255, 255, 0.6);
-                border-radius: 12px;
-                background-color: rgba(255, 255, 255, 0.4);
-            }
-            QTabBar::tab {
-                background-color: rgba(255, 255, 255, 0.3);
-                color: #555;
-                padding: 8px 20px;
-                border-radius: 6px;
-                margin: 4px 2px;
-                border: 1px solid transparent;
-            }
-            QTabBar::tab:selected {
-                background-color: #fff;
-                color: #007AFF;
-                font-weight: bold;
-                border: 1px solid rgba(0, 0, 0, 0.05);
-                border-bottom: 2px solid rgba(0, 0, 0, 0.05);
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: rgba(255, 255, 255, 0.5);
-            }
-        """)
+        # 样式表在应用级设置一次（见__main__），主窗口和所有对话框共用同一份解析结果
+        app = QApplication.instance()
+        if not app.styleSheet():
+            app.setStyleSheet(_STYLESHEET)
         
         # 创建空的中心区域（显示背景）
         central_widget = QWidget()
@@ -2238,9 +3516,8 @@ class SerialMonitorApp(QMainWindow):
         # dock.setMinimumWidth(400)  # 移除最小宽度限制
         
         plot_widget = QWidget()
-        main_layout = QVBoxLayout(plot_widget)
-        main_layout.setContentsMargins(5, 5, 5, 5)
-        main_layout.setSpacing(5)
+        plot_widget.setUpdatesEnabled(False)  # 控件全部创建完成后再统一布局和重绘
+        main_layout = _make_vbox(plot_widget, spacing=5, margins=_DOCK_MARGINS)
         
         # 创建时钟组件(稍后添加到控制栏)
         clock_splitter = QSplitter(Qt.Horizontal)
@@ -2251,38 +3528,16 @@ class SerialMonitorApp(QMainWindow):
         # system_clock_group.setMinimumWidth(340)
         # system_clock_group.setMaximumWidth(340)
         # system_clock_group.setMaximumHeight(200)
-        system_clock_layout = QVBoxLayout(system_clock_group)
-        system_clock_layout.setContentsMargins(8, 12, 8, 8)
-        system_clock_layout.setSpacing(6)
+        system_clock_layout = _make_vbox(system_clock_group, spacing=6, margins=(8, 12, 8, 8))
         self.label_system_time = QLabel('--:--:--')
         self.label_system_time.setAlignment(Qt.AlignCenter)
-        self.label_system_time.setStyleSheet("""
-            QLabel {
-                font-size: 15pt;
-                font-weight: 600;
-                color: #007AFF;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 rgba(255, 255, 255, 0.9),
-                            stop:1 rgba(248, 248, 250, 0.9));
-                border: 1px solid rgba(0, 122, 255, 0.15);
-                border-radius: 10px;
-                padding: 10px;
-                min-height: 35px;
-            }
-        """)
+        self.label_system_time.setObjectName('systemTime')  # 样式见_STYLESHEET
         system_clock_layout.addWidget(self.label_system_time)
         
         self.label_system_date = QLabel('----/--/--')
         self.label_system_date.setAlignment(Qt.AlignCenter)
-        self.label_system_date.setStyleSheet("""
-            QLabel {
-                font-size: 10pt;
-                color: #86868B;
-                background-color: transparent;
-                padding: 5px;
-                font-weight: 500;
-            }
-        """)
+        self.label_system_date.setObjectName('systemDate')
+        self._system_date_text = ''
         system_clock_layout.addWidget(self.label_system_date)
         
         clock_splitter.addWidget(system_clock_group)
@@ -2293,25 +3548,10 @@ class SerialMonitorApp(QMainWindow):
         # received_clock_group.setMinimumWidth(340)
         # received_clock_group.setMaximumWidth(340)
         # received_clock_group.setMaximumHeight(200)
-        received_clock_layout = QVBoxLayout(received_clock_group)
-        received_clock_layout.setContentsMargins(8, 12, 8, 8)
-        received_clock_layout.setSpacing(6)
+        received_clock_layout = _make_vbox(received_clock_group, spacing=6, margins=(8, 12, 8, 8))
         self.label_received_time = QLabel('--:--:--')
         self.label_received_time.setAlignment(Qt.AlignCenter)
-        self.label_received_time.setStyleSheet("""
-            QLabel {
-                font-size: 15pt;
-                font-weight: 600;
-                color: #34C759;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 rgba(255, 255, 255, 0.9),
-                            stop:1 rgba(248, 248, 250, 0.9));
-                border: 1px solid rgba(52, 199, 89, 0.15);
-                border-radius: 10px;
-                padding: 10px;
-                min-height: 35px;
-            }
-        """)
+        self.label_received_time.setObjectName('recvTime')
         self.label_received_time.setContextMenuPolicy(Qt.CustomContextMenu)
         self.label_received_time.customContextMenuRequested.connect(self.configure_received_clock)
         self.label_received_time.setCursor(Qt.PointingHandCursor)
@@ -2319,66 +3559,19 @@ class SerialMonitorApp(QMainWindow):
         
         self.label_received_date = QLabel('----/--/--')
         self.label_received_date.setAlignment(Qt.AlignCenter)
-        self.label_received_date.setStyleSheet("""
-            QLabel {
-                font-size: 10pt;
-                color: #86868B;
-                background-color: transparent;
-                padding: 5px;
-                font-weight: 500;
-            }
-        """)
+        self.label_received_date.setObjectName('recvDate')
         received_clock_layout.addWidget(self.label_received_date)
         
         # 添加配置和校准按钮
         btn_layout = QHBoxLayout()
         btn_config_clock = QPushButton('配置')
-        btn_config_clock.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ffffff, stop:1 #f5f7fa);
-                border: 1px solid #dcdfe6;
-                border-bottom: 2px solid #c0c4cc;
-                border-radius: 10px;
-                color: #606266;
-                font-size: 7pt;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #ecf5ff;
-                color: #409EFF;
-                border-color: #c6e2ff;
-            }
-            QPushButton:pressed {
-                background-color: #f5f7fa;
-                border-top: 2px solid #c0c4cc;
-                border-bottom: none;
-            }
-        """)
+        btn_config_clock.setObjectName('clockConfigBtn')
         btn_config_clock.setMaximumHeight(20)
         btn_config_clock.clicked.connect(self.configure_received_clock)
         btn_layout.addWidget(btn_config_clock)
         
         btn_calibrate_time = QPushButton('时间校准')
-        btn_calibrate_time.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #FF9800, stop:1 #F57C00);
-                border: 1px solid #F57C00;
-                border-bottom: 2px solid #E65100;
-                border-radius: 10px;
-                color: white;
-                font-size: 7pt;
-                font-weight: bold;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #FFB74D, stop:1 #FF9800);
-            }
-            QPushButton:pressed {
-                background-color: #F57C00;
-                border-top: 2px solid #E65100;
-                border-bottom: none;
-            }
-        """)
+        btn_calibrate_time.setObjectName('clockCalibrateBtn')
         btn_calibrate_time.setMaximumHeight(20)
         btn_calibrate_time.setToolTip('发送电脑当前时间到设备')
         btn_calibrate_time.clicked.connect(self.calibrate_time)
@@ -2396,10 +3589,14 @@ class SerialMonitorApp(QMainWindow):
         # 保存时钟分割器引用
         self.clock_splitter = clock_splitter
         
-        # 系统时钟更新定时器
+        # 系统时钟更新定时器：全局只有一个，格式化一次后通过clock_tick分发给各时钟显示
         self.system_clock_timer = QTimer()
+        self.system_clock_timer.setTimerType(Qt.CoarseTimer)
         self.system_clock_timer.timeout.connect(self.update_system_clock)
-        self.system_clock_timer.start(1000)  # 每秒1秒更新
+        self.clock_tick.connect(self.label_system_time.setText)
+        self.clock_tick.connect(self._set_system_date)
+        self._clock_time_text = ''  # 上次发出的时间字符串
+        # 定时器只在时间显示dock可见时运行（见_on_clock_dock_visibility）
         
         # 曲线控制栏
         curve_control_layout = QHBoxLayout()
@@ -2408,170 +3605,63 @@ class SerialMonitorApp(QMainWindow):
         # 曲线配置按钮
         btn_configure_curves = QPushButton('配置曲线')
         btn_configure_curves.setMinimumHeight(28)
-        btn_configure_curves.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #2196F3, stop:1 #1976D2);
-                border: 1px solid #1976D2;
-                border-bottom: 2px solid #0D47A1;
-                border-radius: 6px;
-                color: white;
-                font-size: 8pt;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #42A5F5, stop:1 #2196F3);
-            }
-            QPushButton:pressed {
-                background-color: #1976D2;
-                border-top: 2px solid #0D47A1;
-                border-bottom: none;
-            }
-        """)
+        btn_configure_curves.setObjectName('curveConfigBtn')
         btn_configure_curves.setToolTip('配置曲线名称、数据源、颜色等')
         btn_configure_curves.clicked.connect(self.configure_curves)
         curve_control_layout.addWidget(btn_configure_curves)
         
-        # 显示曲线复选框（最多50条）
+        # 显示曲线复选框（最多50条），按需创建，启动时只创建默认启用的前3条
         curve_control_layout.addWidget(QLabel('显示:'))
-        self.curve_checkboxes = []
-        for i in range(50):
-            checkbox = QCheckBox(f'曲线{i+1}')
-            checkbox.setChecked(i < 3)  # 默认前3条启用
-            checkbox.toggled.connect(lambda checked, idx=i: self.toggle_curve(idx, checked))
-            curve_control_layout.addWidget(checkbox)
-            self.curve_checkboxes.append(checkbox)
-            if i >= 3:  # 默认隐藏后两个
-                checkbox.hide()
+        self.curve_checkboxes = [None] * 50
+        self._curve_checkbox_layout = QHBoxLayout()
+        self._curve_checkbox_layout.setSpacing(8)
+        curve_control_layout.addLayout(self._curve_checkbox_layout)
+        for i in range(3):
+            self._ensure_curve_checkbox(i)
         
         # 添加分隔线
        
-        separator1 = QLabel('|')
-        separator1.setStyleSheet('color: #ccc; font-weight: bold;')
-        curve_control_layout.addWidget(separator1)
+        curve_control_layout.addWidget(_make_separator())
         
         # X轴缩放控制
         curve_control_layout.addWidget(QLabel('X轴:'))
-        btn_x_zoom_in = QPushButton('放大')
-        btn_x_zoom_in.setMinimumWidth(50)
-        btn_x_zoom_in.setMaximumWidth(65)
-        btn_x_zoom_in.setMinimumHeight(28)
-        btn_x_zoom_in.setStyleSheet('''
-            QPushButton {
-                font-size: 8pt;
-                font-weight: 600;
-                color: #007AFF;
-                background-color: rgba(255, 255, 255, 0.8);
-                border: 1px solid rgba(0, 122, 255, 0.3);
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #007AFF;
-                color: white;
-            }
-            QPushButton:pressed {
-                background-color: rgba(0, 100, 220, 0.9);
-            }
-        ''')
-        btn_x_zoom_in.setToolTip('放大X轴(显示更少时间范围)')
-        btn_x_zoom_in.clicked.connect(lambda: self.plot_canvas.zoom_x(0.8))
-        curve_control_layout.addWidget(btn_x_zoom_in)
-        
-        btn_x_zoom_out = QPushButton('缩小')
-        btn_x_zoom_out.setMinimumWidth(50)
-        btn_x_zoom_out.setMaximumWidth(65)
-        btn_x_zoom_out.setMinimumHeight(28)
-        btn_x_zoom_out.setStyleSheet('''
-            QPushButton {
-                font-size: 8pt;
-                font-weight: 600;
-                color: #007AFF;
-                background-color: rgba(255, 255, 255, 0.8);
-                border: 1px solid rgba(0, 122, 255, 0.3);
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #007AFF;
-                color: white;
-            }
-            QPushButton:pressed {
-                background-color: rgba(0, 100, 220, 0.9);
-            }
-        ''')
-        btn_x_zoom_out.setToolTip('缩小X轴(显示更多时间范围)')
-        btn_x_zoom_out.clicked.connect(lambda: self.plot_canvas.zoom_x(1.25))
-        curve_control_layout.addWidget(btn_x_zoom_out)
+        curve_control_layout.addWidget(_make_zoom_button(
+            '放大', 'zoomX', '放大X轴(显示更少时间范围)', lambda: self.plot_canvas.zoom_x(0.8)))
+        curve_control_layout.addWidget(_make_zoom_button(
+            '缩小', 'zoomX', '缩小X轴(显示更多时间范围)', lambda: self.plot_canvas.zoom_x(1.25)))
         
         # 添加分隔线
-        separator2 = QLabel('|')
-        separator2.setStyleSheet('color: #ccc; font-weight: bold;')
-        curve_control_layout.addWidget(separator2)
+        curve_control_layout.addWidget(_make_separator())
         
         # Y轴缩放控制
         curve_control_layout.addWidget(QLabel('Y轴:'))
-        btn_y_zoom_in = QPushButton('放大')
-        btn_y_zoom_in.setMinimumWidth(50)
-        btn_y_zoom_in.setMaximumWidth(65)
-        btn_y_zoom_in.setMinimumHeight(28)
-        btn_y_zoom_in.setStyleSheet('''
-            QPushButton {
-                font-size: 8pt;
-                font-weight: 600;
-                color: #34C759;
-                background-color: rgba(255, 255, 255, 0.8);
-                border: 1px solid rgba(52, 199, 89, 0.3);
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #34C759;
-                color: white;
-            }
-            QPushButton:pressed {
-                background-color: rgba(40, 180, 70, 0.9);
-            }
-        ''')
-        btn_y_zoom_in.setToolTip('放大Y轴(显示更小数值范围)')
-        btn_y_zoom_in.clicked.connect(lambda: self.plot_canvas.zoom_y(0.8))
-        curve_control_layout.addWidget(btn_y_zoom_in)
-        
-        btn_y_zoom_out = QPushButton('缩小')
-        btn_y_zoom_out.setMinimumWidth(50)
-        btn_y_zoom_out.setMaximumWidth(65)
-        btn_y_zoom_out.setMinimumHeight(28)
-        btn_y_zoom_out.setStyleSheet('''
-            QPushButton {
-                font-size: 8pt;
-                font-weight: 600;
-                color: #34C759;
-                background-color: rgba(255, 255, 255, 0.8);
-                border: 1px solid rgba(52, 199, 89, 0.3);
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #34C759;
-                color: white;
-            }
-            QPushButton:pressed {
-                background-color: rgba(40, 180, 70, 0.9);
-            }
-        ''')
-        btn_y_zoom_out.setToolTip('缩小Y轴(显示更大数值范围)')
-        btn_y_zoom_out.clicked.connect(lambda: self.plot_canvas.zoom_y(1.25))
-        curve_control_layout.addWidget(btn_y_zoom_out)
+        curve_control_layout.addWidget(_make_zoom_button(
+            '放大', 'zoomY', '放大Y轴(显示更小数值范围)', lambda: self.plot_canvas.zoom_y(0.8)))
+        curve_control_layout.addWidget(_make_zoom_button(
+            '缩小', 'zoomY', '缩小Y轴(显示更大数值范围)', lambda: self.plot_canvas.zoom_y(1.25)))
         
         # 添加分隔线
-        separator3 = QLabel('|')
-        separator3.setStyleSheet('color: #ccc; font-weight: bold;')
-        curve_control_layout.addWidget(separator3)
+        curve_control_layout.addWidget(_make_separator())
         
         # 重置视图按钮
         btn_reset_view = QPushButton('重置视图')
         btn_reset_view.setMinimumWidth(60)
         btn_reset_view.setMinimumHeight(28)
-        btn_reset_view.setStyleSheet('font-size: 8pt;')
+        btn_reset_view.setObjectName('resetViewBtn')
         btn_reset_view.setToolTip('重置为自动缩放模式，显示全部数据')
         btn_reset_view.clicked.connect(self.reset_plot_view)
         curve_control_layout.addWidget(btn_reset_view)
         
+        # 导航工具栏按钮（平移、框选缩放、保存图片），工具栏首次打开时才创建
+        btn_nav_toolbar = QPushButton('工具栏')
+        btn_nav_toolbar.setCheckable(True)
+        btn_nav_toolbar.setMinimumWidth(60)
+        btn_nav_toolbar.setMinimumHeight(28)
+        btn_nav_toolbar.setObjectName('navToolbarBtn')
+        btn_nav_toolbar.setToolTip('显示/隐藏曲线导航工具栏（平移、框选缩放、保存图片）')
+        btn_nav_toolbar.toggled.connect(self.toggle_nav_toolbar)
+        curve_control_layout.addWidget(btn_nav_toolbar)
+        
         curve_control_layout.addStretch()
         
         # 在控制栏右侧添加时钟显示
@@ -2583,150 +3673,99 @@ class SerialMonitorApp(QMainWindow):
         self.plot_canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.plot_canvas.updateGeometry()
         
-        toolbar = NavigationToolbar(self.plot_canvas, self)
+        self._nav_toolbar = None  # matplotlib导航工具栏，首次打开时创建
+        self._plot_main_layout = main_layout
         
         main_layout.addLayout(curve_control_layout)
-        main_layout.addWidget(toolbar)
         main_layout.addWidget(self.plot_canvas, stretch=1)
         
-        dock.setWidget(plot_widget)
-        self.addDockWidget(Qt.TopDockWidgetArea, dock)
-        self.plot_dock = dock
-    
-    def create_dock_windows(self):
-        """创建所有dock窗口"""
-        if self.splash:
-            self.splash.update_progress(30, '正在创建界面组件...')
-        
-        # 0. 曲线绘图dock
-        self.create_plot_dock()
-        
-        if self.splash:
-            self.splash.update_progress(35, '正在创建串口配置...')
-        
-        # 1. 串口配置dock
-        self.create_serial_config_dock()
-        
-        if self.splash:
-            self.splash.update_progress(40, '正在创建数据显示...')
-        
-        # 2. 实时数据显示dock
-        self.create_custom_display_dock()
-        
-        # 3. 位状态显示dock（新增独立窗口）
-        self.create_bit_display_dock()
-        
-        if self.splash:
-            self.splash.update_progress(45, '正在创建发送模块...')
-        
-        # 4. 数据发送dock
-        self.create_send_dock()
-        
-        if self.splash:
-            self.splash.update_progress(55, '正在创建监视模块...')
-        
-        # 5. 数据监视dock
-        self.create_data_monitor_dock()
-        
-        if self.splash:
-            self.splash.update_progress(65, '正在初始化时钟...')
-        
-        # 6. 时钟dock
-        self.create_clock_dock()
-        
-        if self.splash:
-            self.splash.update_progress(70, '正在创建日志窗口...')
-        
-        # 7. 日志窗口dock
-        self.create_log_dock()
-    
-    def create_serial_config_dock(self):
-        """创建串口配置dock窗口"""
-        dock = QDockWidget('串口配置', self)
-        dock.setObjectName('SerialConfigDock')
-        dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
-        # dock.setMinimumWidth(280)  # 移除最小宽度限制
-        
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        panel = QWidget()
-        layout = QVBoxLayout(panel)
-        layout.setSpacing(10)
-        layout.setContentsMargins(5, 5, 5, 5)
-        
-        self.create_serial_config_group(layout)
-        layout.addStretch()
-        
-        scroll.setWidget(panel)
-        dock.setWidget(scroll)
-        self.addDockWidget(Qt.LeftDockWidgetArea, dock)
-        self.serial_config_dock = dock
-    
-    def create_custom_display_dock(self):
-        """创建实时数据显示dock窗口"""
-        dock = QDockWidget('实时数据显示', self)
-        dock.setObjectName('CustomDisplayDock')
-        dock.setAllowedAreas(Qt.AllDockWidgetAreas)
-        # dock.setMinimumWidth(280)  # 移除最小宽度限制
-        
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        panel = QWidget()
-        layout = QVBoxLayout(panel)
-        layout.setSpacing(10)
-        layout.setContentsMargins(5, 5, 5, 5)
-        
-        self.create_custom_display_group(layout)
-        layout.addStretch()
-        
-        scroll.setWidget(panel)
-        dock.setWidget(scroll)
-        self.addDockWidget(Qt.LeftDockWidgetArea, dock)
-        self.custom_display_dock = dock
-    
-    def create_bit_display_dock(self):
-        """创建位(Bit)状态显示dock窗口"""
-        dock = QDockWidget('位(Bit)状态显示', self)
-        dock.setObjectName('BitDisplayDock')
-        dock.setAllowedAreas(Qt.AllDockWidgetAreas)
-        # dock.setMinimumWidth(280)  # 移除最小宽度限制
-        
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        panel = QWidget()
-        layout = QVBoxLayout(panel)
-        layout.setSpacing(10)
-        layout.setContentsMargins(5, 5, 5, 5)
-        
-        self.create_bit_display_group(layout)
-        layout.addStretch()
-        
-        scroll.setWidget(panel)
-        dock.setWidget(scroll)
-        self.addDockWidget(Qt.LeftDockWidgetArea, dock)
-        self.bit_display_dock = dock
+        plot_widget.setUpdatesEnabled(True)
+        dock.setWidget(plot_widget)
+        self.addDockWidget(Qt.TopDockWidgetArea, dock)
+        self.plot_dock = dock
     
-    def create_send_dock(self):
-        """创建数据发送dock窗口"""
-        dock = QDockWidget('数据发送', self)
-        dock.setObjectName('SendDock')
-        dock.setAllowedAreas(Qt.AllDockWidgetAreas)
-        # dock.setMinimumWidth(280)  # 移除最小宽度限制
+    def create_dock_windows(self):
+        """创建所有dock窗口"""
+        # 批量创建期间暂停主窗口的重绘，全部dock加入后统一布局一次
+        self.setUpdatesEnabled(False)
+        try:
+            if self.splash:
+                self.splash.update_progress(30, '正在创建界面组件...')
+            
+            # 0. 曲线绘图dock
+            self.create_plot_dock()
+            
+            if self.splash:
+                self.splash.update_progress(35, '正在创建串口配置...')
+            
+            # 1. 串口配置dock
+            self._create_scroll_dock('serial_config_dock')
+            
+            if self.splash:
+                self.splash.update_progress(40, '正在创建数据显示...')
+            
+            # 2. 实时数据显示dock
+            self._create_scroll_dock('custom_display_dock')
+            
+            # 3. 位状态显示dock（新增独立窗口）
+            self._create_scroll_dock('bit_display_dock')
+            
+            if self.splash:
+                self.splash.update_progress(45, '正在创建发送模块...')
+            
+            # 4. 数据发送dock
+            self._create_scroll_dock('send_dock')
+            
+            if self.splash:
+                self.splash.update_progress(55, '正在创建监视模块...')
+            
+            # 5. 数据监视dock
+            self.create_data_monitor_dock()
+            
+            if self.splash:
+                self.splash.update_progress(65, '正在初始化时钟...')
+            
+            # 6. 时钟dock
+            self.create_clock_dock()
+            
+            if self.splash:
+                self.splash.update_progress(70, '正在创建日志窗口...')
+            
+            # 7. 日志窗口dock
+            self.create_log_dock()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    # 带滚动区的dock窗口：属性名 -> (标题, objectName, 允许停靠区域, 内容创建方法名)
+    _SCROLL_DOCKS = {
+        'serial_config_dock': ('串口配置', 'SerialConfigDock',
+                               Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea, 'create_serial_config_group'),
+        'custom_display_dock': ('实时数据显示', 'CustomDisplayDock',
+                                Qt.AllDockWidgetAreas, 'create_custom_display_group'),
+        'bit_display_dock': ('位(Bit)状态显示', 'BitDisplayDock',
+                             Qt.AllDockWidgetAreas, 'create_bit_display_group'),
+        'send_dock': ('数据发送', 'SendDock', Qt.AllDockWidgetAreas, 'create_send_group'),
+    }
+    
+    def _create_scroll_dock(self, attr_name):
+        """按_SCROLL_DOCKS创建dock窗口：dock -> 滚动区 -> 面板 -> 内容组，停靠在左侧并保存为self.<attr_name>"""
+        title, object_name, allowed_areas, builder_name = self._SCROLL_DOCKS[attr_name]
+        dock = QDockWidget(title, self)
+        dock.setObjectName(object_name)
+        dock.setAllowedAreas(allowed_areas)
         
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         panel = QWidget()
-        layout = QVBoxLayout(panel)
-        layout.setSpacing(10)
-        layout.setContentsMargins(5, 5, 5, 5)
+        layout = _make_vbox(panel, spacing=10, margins=_DOCK_MARGINS)
         
-        self.create_send_group(layout)
+        getattr(self, builder_name)(layout)
         layout.addStretch()
         
         scroll.setWidget(panel)
         dock.setWidget(scroll)
         self.addDockWidget(Qt.LeftDockWidgetArea, dock)
-        self.send_dock = dock
+        setattr(self, attr_name, dock)
     
     def create_data_monitor_dock(self):
         """创建数据监视dock窗口"""
@@ -2736,8 +3775,7 @@ class SerialMonitorApp(QMainWindow):
         dock.setMinimumWidth(280)  # 设置最小宽度，防止被挤压
         
         panel = QWidget()
-        layout = QVBoxLayout(panel)
-        layout.setContentsMargins(5, 5, 5, 5)
+        layout = _make_vbox(panel, margins=_DOCK_MARGINS)
         
         # 显示控制栏
         control_layout = QHBoxLayout()
@@ -2775,13 +3813,15 @@ class SerialMonitorApp(QMainWindow):
         layout.addLayout(control_layout)
         
         # 收发数据显示区
-        self.text_data_display = QTextEdit()
+        self.text_data_display = QPlainTextEdit()
         self.text_data_display.setReadOnly(True)
-        self.text_data_display.setFont(QFont("Courier New", 9))
+        self.text_data_display.setMaximumBlockCount(2000)  # 限制显示行数，超出时自动删除最旧的行
+        self.text_data_display.setFont(self._font_courier)
         layout.addWidget(self.text_data_display)
         
         # 数据缓存
-        self.data_log = []
+        self.data_log = DataLog(1000)
+        self._rendered_display_format = self._display_format()  # 显示区文本当前使用的显示选项
         
         dock.setWidget(panel)
         self.addDockWidget(Qt.BottomDockWidgetArea, dock)
@@ -2804,6 +3844,7 @@ class SerialMonitorApp(QMainWindow):
         
         dock.setWidget(panel)
         self.addDockWidget(Qt.TopDockWidgetArea, dock)
+        dock.visibilityChanged.connect(self._on_clock_dock_visibility)
         self.clock_dock = dock
     
     def create_log_dock(self):
@@ -2814,8 +3855,7 @@ class SerialMonitorApp(QMainWindow):
         dock.setMinimumWidth(350)  # 设置最小宽度，防止被挤压
         
         panel = QWidget()
-        layout = QVBoxLayout(panel)
-        layout.setContentsMargins(5, 5, 5, 5)
+        layout = _make_vbox(panel, margins=_DOCK_MARGINS)
         
         # 控制栏
         control_layout = QHBoxLayout()
@@ -2838,11 +3878,12 @@ class SerialMonitorApp(QMainWindow):
         layout.addLayout(control_layout)
         
         # 日志显示区
-        self.text_log = QTextEdit()
+        self.text_log = QPlainTextEdit()
         self.text_log.setReadOnly(True)
-        self.text_log.setFont(QFont("Consolas", 9))
+        self.text_log.setMaximumBlockCount(1000)  # 限制日志行数
+        self.text_log.setFont(self._font_consolas)
         self.text_log.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                             stop:0 rgba(30, 30, 30, 0.95),
                             stop:1 rgba(20, 20, 20, 0.95));
@@ -2859,154 +3900,79 @@ class SerialMonitorApp(QMainWindow):
         self.addDockWidget(Qt.BottomDockWidgetArea, dock)
         self.log_dock = dock
     
+    # 菜单动作表：菜单键 -> ((文本, 快捷键, 槽方法名, 提示), ...)，None表示分隔线
+    _MENU_SPECS = {
+        '数据': (
+            ('导出Excel...', 'Ctrl+E', 'export_to_excel', '导出曲线数据到Excel文件'),
+            ('导出图片...', 'Ctrl+I', 'export_to_image', '保存曲线截图为图片'),
+            ('导出原始数据...', None, 'export_raw_data', '导出收到的原始串口数据'),
+            None,
+            ('设置自动保存路径...', None, 'browse_auto_save_path', '设置超过2小时自动保存的路径'),
+            None,
+            ('清空曲线数据', 'Ctrl+Shift+C', 'clear_plot_data', '清除所有曲线数据'),
+        ),
+        '配置': (
+            ('保存配置', 'Ctrl+S', 'save_config', '保存当前配置到serial_config.json'),
+            None,
+            ('接收协议管理...', None, 'open_protocol_manager', '配置和管理接收数据协议'),
+            None,
+            ('导出配置...', 'Ctrl+Shift+E', 'export_config_file', '保存当前所有配置到文件'),
+            ('导入配置...', 'Ctrl+Shift+I', 'import_config_file', '从文件加载配置'),
+            None,
+            ('导出窗口布局...', None, 'export_window_layout_file', '保存当前窗口布局到文件'),
+            ('导入窗口布局...', None, 'import_window_layout_file', '从文件加载窗口布局'),
+        ),
+        '窗口': (
+            ('保存当前布局为默认', 'Ctrl+Shift+S', 'save_current_as_default_layout', '将当前窗口布局保存为默认布局'),
+            ('恢复默认布局', 'Ctrl+0', 'restore_default_layout', '恢复到保存的默认窗口布局'),
+        ),
+        '背景设置': (
+            ('选择背景图片...', None, 'choose_background_image', None),
+            ('清除背景图片', None, 'clear_background_image', None),
+            None,
+            ('调整透明度...', None, 'adjust_background_opacity', None),
+        ),
+        '关于': (
+            ('关于本软件', 'F1', 'show_about_dialog', None),
+        ),
+    }
+    
+    def _add_menu_actions(self, menu, menu_key):
+        """按_MENU_SPECS[menu_key]向菜单批量添加动作，快捷键取自_key_sequence缓存"""
+        for spec in self._MENU_SPECS[menu_key]:
+            if spec is None:
+                menu.addSeparator()
+                continue
+            text, shortcut, slot_name, tooltip = spec
+            action = QAction(text, self)
+            if shortcut:
+                action.setShortcut(_key_sequence(shortcut))
+            if tooltip:
+                action.setToolTip(tooltip)
+            action.triggered.connect(getattr(self, slot_name))
+            menu.addAction(action)
+    
     def create_window_menu(self):
         """创建窗口菜单用于显示/隐藏各个dock"""
         menubar = self.menuBar()
         
-        # 创建数据菜单
-        data_menu = menubar.addMenu('数据')
-        
-        # 数据导出子菜单
-        export_action = QAction('导出Excel...', self)
-        export_action.setShortcut('Ctrl+E')
-        export_action.setToolTip('导出曲线数据到Excel文件')
-        export_action.triggered.connect(self.export_to_excel)
-        data_menu.addAction(export_action)
-        
-        export_image_action = QAction('导出图片...', self)
-        export_image_action.setShortcut('Ctrl+I')
-        export_image_action.setToolTip('保存曲线截图为图片')
-        export_image_action.triggered.connect(self.export_to_image)
-        data_menu.addAction(export_image_action)
-        
-        export_raw_action = QAction('导出原始数据...', self)
-        export_raw_action.setToolTip('导出收到的原始串口数据')
-        export_raw_action.triggered.connect(self.export_raw_data)
-        data_menu.addAction(export_raw_action)
-        
-        data_menu.addSeparator()
-        
-        # 自动保存路径设置
-        auto_save_path_action = QAction('设置自动保存路径...', self)
-        auto_save_path_action.setToolTip('设置超过2小时自动保存的路径')
-        auto_save_path_action.triggered.connect(self.browse_auto_save_path)
-        data_menu.addAction(auto_save_path_action)
-        
-        data_menu.addSeparator()
-        
-        # 清空数据
-        clear_action = QAction('清空曲线数据', self)
-        clear_action.setShortcut('Ctrl+Shift+C')
-        clear_action.setToolTip('清除所有曲线数据')
-        clear_action.triggered.connect(self.clear_plot_data)
-        data_menu.addAction(clear_action)
-        
-        # 创建配置菜单
-        config_menu = menubar.addMenu('配置')
-        
-        # 保存配置
-        save_config_action = QAction('保存配置', self)
-        save_config_action.setShortcut('Ctrl+S')
-        save_config_action.setToolTip('保存当前配置到serial_config.json')
-        save_config_action.triggered.connect(self.save_config)
-        config_menu.addAction(save_config_action)
-        
-        config_menu.addSeparator()
-        
-        # 协议管理
-        protocol_action = QAction('接收协议管理...', self)
-        protocol_action.setToolTip('配置和管理接收数据协议')
-        protocol_action.triggered.connect(self.open_protocol_manager)
-        config_menu.addAction(protocol_action)
-        
-        config_menu.addSeparator()
-        
-        export_config_action = QAction('导出配置...', self)
-        export_config_action.setShortcut('Ctrl+Shift+E')
-        export_config_action.setToolTip('保存当前所有配置到文件')
-        export_config_action.triggered.connect(self.export_config_file)
-        config_menu.addAction(export_config_action)
-        
-        import_config_action = QAction('导入配置...', self)
-        import_config_action.setShortcut('Ctrl+Shift+I')
-        import_config_action.setToolTip('从文件加载配置')
-        import_config_action.triggered.connect(self.import_config_file)
-        config_menu.addAction(import_config_action)
-        
-        config_menu.addSeparator()
-        
-        # 窗口布局导入/导出
-        export_layout_action = QAction('导出窗口布局...', self)
-        export_layout_action.setToolTip('保存当前窗口布局到文件')
-        export_layout_action.triggered.connect(self.export_window_layout_file)
-        config_menu.addAction(export_layout_action)
-        
-        import_layout_action = QAction('导入窗口布局...', self)
-        import_layout_action.setToolTip('从文件加载窗口布局')
-        import_layout_action.triggered.connect(self.import_window_layout_file)
-        config_menu.addAction(import_layout_action)
+        self._add_menu_actions(menubar.addMenu('数据'), '数据')
+        self._add_menu_actions(menubar.addMenu('配置'), '配置')
         
-        # 创建窗口菜单
+        # 窗口菜单：各个dock的显示/隐藏动作 + 布局保存/恢复
         window_menu = menubar.addMenu('窗口')
-        
-        # 添加各个dock的显示/隐藏动作
         window_menu.addAction(self.plot_dock.toggleViewAction())
         window_menu.addSeparator()
-        window_menu.addAction(self.serial_config_dock.toggleViewAction())
-        window_menu.addAction(self.custom_display_dock.toggleViewAction())
-        window_menu.addAction(self.bit_display_dock.toggleViewAction())
-        window_menu.addAction(self.send_dock.toggleViewAction())
-        window_menu.addAction(self.data_monitor_dock.toggleViewAction())
-        window_menu.addAction(self.clock_dock.toggleViewAction())
-        window_menu.addAction(self.log_dock.toggleViewAction())
-        
+        for dock in (self.serial_config_dock, self.custom_display_dock, self.bit_display_dock,
+                     self.send_dock, self.data_monitor_dock, self.clock_dock, self.log_dock):
+            window_menu.addAction(dock.toggleViewAction())
         window_menu.addSeparator()
+        self._add_menu_actions(window_menu, '窗口')
         
-        # 保存当前布局为默认
-        save_layout_action = QAction('保存当前布局为默认', self)
-        save_layout_action.setShortcut('Ctrl+Shift+S')
-        save_layout_action.setToolTip('将当前窗口布局保存为默认布局')
-        save_layout_action.triggered.connect(self.save_current_as_default_layout)
-        window_menu.addAction(save_layout_action)
-        
-        # 恢复默认布局
-        restore_action = QAction('恢复默认布局', self)
-        restore_action.setShortcut('Ctrl+0')
-        restore_action.setToolTip('恢复到保存的默认窗口布局')
-        restore_action.triggered.connect(self.restore_default_layout)
-        window_menu.addAction(restore_action)
-        
-        # 创建外观菜单
         appearance_menu = menubar.addMenu('外观')
+        self._add_menu_actions(appearance_menu.addMenu('背景设置'), '背景设置')
         
-        # 背景设置子菜单
-        background_menu = appearance_menu.addMenu('背景设置')
-        
-        # 选择背景图片
-        choose_bg_action = QAction('选择背景图片...', self)
-        choose_bg_action.triggered.connect(self.choose_background_image)
-        background_menu.addAction(choose_bg_action)
-        
-        # 清除背景图片
-        clear_bg_action = QAction('清除背景图片', self)
-        clear_bg_action.triggered.connect(self.clear_background_image)
-        background_menu.addAction(clear_bg_action)
-        
-        background_menu.addSeparator()
-        
-        # 透明度设置
-        opacity_action = QAction('调整透明度...', self)
-        opacity_action.triggered.connect(self.adjust_background_opacity)
-        background_menu.addAction(opacity_action)
-        
-        # 创建关于菜单
-        help_menu = menubar.addMenu('关于')
-        
-        # 关于软件
-        about_action = QAction('关于本软件', self)
-        about_action.setShortcut('F1')
-        about_action.triggered.connect(self.show_about_dialog)
-        help_menu.addAction(about_action)
+        self._add_menu_actions(menubar.addMenu('关于'), '关于')
     
     def setup_dock_signals(self):
         """设置dock窗口信号，在布局改变时保存"""
@@ -3044,14 +4010,27 @@ class SerialMonitorApp(QMainWindow):
             if self.is_restoring_layout:
                 return
             
+            state = bytes(self.saveState())
+            geometry = bytes(self.saveGeometry())
+            splitter_sizes = self.clock_splitter.sizes()
+            raw = (state, geometry, tuple(splitter_sizes))
+            if raw == self._last_layout_raw:
+                return  # 布局未变化，无需编码和写盘
+            
             layout_data = {
-                'window_state': self.saveState().toHex().data().decode(),
-                'window_geometry': self.saveGeometry().toHex().data().decode(),
-                'clock_splitter_sizes': self.clock_splitter.sizes()
+                'window_state': state.hex(),
+                'window_geometry': geometry.hex(),
+                'clock_splitter_sizes': splitter_sizes
             }
             
-            with open(self.LAYOUT_FILE, 'w', encoding='utf-8') as f:
-                json.dump(layout_data, f, indent=4, ensure_ascii=False)
+            content = _json_dumps(layout_data)
+            if content == self._last_layout_json:
+                self._last_layout_raw = raw
+                return  # 布局未变化，无需写盘
+            
+            _write_file_atomic(self.LAYOUT_FILE, content)
+            self._last_layout_json = content
+            self._last_layout_raw = raw
             
             print(f"窗口布局已保存到: {self.LAYOUT_FILE}")
         except Exception as e:
@@ -3066,17 +4045,20 @@ class SerialMonitorApp(QMainWindow):
         try:
             self.is_restoring_layout = True
             
-            with open(self.LAYOUT_FILE, 'r', encoding='utf-8') as f:
-                layout_data = json.load(f)
+            with open(self.LAYOUT_FILE, 'rb') as f:
+                content = f.read()
+            layout_data = _json_loads(content)
+            self._last_layout_json = content
+            self._last_layout_raw = None
             
-            # 恢复窗口几何信息（大小和位置）
+            # 恢复窗口几何信息（大小和位置），十六进制直接由Qt解码为QByteArray
             if 'window_geometry' in layout_data:
-                window_geometry = bytes.fromhex(layout_data['window_geometry'])
+                window_geometry = QByteArray.fromHex(layout_data['window_geometry'].encode('ascii'))
                 self.restoreGeometry(window_geometry)
             
             # 恢复dock窗口状态
             if 'window_state' in layout_data:
-                window_state = bytes.fromhex(layout_data['window_state'])
+                window_state = QByteArray.fromHex(layout_data['window_state'].encode('ascii'))
                 result = self.restoreState(window_state)
                 
                 if not result:
@@ -3091,14 +4073,12 @@ class SerialMonitorApp(QMainWindow):
             QApplication.processEvents()
             
             print("窗口布局恢复成功")
-            if hasattr(self, 'text_log'):
-                self.log("窗口布局已恢复", "SUCCESS")
+            self.log("窗口布局已恢复", "SUCCESS")
             return True
             
         except Exception as e:
             print(f"恢复窗口布局错误: {e}")
-            if hasattr(self, 'text_log'):
-                self.log(f"恢复窗口布局错误: {e}", "ERROR")
+            self.log(f"恢复窗口布局错误: {e}", "ERROR")
             import traceback
             traceback.print_exc()
             return False
@@ -3114,13 +4094,14 @@ class SerialMonitorApp(QMainWindow):
                 'clock_splitter_sizes': self.clock_splitter.sizes()
             }
             
-            with open(self.LAYOUT_FILE, 'w', encoding='utf-8') as f:
-                json.dump(layout_data, f, indent=4, ensure_ascii=False)
+            content = _json_dumps(layout_data)
+            _write_file_atomic(self.LAYOUT_FILE, content)
+            self._last_layout_json = content
+            self._last_layout_raw = None
             
             QMessageBox.information(self, "成功", "当前布局已保存为默认布局")
             print("默认布局已保存")
-            if hasattr(self, 'text_log'):
-                self.log("当前布局已保存为默认布局", "SUCCESS")
+            self.log("当前布局已保存为默认布局", "SUCCESS")
         except Exception as e:
             QMessageBox.warning(self, "错误", f"保存默认布局失败: {e}")
             print(f"保存默认布局失败: {e}")
@@ -3146,8 +4127,7 @@ class SerialMonitorApp(QMainWindow):
             if result:
                 QMessageBox.information(self, "成功", "默认布局已恢复")
                 print("默认布局已恢复")
-                if hasattr(self, 'text_log'):
-                    self.log("默认布局已恢复", "SUCCESS")
+                self.log("默认布局已恢复", "SUCCESS")
             else:
                 QMessageBox.warning(self, "警告", "恢复默认布局失败，请检查布局文件")
             
@@ -3202,7 +4182,9 @@ class SerialMonitorApp(QMainWindow):
         # COM口选择
         self.combo_port = QComboBox()
         self.combo_port.setMinimumHeight(28)
-        self.refresh_com_ports()
+        # 启动时同步枚举一次，保证加载配置时能选中上次使用的端口
+        self._ports_refreshed_at = time.monotonic()
+        self._apply_com_ports(_list_port_devices())
         layout.addWidget(self.combo_port, 1, 0, 1, 2)
         
         btn_refresh = QPushButton("刷新")
@@ -3230,23 +4212,22 @@ class SerialMonitorApp(QMainWindow):
         
         # 隐藏的配置控件（用于保存配置）
         self.combo_baudrate = QComboBox()
-        self.combo_baudrate.addItems(['2400', '4800', '9600', '14400', '19200', '38400', 
-                                      '57600', '115200', '128000', '256000', '460800', '921600'])
+        self.combo_baudrate.setModel(_option_model(_BAUD_RATES))
         self.combo_baudrate.setCurrentText('115200')
         self.combo_baudrate.hide()
         
         self.combo_databits = QComboBox()
-        self.combo_databits.addItems(['5', '6', '7', '8'])
+        self.combo_databits.setModel(_option_model(_DATA_BITS))
         self.combo_databits.setCurrentText('8')
         self.combo_databits.hide()
         
         self.combo_stopbits = QComboBox()
-        self.combo_stopbits.addItems(['1', '1.5', '2'])
+        self.combo_stopbits.setModel(_option_model(_STOP_BITS))
         self.combo_stopbits.setCurrentText('1')
         self.combo_stopbits.hide()
         
         self.combo_parity = QComboBox()
-        self.combo_parity.addItems(['None', 'Even', 'Odd', 'Mark', 'Space'])
+        self.combo_parity.setModel(_option_model(_PARITIES))
         self.combo_parity.setCurrentText('None')
         self.combo_parity.hide()
         
@@ -3283,19 +4264,8 @@ class SerialMonitorApp(QMainWindow):
         # 连接按钮
         self.btn_connect = QPushButton("打开串口")
         self.btn_connect.setMinimumHeight(38)
-        self.btn_connect.setStyleSheet("""
-            QPushButton { 
-                background-color: #4CAF50; 
-                color: white; 
-                font-weight: bold; 
-                font-size: 8pt;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.btn_connect.setObjectName('connectBtn')
+        self.btn_connect.setProperty('state', 'initial')
         self.btn_connect.clicked.connect(self.toggle_serial)
         layout.addWidget(self.btn_connect, 5, 0, 1, 3)
         
@@ -3307,7 +4277,8 @@ class SerialMonitorApp(QMainWindow):
         # 状态标签
         self.label_recording_status = QLabel("等待开始记录")
         self.label_recording_status.setAlignment(Qt.AlignCenter)
-        self.label_recording_status.setStyleSheet("color: #666; font-size: 8pt;")
+        self.label_recording_status.setObjectName('recordStatus')
+        self.label_recording_status.setProperty('state', 'idle')
         record_layout.addWidget(self.label_recording_status)
         
         # 按钮布局
@@ -3315,49 +4286,13 @@ class SerialMonitorApp(QMainWindow):
         
         self.btn_start_record = QPushButton("开始记录")
         self.btn_start_record.setMinimumHeight(28)
-        self.btn_start_record.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #67c23a, stop:1 #529b2e);
-                border: 1px solid #529b2e;
-                border-bottom: 2px solid #3e7523;
-                border-radius: 6px;
-                color: white;
-                font-weight: bold;
-                font-size: 8pt;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #85ce61, stop:1 #67c23a);
-            }
-            QPushButton:pressed {
-                background-color: #529b2e;
-                border-top: 2px solid #3e7523;
-                border-bottom: none;
-            }
-        """)
+        self.btn_start_record.setObjectName('startRecordBtn')
         self.btn_start_record.clicked.connect(self.start_curve_recording)
         btn_record_layout.addWidget(self.btn_start_record)
         
         self.btn_stop_record = QPushButton("完成记录")
         self.btn_stop_record.setMinimumHeight(28)
-        self.btn_stop_record.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #E6A23C, stop:1 #d48806);
-                border: 1px solid #d48806;
-                border-bottom: 2px solid #b87100;
-                border-radius: 6px;
-                color: white;
-                font-weight: bold;
-                font-size: 8pt;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ebb563, stop:1 #E6A23C);
-            }
-            QPushButton:pressed {
-                background-color: #d48806;
-                border-top: 2px solid #b87100;
-                border-bottom: none;
-            }
-        """)
+        self.btn_stop_record.setObjectName('stopRecordBtn')
         self.btn_stop_record.clicked.connect(self.finish_curve_recording)
         btn_record_layout.addWidget(self.btn_stop_record)
         
@@ -3373,9 +4308,7 @@ class SerialMonitorApp(QMainWindow):
         self.custom_display_group = QGroupBox("实时数据显示")
         self.custom_display_group.setCheckable(True)
         self.custom_display_group.setChecked(True)
-        layout = QVBoxLayout()
-        layout.setSpacing(4)
-        layout.setContentsMargins(5, 10, 5, 5)
+        layout = _make_vbox(spacing=4, margins=_GROUP_MARGINS)
         
         # 显示窗口数量控制
         control_layout = QHBoxLayout()
@@ -3394,82 +4327,66 @@ class SerialMonitorApp(QMainWindow):
         control_layout.addStretch()
         layout.addLayout(control_layout)
         
-        # 创建50个显示窗口
-        self.display_widgets = []  # 保存每个显示窗口的容器
-        for i in range(50):
-            display_widget = QWidget()
-            display_layout = QHBoxLayout(display_widget)
-            display_layout.setContentsMargins(0, 1, 0, 1)
-            
-            # 显示标签(可点击配置)
-            label = QLabel(f'显示{i+1}: --')
-            label.setStyleSheet("""
-                QLabel {
-                    background-color: #f8f9fa;
-                    border: 2px solid #dee2e6;
-                    border-radius: 4px;
-                    padding: 3px;
-                    font-size: 7pt;
-                    font-weight: bold;
-                }
-                QLabel:hover {
-                    background-color: #e9ecef;
-                    border-color: #adb5bd;
-                }
-            """)
-            label.setMinimumHeight(28)
-            label.setAlignment(Qt.AlignCenter)
-            label.setContextMenuPolicy(Qt.CustomContextMenu)
-            label.customContextMenuRequested.connect(lambda pos, idx=i: self.configure_custom_display(idx))
-            label.setCursor(Qt.PointingHandCursor)
-            label.setToolTip('右键配置此显示窗口')
-            
-            # 配置按钮
-            btn_config = QPushButton('⚙')
-            btn_config.setMinimumWidth(26)
-            btn_config.setMaximumWidth(26)
-            btn_config.setMinimumHeight(28)
-            btn_config.setToolTip('配置此显示窗口')
-            btn_config.setStyleSheet("""
-                QPushButton {
-                    background-color: #6c757d;
-                    color: white;
-                    border-radius: 5px;
-                    font-size: 8pt;
-                }
-                QPushButton:hover {
-                    background-color: #5a6268;
-                }
-            """)
-            btn_config.clicked.connect(lambda checked, idx=i: self.configure_custom_display(idx))
-            
-            display_layout.addWidget(label, stretch=1)
-            display_layout.addWidget(btn_config)
-            
-            layout.addWidget(display_widget)
-            self.custom_display_labels.append(label)
-            self.display_widgets.append(display_widget)
-            
-            # 默认只显示前5个
-            if i >= 5:
-                display_widget.hide()
+        # 显示窗口按需创建（最多50个），启动时只创建当前显示数量的窗口
+        self._display_windows_layout = _make_vbox(spacing=4)
+        layout.addLayout(self._display_windows_layout)
+        self._ensure_display_widgets(self.spin_display_count.value())
         
         # 提示
         tip_label = QLabel('提示: 右键或点击⚙配置显示内容')
-        tip_label.setStyleSheet('color: #666; font-size: 8pt; font-style: italic;')
+        tip_label.setProperty('cls', 'tip')
         layout.addWidget(tip_label)
         
         self.custom_display_group.setLayout(layout)
         parent_layout.addWidget(self.custom_display_group)
     
+    def _ensure_display_widgets(self, count):
+        """确保前count个自定义显示窗口已创建"""
+        for index in range(len(self.display_widgets), min(count, 50)):
+            self._create_display_widget(index)
+    
+    def _create_display_widget(self, index):
+        """创建第index个自定义显示窗口并加入显示区，已有配置时显示配置名称"""
+        display_widget = QWidget()
+        display_layout = QHBoxLayout(display_widget)
+        display_layout.setContentsMargins(0, 1, 0, 1)
+        
+        # 显示标签(可点击配置)
+        label = QLabel(f'显示{index+1}: --')
+        config = self.custom_displays.get(index)
+        if config and config.get('enabled', True):
+            label.setText(f"{config.get('name', f'显示窗口{index+1}')}: --")
+        label.setProperty('cls', 'customDisplay')
+        label.setProperty('state', 'blank')
+        label.setMinimumHeight(28)
+        label.setAlignment(Qt.AlignCenter)
+        label.setContextMenuPolicy(Qt.CustomContextMenu)
+        label.customContextMenuRequested.connect(partial(self.configure_custom_display, index))
+        label.setCursor(Qt.PointingHandCursor)
+        label.setToolTip('右键配置此显示窗口')
+        
+        # 配置按钮
+        btn_config = QPushButton('⚙')
+        btn_config.setMinimumWidth(26)
+        btn_config.setMaximumWidth(26)
+        btn_config.setMinimumHeight(28)
+        btn_config.setToolTip('配置此显示窗口')
+        btn_config.setProperty('cls', 'displayConfigBtn')
+        btn_config.clicked.connect(partial(self.configure_custom_display, index))
+        
+        display_layout.addWidget(label, stretch=1)
+        display_layout.addWidget(btn_config)
+        
+        self._display_windows_layout.addWidget(display_widget)
+        self.custom_display_labels.append(label)
+        self.display_widgets.append(display_widget)
+    
     def create_bit_display_group(self, parent_layout):
         """创建位显示窗口组"""
         group = QGroupBox("位(Bit)状态显示")
         group.setCheckable(True)
         group.setChecked(True)
-        layout = QVBoxLayout()
-        layout.setSpacing(4)
-        layout.setContentsMargins(5, 10, 5, 5)
+        layout = _make_vbox(spacing=4, margins=_GROUP_MARGINS)
         
         # 显示窗口数量控制
         control_layout = QHBoxLayout()
@@ -3488,108 +4405,58 @@ class SerialMonitorApp(QMainWindow):
         control_layout.addStretch()
         layout.addLayout(control_layout)
         
-        # 创建50个位显示窗口
-        for window_idx in range(50):
-            window_group = QGroupBox(f'位显示窗口 {window_idx + 1}')
-            window_layout = QVBoxLayout()
-            window_layout.setSpacing(1)
-            
-            # 配置按钮行
-            config_layout = QHBoxLayout()
-            name_label = QLabel(f'窗口名称: 未配置')
-            self.bit_display_name_labels.append(name_label)
-            config_layout.addWidget(name_label)
-            btn_config = QPushButton('⚙ 配置')
-            btn_config.setMaximumWidth(60)
-            btn_config.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ffffff, stop:1 #f5f7fa);
-                    border: 1px solid #dcdfe6;
-                    border-bottom: 2px solid #c0c4cc;
-                    border-radius: 4px;
-                    color: #606266;
-                    font-size: 7pt;
-                    padding: 1px;
-                }
-                QPushButton:hover {
-                    background-color: #ecf5ff;
-                    color: #409EFF;
-                    border-color: #c6e2ff;
-                }
-                QPushButton:pressed {
-                    background-color: #f5f7fa;
-                    border-top: 2px solid #c0c4cc;
-                    border-bottom: none;
-                }
-            """)
-            btn_config.clicked.connect(lambda checked, idx=window_idx: self.configure_bit_display(idx))
-            config_layout.addStretch()
-            config_layout.addWidget(btn_config)
-            window_layout.addLayout(config_layout)
-            
-            # 位显示区域（4行x2列，显示8个位）
-            bits_grid = QGridLayout()
-            bits_grid.setSpacing(1)
-            
-            window_bit_labels = []
-            for bit_idx in range(8):
-                row = bit_idx // 2
-                col = bit_idx % 2
-                
-                bit_widget = QWidget()
-                bit_layout = QHBoxLayout(bit_widget)
-                bit_layout.setContentsMargins(1, 1, 1, 1)
-                bit_layout.setSpacing(2)
-                
-                # 位名称
-                name_label = QLabel(f'Bit{bit_idx}')
-                name_label.setMinimumWidth(60)
-                name_label.setStyleSheet('font-size: 7pt;')
-                bit_layout.addWidget(name_label)
-                
-                # 状态指示器（圆点）
-                status_label = QLabel('●')
-                status_label.setStyleSheet('color: #ccc; font-size: 12pt;')
-                status_label.setAlignment(Qt.AlignCenter)
-                status_label.setMinimumWidth(25)
-                bit_layout.addWidget(status_label)
-                
-                bit_widget.setStyleSheet("""
-                    QWidget {
-                        background-color: #f8f9fa;
-                        border: 1px solid #dee2e6;
-                        border-radius: 4px;
-                    }
-                """)
-                
-                bits_grid.addWidget(bit_widget, row, col)
-                window_bit_labels.append((name_label, status_label))
-            
-            window_layout.addLayout(bits_grid)
-            window_group.setLayout(window_layout)
-            layout.addWidget(window_group)
-            
-            self.bit_display_labels.append(window_bit_labels)
-            self.bit_display_widgets.append(window_group)
-            
-            # 默认只显示前2个
-            if window_idx >= 2:
-                window_group.hide()
+        # 位显示窗口按需创建（最多50个），启动时只创建当前显示数量的窗口
+        self._bit_windows_layout = QVBoxLayout()
+        self._bit_windows_layout.setSpacing(4)
+        layout.addLayout(self._bit_windows_layout)
+        self._ensure_bit_display_windows(self.spin_bit_display_count.value())
         
         # 提示
         tip_label = QLabel('提示: 点击配置按钮设置要监控的字节和位名称')
-        tip_label.setStyleSheet('color: #666; font-size: 8pt; font-style: italic;')
+        tip_label.setProperty('cls', 'tip')
         layout.addWidget(tip_label)
         
         group.setLayout(layout)
         parent_layout.addWidget(group)
     
+    def _ensure_bit_display_windows(self, count):
+        """确保前count个位显示窗口已创建，新建窗口时应用已有的配置"""
+        for window_idx in range(len(self.bit_display_widgets), min(count, 50)):
+            self._create_bit_display_window(window_idx)
+            self.update_bit_display_config(window_idx)
+    
+    def _create_bit_display_window(self, window_idx):
+        """创建第window_idx个位显示窗口并加入位显示区"""
+        window_group = QGroupBox(f'位显示窗口 {window_idx + 1}')
+        window_layout = QVBoxLayout()
+        window_layout.setSpacing(1)
+        
+        # 配置按钮行
+        config_layout = QHBoxLayout()
+        name_label = QLabel(f'窗口名称: 未配置')
+        self.bit_display_name_labels.append(name_label)
+        config_layout.addWidget(name_label)
+        btn_config = QPushButton('⚙ 配置')
+        btn_config.setMaximumWidth(60)
+        btn_config.setProperty('cls', 'bitConfigBtn')
+        btn_config.clicked.connect(partial(self.configure_bit_display, window_idx))
+        config_layout.addStretch()
+        config_layout.addWidget(btn_config)
+        window_layout.addLayout(config_layout)
+        
+        # 位显示区域（4行x2列，显示8个位）
+        bits_grid = BitGridWidget()
+        window_layout.addWidget(bits_grid)
+        window_group.setLayout(window_layout)
+        self._bit_windows_layout.addWidget(window_group)
+        
+        self.bit_display_grids.append(bits_grid)
+        self.bit_display_widgets.append(window_group)
+    
     def create_send_group(self, parent_layout):
         """创建数据发送组"""
         group = QGroupBox("数据发送")
-        layout = QVBoxLayout()
-        layout.setSpacing(5)
-        layout.setContentsMargins(5, 10, 5, 5)
+        layout = _make_vbox(spacing=5, margins=_GROUP_MARGINS)
         
         # 发送输入框
         self.text_send = QTextEdit()
@@ -3618,7 +4485,7 @@ class SerialMonitorApp(QMainWindow):
         mode_layout2.addWidget(crc_label)
         self.combo_send_crc = QComboBox()
         self.combo_send_crc.setStyleSheet("font-size: 8pt;")
-        self.combo_send_crc.addItems(['无', 'CCITT-CRC16', 'Modbus-CRC16', 'CRC16-XMODEM', '累加和', '异或'])
+        self.combo_send_crc.setModel(_option_model(_CRC_TYPES_PRESET))
         mode_layout2.addWidget(self.combo_send_crc)
         mode_layout2.addStretch()
         layout.addLayout(mode_layout2)
@@ -3698,77 +4565,11 @@ class SerialMonitorApp(QMainWindow):
         preset_header.addStretch()
         layout.addLayout(preset_header)
         
-        # 创建50个预设命令按钮(单列布局)
-        preset_vbox = QVBoxLayout()
-        preset_vbox.setSpacing(2)
-        
+        # 预设命令按钮(单列布局)按需创建（最多50个），启动时只创建当前显示数量的按钮
+        self._preset_vbox = _make_vbox(spacing=2)
         self.preset_button_widgets = []  # 保存按钮的容器
-        
-        for i in range(50):
-            # 创建容器widget
-            btn_widget = QWidget()
-            btn_layout = QHBoxLayout(btn_widget)
-            btn_layout.setContentsMargins(0, 0, 0, 0)
-            btn_layout.setSpacing(4)
-            
-            btn = QPushButton(f'预设{i+1}')
-            btn.setMinimumHeight(24)
-            btn.setContextMenuPolicy(Qt.CustomContextMenu)
-            btn.customContextMenuRequested.connect(lambda pos, idx=i: self.configure_preset(idx))
-            btn.clicked.connect(lambda checked, idx=i: self.send_preset_command(idx))
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ffffff, stop:1 #f5f7fa);
-                    border: 1px solid #dcdfe6;
-                    border-bottom: 2px solid #c0c4cc;
-                    border-radius: 6px;
-                    color: #909399;
-                    font-size: 7pt;
-                    text-align: left;
-                    padding-left: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #ecf5ff;
-                    color: #409EFF;
-                    border-color: #c6e2ff;
-                }
-                QPushButton:pressed {
-                    background-color: #f5f7fa;
-                    border-top: 2px solid #c0c4cc;
-                    border-bottom: none;
-                }
-            """)
-            
-            btn_layout.addWidget(btn, stretch=1)
-            
-            # 添加数据填充输入框
-            data_spinbox = QSpinBox()
-            data_spinbox.setRange(0, 65535)
-            data_spinbox.setValue(0)
-            data_spinbox.setMaximumWidth(70)
-            data_spinbox.setMinimumHeight(24)
-            data_spinbox.setToolTip('数据填充框(0-65535)')
-            data_spinbox.setStyleSheet("""
-                QSpinBox {
-                    border: 1px solid #dee2e6;
-                    border-radius: 4px;
-                    padding: 2px;
-                }
-            """)
-            btn_layout.addWidget(data_spinbox)
-            self.preset_data_spinboxes.append(data_spinbox)
-            
-            preset_vbox.addWidget(btn_widget)
-            
-            self.preset_buttons.append(btn)
-            self.preset_button_widgets.append(btn_widget)
-            
-            # 创建定时器
-            timer = QTimer()
-            timer.timeout.connect(lambda idx=i: self.send_preset_command(idx))
-            self.preset_timers.append(timer)
-        
-        layout.addLayout(preset_vbox)
+        layout.addLayout(self._preset_vbox)
+        self._ensure_preset_buttons(self.spin_preset_count.value())
         
         # 提示文本
         tip_label = QLabel('右键点击配置命令')
@@ -3778,6 +4579,49 @@ class SerialMonitorApp(QMainWindow):
         group.setLayout(layout)
         parent_layout.addWidget(group)
     
+    def _ensure_preset_buttons(self, count):
+        """确保前count个预设命令按钮已创建"""
+        for index in range(len(self.preset_buttons), min(count, 50)):
+            self._create_preset_button(index)
+    
+    def _create_preset_button(self, index):
+        """创建第index个预设命令按钮和数据填充框，已有配置名称时直接显示"""
+        # 创建容器widget
+        btn_widget = QWidget()
+        btn_layout = QHBoxLayout(btn_widget)
+        btn_layout.setContentsMargins(0, 0, 0, 0)
+        btn_layout.setSpacing(4)
+        
+        btn = QPushButton(f'预设{index+1}')
+        btn.setMinimumHeight(24)
+        btn.setContextMenuPolicy(Qt.CustomContextMenu)
+        btn.customContextMenuRequested.connect(partial(self.configure_preset, index))
+        btn.clicked.connect(partial(self.send_preset_command, index))
+        btn.setProperty('cls', 'preset')
+        btn.setProperty('state', 'blank')
+        preset = self.preset_commands[index] if index < len(self.preset_commands) else None
+        if preset and preset.get('name'):
+            btn.setText(preset['name'])
+            btn.setProperty('state', 'named')
+        
+        btn_layout.addWidget(btn, stretch=1)
+        
+        # 添加数据填充输入框
+        data_spinbox = QSpinBox()
+        data_spinbox.setRange(0, 65535)
+        data_spinbox.setValue(0)
+        data_spinbox.setMaximumWidth(70)
+        data_spinbox.setMinimumHeight(24)
+        data_spinbox.setToolTip('数据填充框(0-65535)')
+        data_spinbox.setProperty('cls', 'presetData')
+        btn_layout.addWidget(data_spinbox)
+        self.preset_data_spinboxes.append(data_spinbox)
+        
+        self._preset_vbox.addWidget(btn_widget)
+        
+        self.preset_buttons.append(btn)
+        self.preset_button_widgets.append(btn_widget)
+    
     def open_serial_params_dialog(self):
         """打开串口参数配置对话框"""
         # 获取当前参数
@@ -3835,7 +4679,8 @@ class SerialMonitorApp(QMainWindow):
         # 设置状态
         self.is_curve_recording = True
         self.label_recording_status.setText("曲线记录中: 0 点")
-        self.label_recording_status.setStyleSheet("color: #67c23a; font-weight: bold; font-size: 9pt;")
+        _set_style_state(self.label_recording_status, 'recording')
+        self._sync_plot_timer()
         
         # 禁用开始按钮，启用停止按钮
         self.btn_start_record.setEnabled(False)
@@ -3852,7 +4697,8 @@ class SerialMonitorApp(QMainWindow):
         # 重置状态
         self.is_curve_recording = False
         self.label_recording_status.setText("等待重新开始记录")
-        self.label_recording_status.setStyleSheet("color: #666; font-size: 8pt;")
+        _set_style_state(self.label_recording_status, 'idle')
+        self._sync_plot_timer()
         
         # 启用开始按钮，禁用停止按钮
         self.btn_start_record.setEnabled(True)
@@ -3860,19 +4706,46 @@ class SerialMonitorApp(QMainWindow):
 
 
     def refresh_com_ports(self):
-        """刷新COM口列表"""
-        current_port = self.combo_port.currentText()
-        self.combo_port.clear()
+        """刷新COM口列表：在线程池中枚举串口，完成后由_apply_com_ports更新下拉框
+        
+        上次枚举未完成或距上次枚举不足PORT_REFRESH_MIN_INTERVAL时直接跳过，合并连续点击
+        """
+        now = time.monotonic()
+        if self._ports_loading or now - self._ports_refreshed_at < self.PORT_REFRESH_MIN_INTERVAL:
+            return
+        self._ports_loading = True
+        self._ports_refreshed_at = now
+        _start_background_task(_list_port_devices, on_finished=self._apply_com_ports,
+                               on_failed=self._on_port_list_failed)
+    
+    def _on_port_list_failed(self, message):
+        self._ports_loading = False
+        print(f"枚举串口失败: {message}")
+    
+    def _apply_com_ports(self, port_list):
+        """用枚举到的端口列表更新COM口下拉框"""
+        self._ports_loading = False
         
-        ports = serial.tools.list_ports.comports()
-        port_list = [port.device for port in ports]
+        # 端口列表未变化时不重建下拉框（定时刷新时的常见情况）
+        if port_list == [self.combo_port.itemText(i) for i in range(self.combo_port.count())]:
+            return
         
-        self.combo_port.addItems(port_list)
+        current_port = self.combo_port.currentText()
         
-        # 尝试恢复之前选择的端口
-        index = self.combo_port.findText(current_port)
-        if index >= 0:
-            self.combo_port.setCurrentIndex(index)
+        # 批量重建期间屏蔽信号和重绘，避免中间状态触发多次更新
+        self.combo_port.blockSignals(True)
+        self.combo_port.setUpdatesEnabled(False)
+        try:
+            self.combo_port.clear()
+            self.combo_port.addItems(port_list)
+            
+            # 尝试恢复之前选择的端口
+            index = self.combo_port.findText(current_port)
+            if index >= 0:
+                self.combo_port.setCurrentIndex(index)
+        finally:
+            self.combo_port.setUpdatesEnabled(True)
+            self.combo_port.blockSignals(False)
     
     def toggle_serial(self):
         """打开/关闭串口"""
@@ -3914,24 +4787,25 @@ class SerialMonitorApp(QMainWindow):
             )
             
             # 启动接收线程
-            self.serial_thread = SerialThread()
+            self.serial_thread = SerialThread(self.frame_interval_ms)
             self.serial_thread.set_serial(self.serial_port)
             self.serial_thread.data_received.connect(self.on_data_received)
+            self.serial_thread.frame_ready.connect(self.on_frame_received)
             self.serial_thread.connection_lost.connect(self.on_connection_lost)
             self.serial_thread.start()
             
-            # 启动绘图定时器
-            self.plot_timer.start(1000)  # 1Hz
+            # 正在记录时启动绘图定时器
+            self._sync_plot_timer()
             
             self.btn_connect.setText("关闭串口")
-            self.btn_connect.setStyleSheet("QPushButton { background-color: rgba(255, 59, 48, 0.9); color: white; font-weight: 600; padding: 8px; border-radius: 8px; }")
+            _set_style_state(self.btn_connect, 'open')
             
             # 启动已配置的周期发送
             for i, preset in enumerate(self.preset_commands):
                 if preset and preset.get('periodic', False) and preset.get('period', 0) > 0:
                     # 使用round()确保精确到毫秒，避免截断误差
                     interval_ms = round(preset['period'] * 1000)
-                    self.preset_timers[i].start(interval_ms)
+                    self.preset_scheduler.start(i, interval_ms)
             
         except Exception as e:
             QMessageBox.critical(self, "错误", f"打开串口失败: {str(e)}")
@@ -3939,11 +4813,7 @@ class SerialMonitorApp(QMainWindow):
     def close_serial(self):
         """关闭串口"""
         try:
-            # 显示缓冲区剩余数据
-            if len(self.rx_buffer) > 0:
-                self.add_data_to_display('RX', bytes(self.rx_buffer))
-                self.rx_buffer.clear()
-            self.last_rx_time = None
+            # 接收线程退出时会发出缓冲区剩余数据
             if self.serial_thread:
                 self.serial_thread.stop()
                 self.serial_thread = None
@@ -3954,15 +4824,13 @@ class SerialMonitorApp(QMainWindow):
             self.serial_port = None
             
             # 停止绘图定时器
-            self.plot_timer.stop()
+            self._sync_plot_timer()
             
-            # 停止所有周期发送定时器
-            for timer in self.preset_timers:
-                if timer.isActive():
-                    timer.stop()
+            # 停止所有周期发送
+            self.preset_scheduler.stop_all()
         
             self.btn_connect.setText("打开串口")
-            self.btn_connect.setStyleSheet("QPushButton { background-color: rgba(52, 199, 89, 0.9); color: white; font-weight: 600; padding: 8px; border-radius: 8px; }")
+            _set_style_state(self.btn_connect, 'closed')
         except Exception as e:
             QMessageBox.critical(self, "错误", f"关闭串口失败: {str(e)}")
     
@@ -3971,29 +4839,7 @@ class SerialMonitorApp(QMainWindow):
         # 保存原始数据
         self.raw_data_buffer.append(data)
         
-        # 帧间隔处理：判断是否为新帧
         current_time = datetime.now()
-        is_new_frame = False
-        
-        if self.last_rx_time is None:
-            is_new_frame = True
-        else:
-            time_diff = (current_time - self.last_rx_time).total_seconds() * 1000  # 转为毫秒
-            if time_diff >= self.frame_interval_ms:
-                is_new_frame = True
-        
-        if is_new_frame:
-            # 如果缓冲区有数据，先显示缓冲的完整帧
-            if len(self.rx_buffer) > 0:
-                self.add_data_to_display('RX', bytes(self.rx_buffer))
-                self.rx_buffer.clear()
-            # 开始新帧
-            self.rx_buffer.extend(data)
-        else:
-            # 继续累积当前帧
-            self.rx_buffer.extend(data)
-        
-        self.last_rx_time = current_time
         
         # 检查是否有自定义协议与默认协议帧头冲突（默认协议: 0xA8 0xA8）
         use_default_parser = True
@@ -4010,7 +4856,7 @@ class SerialMonitorApp(QMainWindow):
         # 解析数据 - 使用默认解析器（仅当没有帧头冲突时）
         if use_default_parser:
             self.parser.add_data(data)
-            results = self.parser.parse()
+            results = self.parser.parse(current_time)
             
             for result in results:
                 # 只在曲线记录模式下添加到曲线
@@ -4023,15 +4869,14 @@ class SerialMonitorApp(QMainWindow):
         # 解析数据 - 使用所有自定义协议解析器（始终执行，支持多协议并行）
         for parser in self.protocol_parsers:
             parser.add_data(data)
-            protocol_results = parser.parse()
+            protocol_results = parser.parse(current_time)
             
             for result in protocol_results:
-                protocol_name = result['protocol_name']
-                raw_frame = result['raw_frame']
-                frame_hex = result['frame_hex']
+                protocol_name = result.protocol_name
+                raw_frame = result.raw_frame
                 
                 # 在调试日志中打印
-                self.log(f"[{protocol_name}] 接收: {frame_hex}", "INFO")
+                self.log(f"[{protocol_name}] 接收: {result.frame_hex}", "INFO")
                 
                 # 只在曲线记录模式下添加到曲线
                 if self.is_curve_recording:
@@ -4043,27 +4888,15 @@ class SerialMonitorApp(QMainWindow):
     def on_frame_interval_changed(self, value):
         """帧间隔时间改变处理"""
         self.frame_interval_ms = value
+        if self.serial_thread:
+            self.serial_thread.set_frame_interval(value)
     
-    def flush_rx_buffer(self):
-        """刷新接收缓冲区，显示超时的数据帧"""
-        if len(self.rx_buffer) > 0 and self.last_rx_time is not None:
-            current_time = datetime.now()
-            time_diff = (current_time - self.last_rx_time).total_seconds() * 1000  # 转为毫秒
-            
-            # 如果超过帧间隔时间，显示缓冲区数据
-            if time_diff >= self.frame_interval_ms:
-                self.add_data_to_display('RX', bytes(self.rx_buffer))
-                self.rx_buffer.clear()
-                self.last_rx_time = None
+    def on_frame_received(self, frame, timestamp):
+        """接收线程按帧间隔分好的一帧数据，显示到收发数据区"""
+        self.add_data_to_display('RX', frame, timestamp)
     
     def on_connection_lost(self):
         """连接丢失处理"""
-        # 显示缓冲区剩余数据
-        if len(self.rx_buffer) > 0:
-            self.add_data_to_display('RX', bytes(self.rx_buffer))
-            self.rx_buffer.clear()
-        self.last_rx_time = None
-        
         # 先记录当前串口信息和周期发送状态，再停止定时器
         if self.serial_port:
             try:
@@ -4076,8 +4909,8 @@ class SerialMonitorApp(QMainWindow):
                 }
                 # 记录周期发送配置（在停止之前记录正在运行的定时器）
                 active_presets = []
-                for i, timer in enumerate(self.preset_timers):
-                    if timer.isActive() and i < len(self.preset_commands):
+                for i in self.preset_scheduler.active_indices():
+                    if i < len(self.preset_commands):
                         preset = self.preset_commands[i]
                         if preset:
                             active_presets.append((i, preset))
@@ -4090,10 +4923,8 @@ class SerialMonitorApp(QMainWindow):
             except Exception as e:
                 self.log(f"保存配置失败 - {str(e)}", "ERROR")
         
-        # 停止所有周期发送定时器，防止串口断开后继续发送导致异常
-        for timer in self.preset_timers:
-            if timer.isActive():
-                timer.stop()
+        # 停止所有周期发送，防止串口断开后继续发送导致异常
+        self.preset_scheduler.stop_all()
         
         # 停止绘图定时器
         if self.plot_timer.isActive():
@@ -4108,7 +4939,7 @@ class SerialMonitorApp(QMainWindow):
         self.serial_port = None
         
         self.btn_connect.setText("正在检测...")
-        self.btn_connect.setStyleSheet("QPushButton { background-color: rgba(255, 149, 0, 0.9); color: white; font-weight: 600; padding: 8px; border-radius: 8px; }")
+        _set_style_state(self.btn_connect, 'detecting')
         
         # 启动智能恢复检测
         self.start_smart_recovery()
@@ -4118,7 +4949,7 @@ class SerialMonitorApp(QMainWindow):
         if not self.lost_port_info:
             self.log("没有保存的端口信息，无法启动智能恢复", "WARNING")
             self.btn_connect.setText("打开串口")
-            self.btn_connect.setStyleSheet("QPushButton { background-color: rgba(52, 199, 89, 0.9); color: white; font-weight: 600; padding: 8px; border-radius: 8px; }")
+            _set_style_state(self.btn_connect, 'closed')
             return
         
         self.log(f"启动智能恢复，目标端口={self.lost_port_info.get('port', '未知')}", "INFO")
@@ -4236,14 +5067,15 @@ class SerialMonitorApp(QMainWindow):
             self.log("串口已打开，启动接收线程", "DEBUG")
             
             # 启动接收线程
-            self.serial_thread = SerialThread()
+            self.serial_thread = SerialThread(self.frame_interval_ms)
             self.serial_thread.set_serial(self.serial_port)
             self.serial_thread.data_received.connect(self.on_data_received)
+            self.serial_thread.frame_ready.connect(self.on_frame_received)
             self.serial_thread.connection_lost.connect(self.on_connection_lost)
             self.serial_thread.start()
             
-            # 启动绘图定时器
-            self.plot_timer.start(1000)
+            # 正在记录时启动绘图定时器
+            self._sync_plot_timer()
             
             self.log(f"配置信息 = {saved_port_config}", "DEBUG")
             
@@ -4251,15 +5083,15 @@ class SerialMonitorApp(QMainWindow):
             if saved_port_config and 'preset_states' in saved_port_config:
                 self.log(f"准备恢复 {len(saved_port_config['preset_states'])} 个周期发送", "INFO")
                 for i, preset in saved_port_config['preset_states']:
-                    if i < len(self.preset_timers):
+                    if i < 50:
                         interval_ms = round(preset['period'] * 1000)
-                        self.preset_timers[i].start(interval_ms)
+                        self.preset_scheduler.start(i, interval_ms)
                         self.log(f"恢复预设命令{i+1}的周期发送，间隔{interval_ms}ms", "DEBUG")
             else:
                 self.log("没有需要恢复的周期发送", "INFO")
             
             self.btn_connect.setText("关闭串口")
-            self.btn_connect.setStyleSheet("QPushButton { background-color: rgba(255, 59, 48, 0.9); color: white; font-weight: 600; padding: 8px; border-radius: 8px; }")
+            _set_style_state(self.btn_connect, 'open')
             
             self.log(f"串口 {port} 恢复成功！", "SUCCESS")
             
@@ -4268,7 +5100,7 @@ class SerialMonitorApp(QMainWindow):
             import traceback
             self.log(traceback.format_exc(), "ERROR")
             self.btn_connect.setText("打开串口")
-            self.btn_connect.setStyleSheet("QPushButton { background-color: rgba(52, 199, 89, 0.9); color: white; font-weight: 600; padding: 8px; border-radius: 8px; }")
+            _set_style_state(self.btn_connect, 'closed')
     
     def stop_recovery_check(self):
         """停止恢复检测"""
@@ -4282,7 +5114,7 @@ class SerialMonitorApp(QMainWindow):
         
         if self.btn_connect.text() == "正在检测...":
             self.btn_connect.setText("打开串口")
-            self.btn_connect.setStyleSheet("QPushButton { background-color: rgba(52, 199, 89, 0.9); color: white; font-weight: 600; padding: 8px; border-radius: 8px; }")
+            _set_style_state(self.btn_connect, 'closed')
         
         # 清空记录
         self.lost_port_info = None
@@ -4293,25 +5125,60 @@ class SerialMonitorApp(QMainWindow):
         if self.serial_port is None or not self.serial_port.is_open:
             self.open_serial()
     
+    def _sync_plot_timer(self):
+        """串口打开且正在记录曲线时以1Hz运行plot_timer，否则停止，空闲时不再每秒唤醒"""
+        if self.is_curve_recording and self.serial_port is not None and self.serial_port.is_open:
+            if not self.plot_timer.isActive():
+                self.plot_timer.start(1000)
+        else:
+            self.plot_timer.stop()
+    
     def update_plot(self):
-        """更新曲线显示（仅刷新界面，不记录新数据点）"""
-        self.plot_canvas.update_plot()
-        
+        """更新曲线记录状态显示（曲线本身由PlotCanvas在有新数据时限频重绘）"""
         # 更新曲线记录状态显示
         if self.is_curve_recording:
-            point_count = len(self.plot_canvas.time_data)
+            point_count = self.plot_canvas.point_count
             self.label_recording_status.setText(f"曲线记录中: {point_count} 点")
-            self.label_recording_status.setStyleSheet("color: #67c23a; font-weight: bold; font-size: 9pt;")
+            _set_style_state(self.label_recording_status, 'recording')
     
     def reset_plot_view(self):
         """重置曲线视图"""
         self.plot_canvas.reset_view()
     
+    def toggle_nav_toolbar(self, visible):
+        """显示/隐藏曲线导航工具栏，首次显示时才创建"""
+        if self._nav_toolbar is None:
+            if not visible:
+                return
+            from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+            self._nav_toolbar = NavigationToolbar(self.plot_canvas, self)
+            # 插在曲线控制栏与画布之间
+            self._plot_main_layout.insertWidget(1, self._nav_toolbar)
+        self._nav_toolbar.setVisible(visible)
+    
     def update_system_clock(self):
-        """更新系统时钟显示"""
+        """格式化当前时间并通过clock_tick分发给各时钟显示（秒未变化时不分发）"""
         now = datetime.now()
-        self.label_system_time.setText(now.strftime('%H:%M:%S'))
-        self.label_system_date.setText(now.strftime('%Y/%m/%d'))
+        time_text = now.strftime('%H:%M:%S')
+        if time_text == self._clock_time_text:
+            return
+        self._clock_time_text = time_text
+        self.clock_tick.emit(time_text, now.strftime('%Y/%m/%d'))
+    
+    def _on_clock_dock_visibility(self, visible):
+        """时间显示dock可见时每秒更新系统时钟，隐藏时停止定时器"""
+        if visible:
+            if not self.system_clock_timer.isActive():
+                self.update_system_clock()
+                self.system_clock_timer.start(1000)  # 每秒1秒更新
+        else:
+            self.system_clock_timer.stop()
+    
+    def _set_system_date(self, time_text, date_text):
+        """系统日期只在跨天时更新"""
+        if date_text != self._system_date_text:
+            self._system_date_text = date_text
+            self.label_system_date.setText(date_text)
     
     def decimal_to_bcd(self, decimal_value):
         """将十进制数转换为BCD码
@@ -4465,9 +5332,7 @@ class SerialMonitorApp(QMainWindow):
         
         # 创建滚动区域内的容器
         scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout(scroll_widget)
-        scroll_layout.setSpacing(8)
-        scroll_layout.setContentsMargins(5, 5, 5, 5)
+        scroll_layout = _make_vbox(scroll_widget, spacing=8, margins=_DOCK_MARGINS)
         
         # 曲线配置按钮组
         for i in range(50):
@@ -4478,17 +5343,8 @@ class SerialMonitorApp(QMainWindow):
             # 配置按钮
             btn = QPushButton(f'曲线{i+1}: 点击配置')
             btn.setMinimumHeight(40)
-            btn.setStyleSheet("""
-                QPushButton {
-                    text-align: left;
-                    padding-left: 15px;
-                    font-size: 9pt;
-                    background-color: #f5f5f5;
-                }
-                QPushButton:hover {
-                    background-color: #e0e0e0;
-                }
-            """)
+            btn.setProperty('cls', 'curveSlot')
+            btn.setProperty('state', 'off')
             
             # 如果有配置，显示配置信息
             if i < len(self.plot_canvas.curve_configs):
@@ -4499,21 +5355,9 @@ class SerialMonitorApp(QMainWindow):
                 status = '✓' if enabled else '✗'
                 btn.setText(f'{status} {name} ({unit})' if unit else f'{status} {name}')
                 if enabled:
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            text-align: left;
-                            padding-left: 15px;
-                            font-size: 9pt;
-                            background-color: #e8f5e9;
-                            color: #2e7d32;
-                            font-weight: bold;
-                        }
-                        QPushButton:hover {
-                            background-color: #c8e6c9;
-                        }
-                    """)
-            
-            btn.clicked.connect(lambda checked, idx=i: self.configure_single_curve(idx, dialog))
+                    btn.setProperty('state', 'on')
+            
+            btn.clicked.connect(partial(self.configure_single_curve, i, dialog))
             btn_layout.addWidget(btn)
             
             scroll_layout.addWidget(btn_frame)
@@ -4592,57 +5436,65 @@ class SerialMonitorApp(QMainWindow):
                                     enabled = config.get('enabled', True)
                                     status = '✓' if enabled else '✗'
                                     btn.setText(f'{status} {name} ({unit})' if unit else f'{status} {name}')
-                                    if enabled:
-                                        btn.setStyleSheet("""
-                                            QPushButton {
-                                                text-align: left;
-                                                padding-left: 15px;
-                                                font-size: 9pt;
-                                                background-color: #e8f5e9;
-                                                color: #2e7d32;
-                                                font-weight: bold;
-                                            }
-                                            QPushButton:hover {
-                                                background-color: #c8e6c9;
-                                            }
-                                        """)
-                                    else:
-                                        btn.setStyleSheet("""
-                                            QPushButton {
-                                                text-align: left;
-                                                padding-left: 15px;
-                                                font-size: 9pt;
-                                                background-color: #f5f5f5;
-                                            }
-                                            QPushButton:hover {
-                                                background-color: #e0e0e0;
-                                            }
-                                        """)
+                                    _set_style_state(btn, 'on' if enabled else 'off')
         except Exception as e:
             print(f"刷新对话框错误: {e}")
     
+    def _ensure_curve_checkbox(self, index):
+        """返回第index条曲线的显示复选框，首次使用时创建并按曲线顺序插入控制栏"""
+        checkbox = self.curve_checkboxes[index]
+        if checkbox is None:
+            checkbox = QCheckBox(f'曲线{index+1}')
+            checkbox.setChecked(index < 3)  # 默认前3条启用
+            # 曲线序号存为控件属性，所有复选框共用一个槽函数
+            checkbox.setProperty('idx', index)
+            checkbox.toggled.connect(self._on_curve_toggled)
+            # 插入位置 = 已创建的、序号更小的复选框数量
+            position = sum(1 for cb in self.curve_checkboxes[:index] if cb is not None)
+            self._curve_checkbox_layout.insertWidget(position, checkbox)
+            self.curve_checkboxes[index] = checkbox
+        return checkbox
+    
     def update_curve_checkbox_labels(self):
-        """更新曲线复选框的标签（只显示启用的曲线）"""
+        """更新曲线复选框的标签（只显示启用的曲线）
+        
+        调用前曲线可见性已由set_curve_configs按配置设置好，这里批量修改时屏蔽toggled信号，
+        避免每个setChecked都触发一次toggle_curve重绘，并暂停控制栏刷新，最后统一重绘一次
+        """
         if not hasattr(self, 'curve_checkboxes'):
             return
         
-        for i, checkbox in enumerate(self.curve_checkboxes):
-            if i < len(self.plot_canvas.curve_configs):
-                config = self.plot_canvas.curve_configs[i]
-                enabled = config.get('enabled', False)
-                # 只显示启用的曲线
-                if enabled:
-                    name = config.get('name', f'曲线{i+1}')
+        configs = self.plot_canvas.curve_configs
+        container = self._curve_checkbox_layout.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            for i, checkbox in enumerate(self.curve_checkboxes):
+                if i < len(configs) and configs[i].get('enabled', False):
+                    # 只显示启用的曲线
+                    checkbox = self._ensure_curve_checkbox(i)
+                    blocker = QSignalBlocker(checkbox)
+                    name = configs[i].get('name', f'曲线{i+1}')
                     checkbox.setText(name)
                     checkbox.setChecked(True)
                     checkbox.show()
-                else:
+                    blocker.unblock()
+                elif checkbox is None:
+                    continue  # 未创建的复选框无需处理
+                elif i < len(configs):
                     # 未启用的曲线隐藏
                     checkbox.hide()
-            else:
-                checkbox.setText(f'曲线{i+1}')
-                checkbox.setChecked(False)
-                checkbox.hide()
+                else:
+                    blocker = QSignalBlocker(checkbox)
+                    checkbox.setText(f'曲线{i+1}')
+                    checkbox.setChecked(False)
+                    checkbox.hide()
+                    blocker.unblock()
+        finally:
+            container.setUpdatesEnabled(True)
+    
+    def _on_curve_toggled(self, checked):
+        """曲线复选框状态变化，由发送者的idx属性确定曲线"""
+        self.toggle_curve(self.sender().property('idx'), checked)
     
     def toggle_curve(self, index, visible):
         """切换曲线可见性"""
@@ -4656,141 +5508,120 @@ class SerialMonitorApp(QMainWindow):
         self.text_data_display.clear()
     
     def refresh_data_display(self):
-        """刷新数据显示(根据时间戳和显示模式重新格式化)"""
-        self.text_data_display.clear()
+        """请求刷新数据显示，连续切换显示选项时由display_refresh_timer合并为一次重绘"""
+        self.display_refresh_timer.start(50)
+    
+    def _display_format(self):
+        """当前显示选项 (显示时间戳, HEX, ASCII)"""
+        return (self.check_display_timestamp.isChecked(),
+                self.radio_hex.isChecked(), self.radio_ascii.isChecked())
+    
+    @staticmethod
+    def _format_display_bodies(payloads, show_hex, show_ascii):
+        """按显示模式格式化数据部分，两种模式都不显示时返回None"""
+        if show_hex and show_ascii:
+            return [f"{_bytes_to_hex_spaced(data)}  [{data.decode('utf-8', errors='ignore')}]"
+                    for data in payloads]
+        if show_hex:
+            return [_bytes_to_hex_spaced(data) for data in payloads]
+        if show_ascii:
+            return [data.decode('utf-8', errors='ignore') for data in payloads]
+        return None
+    
+    def _do_refresh_data_display(self):
+        """刷新数据显示(根据时间戳和显示模式重新格式化)
+        
+        只有显示选项与上次渲染时不同才整体重建文本，否则新数据已由add_data_to_display追加，无需重绘
+        """
+        display_format = self._display_format()
+        if display_format == self._rendered_display_format:
+            return
+        self._rendered_display_format = display_format
+        show_timestamp, show_hex, show_ascii = display_format
         
-        show_timestamp = self.check_display_timestamp.isChecked()
-        show_hex = self.radio_hex.isChecked()
-        show_ascii = self.radio_ascii.isChecked()
+        log = self.data_log
+        heads = ([f"[{ts}] {direction}: " for ts, direction in zip(log.timestamps(), log.directions)]
+                 if show_timestamp else [f"{direction}: " for direction in log.directions])
+        bodies = self._format_display_bodies(log.payloads, show_hex, show_ascii)
+        lines = heads if bodies is None else [head + body for head, body in zip(heads, bodies)]
         
-        for record in self.data_log:
-            direction = record['direction']  # 'TX' or 'RX'
-            timestamp = record['timestamp']
-            data = record['data']
-            
-            # 构建显示文本
-            display_text = ""
-            
-            if show_timestamp:
-                display_text += f"[{timestamp}] "
-            
-            display_text += f"{direction}: "
-            
-            if show_hex:
-                hex_str = ' '.join([f'{b:02X}' for b in data])
-                display_text += hex_str
-            
-            if show_ascii:
-                try:
-                    ascii_str = data.decode('utf-8', errors='ignore')
-                    if show_hex:
-                        display_text += f"  [{ascii_str}]"
-                    else:
-                        display_text += ascii_str
-                except:
-                    pass
-            
-            self.text_data_display.append(display_text)
+        # 一次性设置全部文本
+        self.text_data_display.setPlainText('\n'.join(lines))
         
         # 滚动到底部
         self.text_data_display.moveCursor(QTextCursor.End)
     
-    def add_data_to_display(self, direction, data):
+    def add_data_to_display(self, direction, data, timestamp=None):
         """添加数据到显示区
         direction: 'TX' 或 'RX'
         data: bytes数据
+        timestamp: 数据接收时间(time.time())，默认为当前时间
         """
-        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        
-        # 保存到日志
-        self.data_log.append({
-            'direction': direction,
-            'timestamp': timestamp,
-            'data': data
-        })
+        now = datetime.now() if timestamp is None else datetime.fromtimestamp(timestamp)
         
-        # 限制日志大小
-        if len(self.data_log) > 1000:
-            self.data_log.pop(0)
+        # 保存到日志（限定最多1000条，自动丢弃最旧的记录）
+        day_ms = ((now.hour * 60 + now.minute) * 60 + now.second) * 1000 + now.microsecond // 1000
+        self.data_log.append(direction, day_ms, data)
         
-        # 构建显示文本
-        display_text = ""
+        # 按上次渲染的显示选项追加(选项刚切换时由待执行的刷新整体重建)
+        show_timestamp, show_hex, show_ascii = self._rendered_display_format
+        display_text = f"[{now.strftime('%H:%M:%S.%f')[:-3]}] {direction}: " if show_timestamp else f"{direction}: "
+        bodies = self._format_display_bodies((data,), show_hex, show_ascii)
+        if bodies is not None:
+            display_text += bodies[0]
         
-        if self.check_display_timestamp.isChecked():
-            display_text += f"[{timestamp}] "
-        
-        display_text += f"{direction}: "
-        
-        if self.radio_hex.isChecked():
-            hex_str = ' '.join([f'{b:02X}' for b in data])
-            display_text += hex_str
-        
-        if self.radio_ascii.isChecked():
-            try:
-                ascii_str = data.decode('utf-8', errors='ignore')
-                if self.radio_hex.isChecked():
-                    display_text += f"  [{ascii_str}]"
-                else:
-                    display_text += ascii_str
-            except:
-                pass
-        
-        self.text_data_display.append(display_text)
-        
-        # 限制显示区域行数，防止内存溢出
-        document = self.text_data_display.document()
-        if document.blockCount() > 2000:
-            cursor = QTextCursor(document)
-            cursor.movePosition(QTextCursor.Start)
-            # 选中前100行（批量删除以提高性能）
-            for _ in range(100):
-                cursor.movePosition(QTextCursor.NextBlock, QTextCursor.KeepAnchor)
-            cursor.removeSelectedText()
+        # 超过最大行数时控件自动删除最旧的行
+        self.text_data_display.appendPlainText(display_text)
         
         # 滚动到底部
         self.text_data_display.moveCursor(QTextCursor.End)
     
     def update_display_count(self, count):
-        """更新显示的窗口数量"""
-        for i in range(50):
-            if i < count:
-                self.display_widgets[i].show()
-            else:
-                self.display_widgets[i].hide()
+        """更新显示的窗口数量（不足时创建新窗口）
+        
+        一次增加多个窗口时暂停所在面板的重绘，新建和显示完成后统一布局、重绘一次
+        """
+        panel = self._display_windows_layout.parentWidget()
+        panel.setUpdatesEnabled(False)
+        try:
+            self._ensure_display_widgets(count)
+            for i, widget in enumerate(self.display_widgets):
+                widget.setVisible(i < count)
+        finally:
+            panel.setUpdatesEnabled(True)
     
     def update_preset_count(self, count):
-        """更新显示的预设命令按钮数量"""
-        for i in range(50):
-            if i < count:
-                self.preset_button_widgets[i].show()
-            else:
-                self.preset_button_widgets[i].hide()
+        """更新显示的预设命令按钮数量（不足时创建新按钮），批量切换期间暂停面板重绘"""
+        panel = self._preset_vbox.parentWidget()
+        panel.setUpdatesEnabled(False)
+        try:
+            self._ensure_preset_buttons(count)
+            for i, widget in enumerate(self.preset_button_widgets):
+                widget.setVisible(i < count)
+        finally:
+            panel.setUpdatesEnabled(True)
     
     def update_bit_display_count(self, count):
-        """更新显示的位窗口数量"""
-        for i in range(50):
-            if i < count:
-                self.bit_display_widgets[i].show()
-            else:
-                self.bit_display_widgets[i].hide()
+        """更新显示的位窗口数量（不足时创建新窗口），批量切换期间暂停面板重绘"""
+        panel = self._bit_windows_layout.parentWidget()
+        panel.setUpdatesEnabled(False)
+        try:
+            self._ensure_bit_display_windows(count)
+            for i, widget in enumerate(self.bit_display_widgets):
+                widget.setVisible(i < count)
+        finally:
+            panel.setUpdatesEnabled(True)
     
     def configure_custom_display(self, index):
         """配置自定义显示窗口"""
-        display_data = None
-        if index < len(self.custom_displays):
-            display_data = self.custom_displays[index]
+        display_data = self.custom_displays.get(index)
         
         dialog = CustomDisplayDialog(self, display_data, self.protocol_configs)
         if dialog.exec_() == QDialog.Accepted:
             data = dialog.get_data()
             
             # 更新或添加显示配置
-            if index < len(self.custom_displays):
-                self.custom_displays[index] = data
-            else:
-                while len(self.custom_displays) <= index:
-                    self.custom_displays.append(None)
-                self.custom_displays[index] = data
+            self.custom_displays[index] = data
             
             # 更新显示
             self.update_custom_display(index)
@@ -4800,56 +5631,28 @@ class SerialMonitorApp(QMainWindow):
         index: 窗口索引
         value: 解析的数值,如果为None则显示配置信息
         """
-        if index >= len(self.custom_displays) or not self.custom_displays[index]:
-            self.custom_display_labels[index].setText(f'显示{index+1}: --')
-            self.custom_display_labels[index].setStyleSheet("""
-                QLabel {
-                    background-color: #f0f0f0;
-                    border: 2px solid #c0c0c0;
-                    border-radius: 4px;
-                    padding: 8px;
-                    font-size: 11pt;
-                    font-weight: bold;
-                }
-            """)
+        if index >= len(self.custom_display_labels):
+            return  # 窗口尚未创建（超出显示数量），创建时再显示配置
+        label = self.custom_display_labels[index]
+        config = self.custom_displays.get(index)
+        if not config:
+            label.setText(f'显示{index+1}: --')
+            _set_style_state(label, 'empty')
             return
         
-        config = self.custom_displays[index]
-        
         if not config.get('enabled', True):
-            self.custom_display_labels[index].setText(f"{config.get('name', f'显示{index+1}')}: 已禁用")
-            self.custom_display_labels[index].setStyleSheet("""
-                QLabel {
-                    background-color: #e0e0e0;
-                    border: 2px solid #a0a0a0;
-                    border-radius: 4px;
-                    padding: 8px;
-                    font-size: 11pt;
-                    color: #888;
-                }
-            """)
+            label.setText(f"{config.get('name', f'显示{index+1}')}: 已禁用")
+            _set_style_state(label, 'disabled')
             return
         
+        name = config.get('name', f'显示{index+1}')
+        unit = config.get('unit', '')
         if value is None:
             # 显示配置信息
-            name = config.get('name', f'显示{index+1}')
-            unit = config.get('unit', '')
-            self.custom_display_labels[index].setText(f"{name}: -- {unit}")
-            self.custom_display_labels[index].setStyleSheet("""
-                QLabel {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #f0f9eb, stop:1 #e1f3d8);
-                    border: 1px solid #c2e7b0;
-                    border-radius: 6px;
-                    padding: 3px;
-                    font-size: 7.5pt;
-                    font-weight: bold;
-                    color: #67c23a;
-                }
-            """)
+            label.setText(f"{name}: -- {unit}")
+            _set_style_state(label, 'idle')
         else:
             # 显示实时数值
-            name = config.get('name', f'显示{index+1}')
-            unit = config.get('unit', '')
             decimals = config.get('decimals', 2)
             
             if isinstance(value, str):
@@ -4857,25 +5660,12 @@ class SerialMonitorApp(QMainWindow):
             else:
                 value_str = f"{value:.{decimals}f}"
                 
-            self.custom_display_labels[index].setText(f"{name}: {value_str} {unit}")
-            self.custom_display_labels[index].setStyleSheet("""
-                QLabel {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #67c23a, stop:1 #529b2e);
-                    border: 1px solid #529b2e;
-                    border-bottom: 2px solid #3e7523;
-                    border-radius: 6px;
-                    padding: 3px;
-                    font-size: 8pt;
-                    font-weight: bold;
-                    color: white;
-                }
-            """)
+            label.setText(f"{name}: {value_str} {unit}")
+            _set_style_state(label, 'value')
     
     def configure_bit_display(self, window_idx):
         """配置位显示窗口"""
-        bit_display_data = None
-        if window_idx < len(self.bit_displays):
-            bit_display_data = self.bit_displays[window_idx]
+        bit_display_data = self.bit_displays.get(window_idx)
         
         dialog = BitDisplayDialog(self, bit_display_data, self.protocol_configs)
         if dialog.exec_() == QDialog.Accepted:
@@ -4883,54 +5673,43 @@ class SerialMonitorApp(QMainWindow):
             
             # 更新或添加位显示配置
             self.bit_displays[window_idx] = data
+            self._rebuild_bit_targets()
             
             # 更新窗口显示（更新标题和位名称）
             self.update_bit_display_config(window_idx)
     
     def update_bit_display_config(self, window_idx):
         """更新位显示窗口的配置信息（标题和位名称）"""
-        if window_idx >= len(self.bit_displays) or not self.bit_displays[window_idx]:
-            return
+        config = self.bit_displays.get(window_idx)
+        if not config or window_idx >= len(self.bit_display_widgets):
+            return  # 窗口尚未创建时，创建时再应用配置
         
-        config = self.bit_displays[window_idx]
         bit_names = config.get('bit_names', [''] * 8)
         window_name = config.get('name', '')
         
         # 更新窗口名称标签
-        if window_idx < len(self.bit_display_name_labels):
-            if window_name:
-                self.bit_display_name_labels[window_idx].setText(f'窗口名称: {window_name}')
-            else:
-                self.bit_display_name_labels[window_idx].setText(f'窗口名称: 未配置')
-        
-        # 更新每个位的名称标签
-        for bit_idx in range(8):
-            name_label, status_label = self.bit_display_labels[window_idx][bit_idx]
-            bit_name = bit_names[bit_idx] if bit_names[bit_idx] else f'Bit{bit_idx}'
-            name_label.setText(bit_name)
-    
-    def update_bit_display_value(self, window_idx, byte_value):
-        """更新位显示窗口的值
-        window_idx: 窗口索引
-        byte_value: 字节值(0-255)
-        """
-        if window_idx >= len(self.bit_displays) or not self.bit_displays[window_idx]:
-            return
-        
-        config = self.bit_displays[window_idx]
-        if not config.get('enabled', True):
-            return
-        
-        # 解析每个位并更新显示
-        for bit_idx in range(8):
-            bit_value = (byte_value >> bit_idx) & 1
-            name_label, status_label = self.bit_display_labels[window_idx][bit_idx]
-            
-            # 根据位值设置颜色
-            if bit_value == 1:
-                status_label.setStyleSheet('color: #4CAF50; font-size: 12pt;')  # 绿色-开
-            else:
-                status_label.setStyleSheet('color: #ccc; font-size: 12pt;')  # 灰色-关
+        if window_name:
+            self.bit_display_name_labels[window_idx].setText(f'窗口名称: {window_name}')
+        else:
+            self.bit_display_name_labels[window_idx].setText(f'窗口名称: 未配置')
+        
+        # 更新每个位的名称
+        self.bit_display_grids[window_idx].set_names(
+            [name if name else f'Bit{bit_idx}' for bit_idx, name in enumerate(bit_names)])
+    
+    def _rebuild_bit_targets(self):
+        """按协议和目标字节分组启用的位显示窗口，每帧每个目标字节只读取一次"""
+        groups = {}
+        for window_idx, config in sorted(self.bit_displays.items()):
+            if config.get('enabled', True):
+                protocol = _intern_key(config.get('protocol', None))
+                target_byte = config.get('target_byte', 17)
+                groups.setdefault(protocol, {}).setdefault(target_byte, []).append(window_idx)
+        self._bit_targets = {
+            protocol: tuple((target_byte, tuple(windows))
+                            for target_byte, windows in sorted(by_byte.items()))
+            for protocol, by_byte in groups.items()
+        }
     
     def parse_custom_display_data(self, data, protocol_name=None):
         """解析数据帧并更新所有自定义显示窗口
@@ -4945,18 +5724,19 @@ class SerialMonitorApp(QMainWindow):
             if clock_protocol == protocol_name:
                 self.update_received_clock(data)
         
-        # 更新位显示窗口 - 检查协议匹配
-        for window_idx, config in enumerate(self.bit_displays):
-            if config and config.get('enabled', True):
-                bit_protocol = config.get('protocol', None)
-                if bit_protocol == protocol_name:
-                    target_byte = config.get('target_byte', 17)
-                    if len(data) > target_byte:
-                        byte_value = data[target_byte]
-                        self.update_bit_display_value(window_idx, byte_value)
-        
-        for i, config in enumerate(self.custom_displays):
-            if not config or not config.get('enabled', True):
+        # 更新位显示窗口 - 只处理该协议的窗口，同一目标字节只读取一次
+        grids = self.bit_display_grids
+        for target_byte, windows in self._bit_targets.get(protocol_name, ()):
+            if len(data) <= target_byte:
+                continue
+            byte_value = data[target_byte]
+            for window_idx in windows:
+                # 尚未创建的窗口不更新；值未变化时不重绘
+                if window_idx < len(grids):
+                    grids[window_idx].set_state(byte_value)
+        
+        for i, config in self.custom_displays.items():
+            if not config.get('enabled', True):
                 continue
             
             # 检查协议是否匹配
@@ -4976,11 +5756,14 @@ class SerialMonitorApp(QMainWindow):
                 if len(data) < start_byte + byte_count:
                     continue
                 
-                # 提取字节
-                data_bytes = data[start_byte:start_byte + byte_count]
-                
-                # 根据数据类型解析
-                value = self.parse_data_bytes(data_bytes, data_type)
+                # 根据数据类型解析（数值类型直接从帧中解包，不切片）
+                if data_type in _STRUCT_MAP:
+                    # 配置的字节数不足该类型宽度时跳过，避免读到字段之后的字节
+                    if _STRUCT_MAP[data_type].size > byte_count:
+                        continue
+                    value = unpack_field(data_type, data, start_byte)
+                else:
+                    value = self.parse_data_bytes(data[start_byte:start_byte + byte_count], data_type)
                 
                 # 应用系数、除法和偏移: (value * coefficient / divisor) + offset
                 if data_type != 'string (ASCII)':
@@ -4994,30 +5777,8 @@ class SerialMonitorApp(QMainWindow):
     
     def parse_data_bytes(self, data_bytes, data_type):
         """解析字节数据为数值"""
-        if data_type == 'uint8':
-            return data_bytes[0]
-        elif data_type == 'int8':
-            return struct.unpack('b', data_bytes[:1])[0]
-        elif data_type == 'uint16 (LE)':
-            return struct.unpack('<H', data_bytes[:2])[0]
-        elif data_type == 'uint16 (BE)':
-            return struct.unpack('>H', data_bytes[:2])[0]
-        elif data_type == 'int16 (LE)':
-            return struct.unpack('<h', data_bytes[:2])[0]
-        elif data_type == 'int16 (BE)':
-            return struct.unpack('>h', data_bytes[:2])[0]
-        elif data_type == 'uint32 (LE)':
-            return struct.unpack('<I', data_bytes[:4])[0]
-        elif data_type == 'uint32 (BE)':
-            return struct.unpack('>I', data_bytes[:4])[0]
-        elif data_type == 'int32 (LE)':
-            return struct.unpack('<i', data_bytes[:4])[0]
-        elif data_type == 'int32 (BE)':
-            return struct.unpack('>i', data_bytes[:4])[0]
-        elif data_type == 'float (LE)':
-            return struct.unpack('<f', data_bytes[:4])[0]
-        elif data_type == 'float (BE)':
-            return struct.unpack('>f', data_bytes[:4])[0]
+        if data_type in _STRUCT_MAP:
+            return unpack_field(data_type, data_bytes)
         elif data_type == 'string (ASCII)':
             try:
                 # 移除空字节并解码
@@ -5067,33 +5828,12 @@ class SerialMonitorApp(QMainWindow):
     
     def add_crc_to_data(self, data, crc_type):
         """给数据添加CRC校验"""
-        if crc_type == '无':
+        crc_spec = _SEND_CRC_SPECS.get(crc_type)
+        if crc_spec is None:
             return data
         
-        data_bytes = bytes(data)
-        
-        if crc_type == 'CCITT-CRC16':
-            crc = CRCCalculator.calculate_ccitt_crc16(data_bytes)
-            # 高字节在前
-            data.append((crc >> 8) & 0xFF)
-            data.append(crc & 0xFF)
-        elif crc_type == 'Modbus-CRC16':
-            crc = CRCCalculator.calculate_modbus_crc16(data_bytes)
-            # Modbus标准:低字节在前,高字节在后
-            data.append(crc & 0xFF)
-            data.append((crc >> 8) & 0xFF)
-        elif crc_type == 'CRC16-XMODEM':
-            crc = CRCCalculator.calculate_crc16_xmodem(data_bytes)
-            # 低字节在前,高字节在后
-            data.append(crc & 0xFF)
-            data.append((crc >> 8) & 0xFF)
-        elif crc_type == '累加和':
-            checksum = CRCCalculator.calculate_sum_check(data_bytes)
-            data.append(checksum)
-        elif crc_type == '异或':
-            checksum = CRCCalculator.calculate_xor_check(data_bytes)
-            data.append(checksum)
-        
+        crc_func, crc_struct = crc_spec
+        data += crc_struct.pack(crc_func(bytes(data)))
         return data
     
     def send_file(self):
@@ -5128,9 +5868,8 @@ class SerialMonitorApp(QMainWindow):
             
             # 更新或添加预设命令
             if index < len(self.preset_commands):
-                # 停止旧的定时器
-                if self.preset_timers[index].isActive():
-                    self.preset_timers[index].stop()
+                # 停止旧的周期发送
+                self.preset_scheduler.stop(index)
                 self.preset_commands[index] = data
             else:
                 while len(self.preset_commands) <= index:
@@ -5140,56 +5879,23 @@ class SerialMonitorApp(QMainWindow):
             # 更新按钮文本
             if data['name']:
                 self.preset_buttons[index].setText(data['name'])
-                self.preset_buttons[index].setStyleSheet("""
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #67c23a, stop:1 #529b2e);
-                        border: 1px solid #529b2e;
-                        border-bottom: 2px solid #3e7523;
-                        border-radius: 6px;
-                        color: white;
-                        font-weight: bold;
-                        font-size: 7pt;
-                        padding-left: 2px;
-                        text-align: center;
-                    }
-                    QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #85ce61, stop:1 #67c23a);
-                    }
-                    QPushButton:pressed {
-                        background-color: #529b2e;
-                        border-top: 2px solid #3e7523;
-                        border-bottom: none;
-                    }
-                """)
+                _set_style_state(self.preset_buttons[index], 'named')
             else:
                 self.preset_buttons[index].setText(f'预设{index+1}')
-                self.preset_buttons[index].setStyleSheet("""
-                    QPushButton {
-                        background-color: #f8f9fa;
-                        border: 1px solid #dee2e6;
-                        border-radius: 4px;
-                        font-size: 7pt;
-                        text-align: left;
-                        padding-left: 10px;
-                    }
-                    QPushButton:hover {
-                        background-color: #e0e0e0;
-                    }
-                """)
+                _set_style_state(self.preset_buttons[index], 'unnamed')
             
             # 启动周期发送
             if data['periodic'] and data['period'] > 0:
                 if self.serial_port and self.serial_port.is_open:
                     # 使用round()确保精确到毫秒，避免截断误差
                     interval_ms = round(data['period'] * 1000)
-                    self.preset_timers[index].start(interval_ms)
+                    self.preset_scheduler.start(index, interval_ms)
     
     def send_preset_command(self, index):
         """发送预设命令"""
         if not self.serial_port or not self.serial_port.is_open:
             # 串口未打开，停止该预设命令的周期发送
-            if index < len(self.preset_timers) and self.preset_timers[index].isActive():
-                self.preset_timers[index].stop()
+            self.preset_scheduler.stop(index)
             return
         
         if index >= len(self.preset_commands) or not self.preset_commands[index]:
@@ -5220,7 +5926,9 @@ class SerialMonitorApp(QMainWindow):
             # 数据填充功能 - 在CRC校验之前替换数据
             if preset.get('data_fill_enabled', False):
                 # 获取填充框的值
-                fill_value = self.preset_data_spinboxes[index].value()
+                # 按钮未创建（超出显示数量）的预设命令没有填充框，按0填充
+                fill_value = (self.preset_data_spinboxes[index].value()
+                              if index < len(self.preset_data_spinboxes) else 0)
                 data_min = preset.get('data_min', 0)
                 data_max = preset.get('data_max', 65535)
                 
@@ -5250,15 +5958,13 @@ class SerialMonitorApp(QMainWindow):
             
         except Exception as e:
             # 发送失败，停止该预设命令的周期发送
-            if index < len(self.preset_timers) and self.preset_timers[index].isActive():
-                self.preset_timers[index].stop()
+            self.preset_scheduler.stop(index)
             print(f"发送预设命令失败: {str(e)}")
             # 不显示弹窗，避免周期发送时频繁弹窗
     
     def export_to_excel(self):
         """导出曲线数据到Excel"""
-        df = self.plot_canvas.get_data_frame()
-        if df is None or len(df) == 0:
+        if self.plot_canvas.point_count == 0:
             QMessageBox.warning(self, "警告", "没有数据可导出")
             return
         
@@ -5268,11 +5974,12 @@ class SerialMonitorApp(QMainWindow):
         if not file_path:
             return
         
-        try:
-            df.to_excel(file_path, index=False)
-            QMessageBox.information(self, "成功", f"数据已导出到:\n{file_path}")
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"导出失败: {str(e)}")
+        # 复制数据后在后台线程写文件，导出期间继续接收数据
+        self.log(f"正在导出Excel: {file_path}", "INFO")
+        _start_background_task(
+            _write_excel, file_path, self.plot_canvas.export_snapshot(),
+            on_finished=lambda _: QMessageBox.information(self, "成功", f"数据已导出到:\n{file_path}"),
+            on_failed=lambda message: QMessageBox.critical(self, "错误", f"导出失败: {message}"))
     
     def export_to_image(self):
         """导出曲线截图"""
@@ -5300,15 +6007,11 @@ class SerialMonitorApp(QMainWindow):
         if not file_path:
             return
         
-        try:
-            with open(file_path, 'w') as f:
-                for data in self.raw_data_buffer:
-                    hex_str = ' '.join([f'{b:02X}' for b in data])
-                    f.write(hex_str + '\n')
-            
-            QMessageBox.information(self, "成功", f"原始数据已导出到:\n{file_path}")
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"导出失败: {str(e)}")
+        # 复制数据块列表（bytes不可变，无需深拷贝）后在后台线程写文件
+        _start_background_task(
+            _write_raw_data, file_path, list(self.raw_data_buffer),
+            on_finished=lambda _: QMessageBox.information(self, "成功", f"原始数据已导出到:\n{file_path}"),
+            on_failed=lambda message: QMessageBox.critical(self, "错误", f"导出失败: {message}"))
     
     def clear_plot_data(self):
         """清空曲线数据"""
@@ -5343,8 +6046,9 @@ class SerialMonitorApp(QMainWindow):
             'display_ascii': self.radio_ascii.isChecked(),
             'display_timestamp': self.check_display_timestamp.isChecked(),
             'preset_commands': self.preset_commands,
-            'custom_displays': self.custom_displays,
-            'bit_displays': self.bit_displays,  # 保存位显示窗口配置
+            # 按窗口索引展开为50项列表保存（未配置为null），与旧版本配置文件格式一致
+            'custom_displays': [self.custom_displays.get(i) for i in range(50)],
+            'bit_displays': [self.bit_displays.get(i) for i in range(50)],  # 保存位显示窗口配置
             'display_count': self.spin_display_count.value(),
             'preset_count': self.spin_preset_count.value(),
             'clock_config': self.clock_config,  # 保存时钟配置
@@ -5359,8 +6063,7 @@ class SerialMonitorApp(QMainWindow):
         }
         
         try:
-            with open(self.CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
+            _write_file_atomic(self.CONFIG_FILE, _json_dumps(config))
             self.log("配置已保存", "SUCCESS")
             QMessageBox.information(self, "成功", "配置已保存到 serial_config.json")
         except Exception as e:
@@ -5378,8 +6081,8 @@ class SerialMonitorApp(QMainWindow):
             return
         
         try:
-            with open(self.CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            with open(self.CONFIG_FILE, 'rb') as f:
+                config = _json_loads(f.read())
             
             # 恢复配置
             index = self.combo_port.findText(config.get('port', ''))
@@ -5401,8 +6104,8 @@ class SerialMonitorApp(QMainWindow):
             
             # 恢复发送CRC配置
             send_crc = config.get('send_crc', '无')
-            index = self.combo_send_crc.findText(send_crc)
-            if index >= 0:
+            index = _CRC_PRESET_INDEX.get(send_crc)
+            if index is not None:
                 self.combo_send_crc.setCurrentIndex(index)
             
             self.radio_hex.setChecked(config.get('display_hex', True))
@@ -5425,49 +6128,28 @@ class SerialMonitorApp(QMainWindow):
                 if preset and i < len(self.preset_buttons):
                     if preset.get('name'):
                         self.preset_buttons[i].setText(preset['name'])
-                        self.preset_buttons[i].setStyleSheet("""
-                            QPushButton {
-                                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #67c23a, stop:1 #529b2e);
-                                border: 1px solid #529b2e;
-                                border-bottom: 2px solid #3e7523;
-                                border-radius: 6px;
-                                color: white;
-                                font-weight: bold;
-                                font-size: 7pt;
-                                padding-left: 2px;
-                                text-align: center;
-                            }
-                            QPushButton:hover {
-                                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #85ce61, stop:1 #67c23a);
-                            }
-                            QPushButton:pressed {
-                                background-color: #529b2e;
-                                border-top: 2px solid #3e7523;
-                                border-bottom: none;
-                            }
-                        """)
+                        _set_style_state(self.preset_buttons[i], 'named')
             
             # 加载自定义显示窗口配置
             loaded_displays = config.get('custom_displays', [])
-            # 确保列表长度为50
-            self.custom_displays = [None] * 50
-            for i, display_config in enumerate(loaded_displays):
-                if i < 15:
-                    self.custom_displays[i] = display_config
-            
-            for i, display_config in enumerate(self.custom_displays):
-                if display_config and i < len(self.custom_display_labels):
+            self.custom_displays = {i: display_config
+                                    for i, display_config in enumerate(loaded_displays[:15])
+                                    if display_config}
+            
+            for i, display_config in self.custom_displays.items():
+                if i < len(self.custom_display_labels):
                     if display_config.get('enabled', True):
                         name = display_config.get('name', f'显示窗口{i+1}')
                         self.custom_display_labels[i].setText(f"{name}: --")
             
             # 加载位显示窗口配置
             loaded_bit_displays = config.get('bit_displays', [])
-            for i, bit_display_config in enumerate(loaded_bit_displays):
-                if i < 2 and bit_display_config:
+            for i, bit_display_config in enumerate(loaded_bit_displays[:2]):
+                if bit_display_config:
                     self.bit_displays[i] = bit_display_config
                     # 更新配置显示
                     self.update_bit_display_config(i)
+            self._rebuild_bit_targets()
             
             # 恢复显示窗口数量设置
             if 'display_count' in config:
@@ -5582,8 +6264,8 @@ class SerialMonitorApp(QMainWindow):
             
             if filename:
                 # 读取布局文件
-                with open(filename, 'r', encoding='utf-8') as f:
-                    layout_data = json.load(f)
+                with open(filename, 'rb') as f:
+                    layout_data = _json_loads(f.read())
                 
                 # 验证布局文件格式
                 if not isinstance(layout_data, dict):
@@ -5595,9 +6277,10 @@ class SerialMonitorApp(QMainWindow):
                     import shutil
                     shutil.copy2(self.LAYOUT_FILE, backup_layout_file)
                 
-                # 写入新布局
-                with open(self.LAYOUT_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(layout_data, f, indent=4, ensure_ascii=False)
+                # 写入新布局（布局文件已被替换，清除写盘缓存）
+                _write_file_atomic(self.LAYOUT_FILE, _json_dumps(layout_data))
+                self._last_layout_json = None
+                self._last_layout_raw = None
                 
                 # 询问是否立即应用
                 reply = QMessageBox.question(
@@ -5637,8 +6320,8 @@ class SerialMonitorApp(QMainWindow):
             
             if filename:
                 # 读取配置文件
-                with open(filename, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                with open(filename, 'rb') as f:
+                    config = _json_loads(f.read())
                 
                 # 验证配置文件格式
                 if not isinstance(config, dict):
@@ -5653,8 +6336,7 @@ class SerialMonitorApp(QMainWindow):
                         f.write(backup_data)
                 
                 # 写入新配置
-                with open(self.CONFIG_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(config, f, indent=4, ensure_ascii=False)
+                _write_file_atomic(self.CONFIG_FILE, _json_dumps(config))
                 
                 # 导入配置，不恢复窗口布局
                 
@@ -5674,6 +6356,9 @@ class SerialMonitorApp(QMainWindow):
         """添加日志信息
         level: INFO, WARNING, ERROR, SUCCESS
         """
+        if self.text_log is None:
+            return  # 日志窗口尚未创建
+        
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
         
         # 根据级别设置颜色
@@ -5691,17 +6376,8 @@ class SerialMonitorApp(QMainWindow):
         log_html += f'<span style="color: {color}; font-weight: bold;">[{level}]</span> '
         log_html += f'<span style="color: #d4d4d4;">{message}</span>'
         
-        # 添加到日志窗口
-        self.text_log.append(log_html)
-        
-        # 限制日志行数
-        document = self.text_log.document()
-        if document.blockCount() > 1000:
-            cursor = QTextCursor(document)
-            cursor.movePosition(QTextCursor.Start)
-            for _ in range(50):
-                cursor.movePosition(QTextCursor.NextBlock, QTextCursor.KeepAnchor)
-            cursor.removeSelectedText()
+        # 添加到日志窗口（超过最大行数时控件自动删除最旧的行）
+        self.text_log.appendHtml(log_html)
         
         # 自动滚动到底部
         if self.check_auto_scroll.isChecked():
@@ -5738,19 +6414,22 @@ class SerialMonitorApp(QMainWindow):
         
         if self.background_image_path and os.path.exists(self.background_image_path):
             try:
+                source_id = (self.background_image_path, os.path.getmtime(self.background_image_path))
+                size = self.size()
+                cache_key = source_id + (size.width(), size.height(), self.background_opacity)
+                if cache_key == self._bg_cache_key:
+                    return  # 图片、窗口大小和透明度均未变化
+                
                 # 创建新的调色板（不使用旧的）
                 palette = QPalette()
                 
-                # 重新加载背景图片
-                pixmap = QPixmap(self.background_image_path)
-                
-                if pixmap.isNull():
-                    if hasattr(self, 'text_log'):
-                        self.log(f"背景图片加载失败: {self.background_image_path}", "ERROR")
+                # 图片文件变化时才重新加载：在后台线程解码，完成后再次调用本函数
+                if self._bg_source is None or self._bg_source[0] != source_id:
+                    self._load_background_image(source_id)
                     return
                 
                 # 缩放到窗口大小
-                pixmap = pixmap.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+                pixmap = self._bg_source[1].scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
                 
                 # 创建半透明效果 - 关键：先在白色背景上应用透明度
                 result_pixmap = QPixmap(pixmap.size())
@@ -5771,18 +6450,19 @@ class SerialMonitorApp(QMainWindow):
                 
                 # 强制重绘
                 self.update()
+                self._bg_cache_key = cache_key
                 
-                # 只在日志窗口存在时输出日志
-                if hasattr(self, 'text_log'):
-                    self.log(f"背景已更新: {os.path.basename(self.background_image_path)}, 透明度: {self.background_opacity:.1%}", "SUCCESS")
+                self.log(f"背景已更新: {os.path.basename(self.background_image_path)}, 透明度: {self.background_opacity:.1%}", "SUCCESS")
                     
             except Exception as e:
-                if hasattr(self, 'text_log'):
-                    self.log(f"背景更新失败: {str(e)}", "ERROR")
+                self.log(f"背景更新失败: {str(e)}", "ERROR")
                 import traceback
                 traceback.print_exc()
         else:
             # 无背景图片，使用默认浅色背景
+            self._bg_source = None
+            self._bg_cache_key = None
+            self._bg_loading = None
             palette = QPalette()
             from PyQt5.QtGui import QColor, QBrush
             from PyQt5.QtCore import Qt
@@ -5791,6 +6471,29 @@ class SerialMonitorApp(QMainWindow):
             self.setPalette(palette)
             self.setAutoFillBackground(True)
     
+    def _load_background_image(self, source_id):
+        """在后台线程解码背景图片（QImage可在非GUI线程使用），完成后转为QPixmap并更新背景"""
+        if self._bg_loading == source_id:
+            return  # 同一图片正在解码
+        self._bg_loading = source_id
+        
+        def loaded(image):
+            if self._bg_loading != source_id:
+                return  # 解码期间已更换或清除了背景图片
+            self._bg_loading = None
+            if image.isNull():
+                self.log(f"背景图片加载失败: {source_id[0]}", "ERROR")
+                return
+            self._bg_source = (source_id, QPixmap.fromImage(image))
+            self.update_background()
+        
+        def failed(message):
+            if self._bg_loading == source_id:
+                self._bg_loading = None
+            self.log(f"背景图片加载失败: {message}", "ERROR")
+        
+        _start_background_task(QImage, source_id[0], on_finished=loaded, on_failed=failed)
+    
     def choose_background_image(self):
         """选择背景图片"""
         from PyQt5.QtWidgets import QMessageBox, QPushButton
@@ -5847,7 +6550,7 @@ class SerialMonitorApp(QMainWindow):
     
     def show_about_dialog(self):
         """显示关于对话框"""
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QDialogButtonBox
+        from PyQt5.QtWidgets import QDialog, QLabel, QDialogButtonBox
         from PyQt5.QtCore import Qt
         from PyQt5.QtGui import QPixmap
         
@@ -5855,9 +6558,7 @@ class SerialMonitorApp(QMainWindow):
         dialog.setWindowTitle('关于')
         dialog.setMinimumWidth(500)
         
-        layout = QVBoxLayout(dialog)
-        layout.setSpacing(15)
-        layout.setContentsMargins(30, 30, 30, 30)
+        layout = _make_vbox(dialog, spacing=15, margins=(30, 30, 30, 30))
         
         # Logo图标
         if os.path.exists('lihua_logo.png'):
@@ -6071,10 +6772,10 @@ class SerialMonitorApp(QMainWindow):
             traceback.print_exc()
     
     def resizeEvent(self, event):
-        """窗口大小改变时重新应用背景"""
+        """窗口大小改变时重新应用背景（停止调整200ms后重建一次）"""
         super().resizeEvent(event)
         if self.background_image_path:
-            self.update_background()
+            self.bg_resize_timer.start(200)
         
         # 窗口调整大小后延迟保存布局
         if not self.is_restoring_layout and hasattr(self, 'layout_save_timer'):
@@ -6282,6 +6983,7 @@ if __name__ == '__main__':
 
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # 使用Fusion风格,界面更美观
+    app.setStyleSheet(_STYLESHEET)  # 应用级样式表只解析一次
     
     # 创建并显示启动画面
     splash = SplashScreenWidget()